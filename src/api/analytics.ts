@@ -64,6 +64,7 @@ import {
   type AnalyticsEngineFilters,
 } from '../services/analyticsEngineQuery';
 import { getAnalyticsAggregationEnabledOrDefault } from '../db/settings';
+import { aggregateAnalyticsForDate, aggregateYesterday } from '../services/analyticsAggregation';
 
 /**
  * Get cache key for analytics data
@@ -95,9 +96,11 @@ function getCacheTTL(dataSource: 'analytics_engine' | 'd1' | 'mixed' | undefined
  */
 async function getCachedAnalytics<T>(env: Env, key: string): Promise<T | null> {
   try {
-    const cached = await env.CACHE.get(key);
+    // Let KV deserialize natively instead of materializing the raw string
+    // and re-parsing it in JS (same pattern as services/cache.ts)
+    const cached = await env.CACHE.get(key, { type: 'json' });
     if (cached) {
-      return JSON.parse(cached) as T;
+      return cached as T;
     }
   } catch (error) {
     console.error('[CACHE ERROR] Failed to get cached analytics:', error);
@@ -116,6 +119,28 @@ async function setCachedAnalytics<T>(env: Env, key: string, data: T, ttl: number
   }
 }
 
+// Per-endpoint query schemas, built once at module load rather than on every
+// request (schema construction is not free and these never change)
+const dateRangeQuerySchema = z.object({
+  start_date: z.string().optional(),
+  end_date: z.string().optional(),
+  data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
+});
+
+const timeSeriesQuerySchema = z.object({
+  start_date: z.string().optional(),
+  end_date: z.string().optional(),
+  group_by: z.enum(['hour', 'day', 'week', 'month']).default('day'),
+  data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
+});
+
+const limitedRangeQuerySchema = z.object({
+  start_date: z.string().optional(),
+  end_date: z.string().optional(),
+  limit: z.string().optional().transform((val) => (val ? parseInt(val) : 20)),
+  data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
+});
+
 const analyticsRouter = new Hono<{ Bindings: Env }>();
 
 /**
@@ -301,104 +326,44 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
         warnings.push(credentialError);
       } else {
         try {
-          const recentTimeSeries = await getDailyAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end
-          );
-          timeSeries.push(...recentTimeSeries);
+          // All ten Engine queries are independent, so dispatch them together
+          // instead of paying ten sequential SQL API round-trips
+          const filters = { linkIds: [link.id] };
+          const { start: recentStart, end: recentEnd } = dataSourceDecision.splitRange.recent;
+          const [
+            recentTimeSeries,
+            recentGeo,
+            recentReferrers,
+            recentDeviceTypes,
+            recentBrowsers,
+            recentOs,
+            recentUtmSources,
+            recentUtmMediums,
+            recentUtmCampaigns,
+            recentSummary,
+          ] = await Promise.all([
+            getDailyAnalyticsFromEngine(c.env, filters, recentStart, recentEnd),
+            getGeoAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 20),
+            getReferrerAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 20),
+            getDeviceAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'device_type', 20),
+            getDeviceAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'browser', 20),
+            getDeviceAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'os', 20),
+            getUtmAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'source', 20),
+            getUtmAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'medium', 20),
+            getUtmAnalyticsFromEngine(c.env, filters, recentStart, recentEnd, 'campaign', 20),
+            getAggregatedSummaryFromEngine(c.env, filters, recentStart, recentEnd),
+          ]);
 
-          const recentGeo = await getGeoAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            20
-          );
+          timeSeries.push(...recentTimeSeries);
           geography.push(...recentGeo);
-
-          const recentReferrers = await getReferrerAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            20
-          );
           referrers.push(...recentReferrers);
-
-          // Fetch Device Breakdowns
-          const recentDeviceTypes = await getDeviceAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'device_type',
-            20
-          );
           // DEBUG: console.log('[LINK ANALYTICS] recentDeviceTypes:', JSON.stringify(recentDeviceTypes));
           deviceTypes.push(...recentDeviceTypes);
-
-          const recentBrowsers = await getDeviceAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'browser',
-            20
-          );
-          // DEBUG: console.log('[LINK ANALYTICS] recentBrowsers:', JSON.stringify(recentBrowsers));
           browsers.push(...recentBrowsers);
-
-          const recentOs = await getDeviceAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'os',
-            20
-          );
-          // DEBUG: console.log('[LINK ANALYTICS] recentOs:', JSON.stringify(recentOs));
           os.push(...recentOs);
-
-
-          // Fetch UTM Breakdowns
-          const recentUtmSources = await getUtmAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'source',
-            20
-          );
           utmSources.push(...recentUtmSources);
-
-          const recentUtmMediums = await getUtmAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'medium',
-            20
-          );
           utmMediums.push(...recentUtmMediums);
-
-          const recentUtmCampaigns = await getUtmAnalyticsFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end,
-            'campaign',
-            20
-          );
           utmCampaigns.push(...recentUtmCampaigns);
-
-          const recentSummary = await getAggregatedSummaryFromEngine(
-            c.env,
-            { linkIds: [link.id] },
-            dataSourceDecision.splitRange.recent.start,
-            dataSourceDecision.splitRange.recent.end
-          );
           summaryClicks += recentSummary.total_clicks;
           summaryUniqueVisitors = Math.max(summaryUniqueVisitors, recentSummary.total_unique_visitors);
         } catch (error) {
@@ -421,12 +386,32 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
     // Query old data from D1
     if (dataSourceDecision.useD1 && dataSourceDecision.splitRange.old) {
       try {
-        const oldDaily = await getDailyAnalytics(
-          c.env,
-          link.id,
-          dataSourceDecision.splitRange.old.start,
-          dataSourceDecision.splitRange.old.end
-        );
+        // The nine D1 reads are independent; run them concurrently and merge
+        // afterwards instead of paying nine sequential round-trips
+        const oldStart = dataSourceDecision.splitRange.old.start;
+        const oldEnd = dataSourceDecision.splitRange.old.end;
+        const [
+          oldDaily,
+          oldGeo,
+          oldReferrers,
+          oldDeviceTypes,
+          oldBrowsers,
+          oldOs,
+          oldUtmSources,
+          oldUtmMediums,
+          oldUtmCampaigns,
+        ] = await Promise.all([
+          getDailyAnalytics(c.env, link.id, oldStart, oldEnd),
+          getGeoAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, limit: 20 }),
+          getReferrerAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, limit: 20 }),
+          getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'device_type', limit: 20 }),
+          getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'browser', limit: 20 }),
+          getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'os', limit: 20 }),
+          getUtmAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'source', limit: 20 }),
+          getUtmAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'medium', limit: 20 }),
+          getUtmAnalytics(c.env, { linkIds: [link.id], startDate: oldStart, endDate: oldEnd, groupBy: 'campaign', limit: 20 }),
+        ]);
+
         const oldTimeSeries: TimeSeriesDataPoint[] = oldDaily.map(day => ({
           date: day.date,
           clicks: day.clicks,
@@ -434,15 +419,6 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
         }));
         timeSeries = mergeTimeSeries(timeSeries, oldTimeSeries);
 
-        const oldGeo = await getGeoAnalytics(
-          c.env,
-          {
-            linkIds: [link.id],
-            startDate: dataSourceDecision.splitRange.old.start,
-            endDate: dataSourceDecision.splitRange.old.end,
-            limit: 20
-          }
-        );
         const oldGeoPoints: GeographyDataPoint[] = oldGeo.map(geo => ({
           country: geo.country || 'unknown',
           city: geo.city || null,
@@ -451,15 +427,6 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
         }));
         geography = mergeGeographyData(geography, oldGeoPoints);
 
-        const oldReferrers = await getReferrerAnalytics(
-          c.env,
-          {
-            linkIds: [link.id],
-            startDate: dataSourceDecision.splitRange.old.start,
-            endDate: dataSourceDecision.splitRange.old.end,
-            limit: 20
-          }
-        );
         const oldReferrerPoints: ReferrerDataPoint[] = oldReferrers.map(ref => ({
           referrer_domain: ref.referrer_domain || 'direct',
           clicks: ref.clicks,
@@ -469,30 +436,23 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
         referrers = mergeReferrerData(referrers, oldReferrerPoints);
 
         // Merge Device Data
-        const oldDeviceTypes = await getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'device_type', limit: 20 });
         deviceTypes = mergeDeviceData(deviceTypes, oldDeviceTypes);
-
-        const oldBrowsers = await getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'browser', limit: 20 });
         browsers = mergeDeviceData(browsers, oldBrowsers);
-
-        const oldOs = await getDeviceAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'os', limit: 20 });
         os = mergeDeviceData(os, oldOs);
 
         // Merge UTM Data
-        const oldUtmSources = await getUtmAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'source', limit: 20 });
         utmSources = mergeUtmData(utmSources, oldUtmSources);
-
-        const oldUtmMediums = await getUtmAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'medium', limit: 20 });
         utmMediums = mergeUtmData(utmMediums, oldUtmMediums);
-
-        const oldUtmCampaigns = await getUtmAnalytics(c.env, { linkIds: [link.id], startDate: dataSourceDecision.splitRange.old.start, endDate: dataSourceDecision.splitRange.old.end, groupBy: 'campaign', limit: 20 });
         utmCampaigns = mergeUtmData(utmCampaigns, oldUtmCampaigns);
 
-        summaryClicks += oldDaily.reduce((sum, day) => sum + day.clicks, 0);
-        summaryUniqueVisitors = Math.max(
-          summaryUniqueVisitors,
-          ...oldDaily.map(day => day.unique_visitors)
-        );
+        // Single pass for sum and max instead of reduce + map + spread
+        // (spreading large arrays into Math.max can hit the argument limit)
+        for (const day of oldDaily) {
+          summaryClicks += day.clicks;
+          if (day.unique_visitors > summaryUniqueVisitors) {
+            summaryUniqueVisitors = day.unique_visitors;
+          }
+        }
       } catch (error) {
         console.error('[ANALYTICS] Error querying D1:', error);
       }
@@ -506,11 +466,14 @@ analyticsRouter.get('/links/:id', authMiddleware, requirePermission('view_analyt
         clicks: day.clicks,
         unique_visitors: day.unique_visitors,
       }));
-      summaryClicks = dailyAnalytics.reduce((sum, day) => sum + day.clicks, 0);
-      summaryUniqueVisitors = Math.max(
-        summaryUniqueVisitors,
-        ...dailyAnalytics.map(day => day.unique_visitors)
-      );
+      // Single pass for sum and max (see note above)
+      summaryClicks = 0;
+      for (const day of dailyAnalytics) {
+        summaryClicks += day.clicks;
+        if (day.unique_visitors > summaryUniqueVisitors) {
+          summaryUniqueVisitors = day.unique_visitors;
+        }
+      }
 
       // Fallback fetches for breakdowns - ONLY if we don't already have data from Analytics Engine
       if (deviceTypes.length === 0) {
@@ -1119,9 +1082,12 @@ analyticsRouter.get('/dashboard', authMiddleware, requirePermission('view_analyt
       ? await Promise.all(topLinkIds.map((id: string) => getLinkById(c.env, id)))
       : [];
 
+    // topLinksDetails was fetched via Promise.all over topLinkIds, so it is
+    // positionally aligned with topLinksData - index directly instead of
+    // scanning the array for every entry
     const topLinks = topLinksData
-      .map(({ link_id, clicks }: { link_id: string; clicks: number }) => {
-        const link = topLinksDetails.find((l: any) => l?.id === link_id);
+      .map(({ link_id, clicks }: { link_id: string; clicks: number }, index: number) => {
+        const link = topLinksDetails[index];
         return link ? { link_id, slug: link.slug, title: link.title, clicks } : null;
       })
       .filter((l: any): l is NonNullable<typeof l> => l !== null);
@@ -1279,12 +1245,7 @@ analyticsRouter.get('/links/:id/time-series', authMiddleware, requirePermission(
     throw new HTTPException(403, { message: 'Access denied' });
   }
 
-  const queryParams = z.object({
-    start_date: z.string().optional(),
-    end_date: z.string().optional(),
-    group_by: z.enum(['hour', 'day', 'week', 'month']).default('day'),
-    data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
-  }).parse({
+  const queryParams = timeSeriesQuerySchema.parse({
     start_date: c.req.query('start_date'),
     end_date: c.req.query('end_date'),
     group_by: c.req.query('group_by') || 'day',
@@ -1403,12 +1364,7 @@ analyticsRouter.get('/links/:id/geography', authMiddleware, requirePermission('v
     throw new HTTPException(403, { message: 'Access denied' });
   }
 
-  const queryParams = z.object({
-    start_date: z.string().optional(),
-    end_date: z.string().optional(),
-    limit: z.string().optional().transform((val) => (val ? parseInt(val) : 20)),
-    data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
-  }).parse({
+  const queryParams = limitedRangeQuerySchema.parse({
     start_date: c.req.query('start_date'),
     end_date: c.req.query('end_date'),
     limit: c.req.query('limit'),
@@ -1530,12 +1486,7 @@ analyticsRouter.get('/links/:id/referrers', authMiddleware, requirePermission('v
     throw new HTTPException(403, { message: 'Access denied' });
   }
 
-  const queryParams = z.object({
-    start_date: z.string().optional(),
-    end_date: z.string().optional(),
-    limit: z.string().optional().transform((val) => (val ? parseInt(val) : 20)),
-    data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
-  }).parse({
+  const queryParams = limitedRangeQuerySchema.parse({
     start_date: c.req.query('start_date'),
     end_date: c.req.query('end_date'),
     limit: c.req.query('limit'),
@@ -1661,11 +1612,7 @@ analyticsRouter.get('/export', authMiddleware, requirePermission('view_analytics
     throw new HTTPException(403, { message: 'Access denied' });
   }
 
-  const queryParams = z.object({
-    start_date: z.string().optional(),
-    end_date: z.string().optional(),
-    data_source: z.enum(['auto', 'analytics_engine', 'd1']).optional().default('auto'),
-  }).parse({
+  const queryParams = dateRangeQuerySchema.parse({
     start_date: c.req.query('start_date'),
     end_date: c.req.query('end_date'),
     data_source: c.req.query('data_source') || 'auto',
@@ -1825,7 +1772,6 @@ analyticsRouter.post('/aggregate', authMiddleware, requirePermission('manage_dom
 
   if (date) {
     // Aggregate specific date
-    const { aggregateAnalyticsForDate } = await import('../services/analyticsAggregation');
     const result = await aggregateAnalyticsForDate(c.env, date);
     return c.json({
       success: true,
@@ -1836,7 +1782,6 @@ analyticsRouter.post('/aggregate', authMiddleware, requirePermission('manage_dom
     });
   } else {
     // Aggregate yesterday
-    const { aggregateYesterday } = await import('../services/analyticsAggregation');
     const result = await aggregateYesterday(c.env);
     return c.json({
       success: true,
@@ -2,11 +2,12 @@
 
 import { Hono } from 'hono';
 import { HTTPException } from 'hono/http-exception';
+import { getCookie } from 'hono/cookie';
 import { z } from 'zod';
 import type { Env, Variables } from '../types';
 import { getUserByUsername, getUserByEmail, getUserById, createUser, updateLastLogin } from '../db/users';
 import { hashPassword, verifyPassword } from '../utils/crypto';
-import { createSession, deleteSession, getRefreshToken, deleteRefreshToken, countUserRefreshTokens } from '../services/session';
+import { createSession, createSessionWithExpiry, deleteSession, getRefreshToken, deleteRefreshToken, countUserRefreshTokens } from '../services/session';
 import { createRateLimit } from '../middleware/rateLimit';
 import { validateJson } from '../middleware/validate';
 import { optionalAuth, authMiddleware } from '../middleware/auth';
@@ -56,12 +57,12 @@ authRouter.post('/login', createRateLimit({
   const isValid = await verifyPassword(validated.password, passwordHash);
   if (!isValid) {
     // Log failed login attempt
-    await logAuditEvent(c.env, {
+    c.executionCtx.waitUntil(logAuditEvent(c.env, {
       event_type: 'login_failure',
       ip_address: getIpAddress(c.req.raw),
       user_agent: getUserAgent(c.req.raw),
       details: { username: validated.username },
-    });
+    }));
     throw new HTTPException(401, { message: 'Invalid username or password' });
   }
 
@@ -92,12 +93,12 @@ authRouter.post('/login', createRateLimit({
   await updateLastLogin(c.env, user.id);
 
   // Log successful login
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'login_success',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   // Set cookie - use Secure only in production (HTTPS)
   const isProduction = c.env.ENVIRONMENT === 'production';
@@ -210,13 +211,13 @@ authRouter.post('/register', createRateLimit({
   });
 
   // Log user creation
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'user_created',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
     details: { role: user.role },
-  });
+  }));
 
   // Set cookie - use Secure only in production (HTTPS)
   const isProduction = c.env.ENVIRONMENT === 'production';
@@ -265,7 +266,7 @@ authRouter.post('/logout', optionalAuth, async (c) => {
   c.header('Set-Cookie', `session_token=; HttpOnly; ${secureFlag} SameSite=Strict; Path=/; Max-Age=0`);
 
   // Also delete refresh token if present
-  const refreshToken = c.req.header('Cookie')?.split(';').find(c => c.trim().startsWith('refresh_token='))?.split('=')[1];
+  const refreshToken = getCookie(c, 'refresh_token');
   if (refreshToken) {
     await deleteRefreshToken(c.env, refreshToken);
     c.header('Set-Cookie', `refresh_token=; HttpOnly; ${secureFlag} SameSite=Strict; Path=/; Max-Age=0`);
@@ -274,12 +275,12 @@ authRouter.post('/logout', optionalAuth, async (c) => {
   // Log logout
   const user = (c as any).get?.('user') as { id: string } | undefined;
   if (user) {
-    await logAuditEvent(c.env, {
+    c.executionCtx.waitUntil(logAuditEvent(c.env, {
       user_id: user.id,
       event_type: 'logout',
       ip_address: getIpAddress(c.req.raw),
       user_agent: getUserAgent(c.req.raw),
-    });
+    }));
   }
 
   return c.json({ success: true, message: 'Logged out successfully' });
@@ -300,14 +301,7 @@ authRouter.post('/refresh', createRateLimit({
   // Get refresh token from body or cookie
   let refreshToken = validated.refresh_token;
   if (!refreshToken) {
-    const cookieHeader = c.req.header('Cookie');
-    if (cookieHeader) {
-      const cookies = cookieHeader.split(';').map(c => c.trim());
-      const refreshCookie = cookies.find(c => c.startsWith('refresh_token='));
-      if (refreshCookie) {
-        refreshToken = refreshCookie.substring('refresh_token='.length);
-      }
-    }
+    refreshToken = getCookie(c, 'refresh_token');
   }
 
   if (!refreshToken) {
@@ -339,12 +333,12 @@ authRouter.post('/refresh', createRateLimit({
   });
 
   // Log token refresh
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'token_refreshed',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   // Set cookie
   const isProduction = c.env.ENVIRONMENT === 'production';
@@ -437,13 +431,13 @@ authRouter.post('/audit/cleanup', authMiddleware, async (c) => {
   const deletedCount = await cleanupOldAuditLogs(c.env, daysToKeep);
 
   // Log the cleanup action
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'user_deleted', // Reusing event type for cleanup
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
     details: { action: 'audit_cleanup', deleted_count: deletedCount, days_kept: daysToKeep },
-  });
+  }));
 
   return c.json({
     success: true,
@@ -480,12 +474,12 @@ authRouter.post('/mfa/setup', authMiddleware, async (c) => {
   } as any);
 
   // Log MFA setup initiation
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'mfa_setup',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   return c.json({
     success: true,
@@ -527,12 +521,12 @@ authRouter.post('/mfa/verify-setup', authMiddleware, validateJson(mfaVerifySetup
   } as any);
 
   // Log MFA enabled
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'mfa_enabled',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   return c.json({
     success: true,
@@ -556,12 +550,12 @@ authRouter.post('/mfa/disable', authMiddleware, async (c) => {
   } as any);
 
   // Log MFA disabled
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'mfa_disabled',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   return c.json({
     success: true,
@@ -616,22 +610,22 @@ authRouter.post('/mfa/verify', validateJson(mfaVerifySchema), async (c) => {
 
   if (!isValid) {
     // Log MFA verification failure
-    await logAuditEvent(c.env, {
+    c.executionCtx.waitUntil(logAuditEvent(c.env, {
       user_id: user.id,
       event_type: 'mfa_verify_failure',
       ip_address: getIpAddress(c.req.raw),
       user_agent: getUserAgent(c.req.raw),
-    });
+    }));
     throw new HTTPException(401, { message: 'Invalid MFA code' });
   }
 
   // Log MFA verification success
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'mfa_verify_success',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   // Delete temporary token
   await deleteMFATempToken(c.env, validated.mfa_token);
@@ -710,12 +704,12 @@ authRouter.post('/change-password', authMiddleware, validateJson(changePasswordS
   } as any);
 
   // Log password change
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'password_change',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
-  });
+  }));
 
   return c.json({
     success: true,
@@ -761,13 +755,13 @@ authRouter.post('/mfa/regenerate-backup-codes', authMiddleware, async (c) => {
   } as any);
 
   // Log backup code regeneration
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: user.id,
     event_type: 'mfa_setup', // Reusing this event type
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
     details: { action: 'backup_codes_regenerated' },
-  });
+  }));
 
   return c.json({
     success: true,
@@ -798,18 +792,20 @@ authRouter.post('/token', authMiddleware, async (c) => {
       });
     }
     
-    // Log for debugging
-    console.log('Creating token with custom expiry:', { 
-      userId: user.id, 
-      expiresIn,
-      username: user.username,
-      email: user.email,
-      role: user.role
-    });
+    // Debug-only: building and serializing this object on every token
+    // creation is wasted work (and leaks account details into logs) unless
+    // someone is actively debugging
+    if (c.env.LOG_LEVEL === 'debug') {
+      console.log('Creating token with custom expiry:', {
+        userId: user.id,
+        expiresIn,
+        username: user.username,
+        email: user.email,
+        role: user.role
+      });
+    }
     
     // Create token with custom expiration
-    const { createSessionWithExpiry } = await import('../services/session');
-    
     const { accessToken, refreshToken } = await createSessionWithExpiry(c.env, {
       id: user.id,
       username: user.username,
@@ -819,7 +815,9 @@ authRouter.post('/token', authMiddleware, async (c) => {
     
     const expiresAt = Math.floor(Date.now() / 1000) + expiresIn;
     
-    console.log('Token created successfully:', { expiresAt, expiresIn });
+    if (c.env.LOG_LEVEL === 'debug') {
+      console.log('Token created successfully:', { expiresAt, expiresIn });
+    }
     
     return c.json({
       success: true,
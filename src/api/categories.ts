@@ -99,7 +99,8 @@ categoriesRouter.post('/', authMiddleware, requirePermission('manage_categories'
 
   // Check if category already exists for this domain
   const existingCategories = await listCategories(c.env, { domainId: validated.domain_id });
-  if (existingCategories.some(c => c.name.toLowerCase() === validated.name.toLowerCase())) {
+  const newNameLower = validated.name.toLowerCase();
+  if (existingCategories.some(c => c.name.toLowerCase() === newNameLower)) {
     throw new HTTPException(409, { message: 'Category already exists' });
   }
 
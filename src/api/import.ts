@@ -9,7 +9,7 @@ import { getDomainById } from '../db/domains';
 import { generateSlug } from '../utils/id';
 import { isValidUrl, isValidSlug, normalizeUrl, isReservedSlug } from '../utils/validation';
 import { checkSlugExists } from '../db/links';
-import { upsertGeoRedirect, upsertDeviceRedirect, getGeoRedirects, getDeviceRedirects } from '../db/linkRedirects';
+import { upsertGeoRedirect, upsertDeviceRedirect, getLinkRedirects } from '../db/linkRedirects';
 import { setLinkTags } from '../db/tags';
 import { setCachedLink } from '../services/cache';
 
@@ -18,6 +18,12 @@ const importRouter = new Hono<{ Bindings: Env }>();
 // Max file size: 5MB
 const MAX_FILE_SIZE = 5 * 1024 * 1024;
 
+// Common country codes recognized as geo-redirect columns; built once as a
+// Set so per-row header checks are a hash probe instead of an array scan
+const COUNTRY_CODES = new Set([
+    'US', 'GB', 'CA', 'AU', 'DE', 'FR', 'IT', 'ES', 'JP', 'CN', 'IN', 'BR', 'MX', 'RU', 'KR', 'ID', 'TR', 'SA', 'ZA'
+]);
+
 // Schema for import request
 // We expect a FormData with 'file', 'domain_id', 'column_mapping', 'slug_prefix_filter', 'delimiter'
 // But since we are processing chunks, we might receive just a chunk of the file.
@@ -180,18 +186,17 @@ importRouter.post('/', authOrApiKeyMiddleware, requirePermission('create_links')
                 }
 
                 // Handle Geo Redirects
-                // We look for 2-letter country codes or mapped columns
-                // Common country codes
-                const countryCodes = [
-                    'US', 'GB', 'CA', 'AU', 'DE', 'FR', 'IT', 'ES', 'JP', 'CN', 'IN', 'BR', 'MX', 'RU', 'KR', 'ID', 'TR', 'SA', 'ZA'
-                ];
+                // We look for 2-letter country codes (COUNTRY_CODES above) or mapped columns
 
                 // Also check for mapped geo fields
                 // In columnMapping, geo fields might be mapped like "Header": "geo:US" (if we supported that, but the guide says auto-detect)
                 // The guide says: "United States" -> US, etc.
                 // We'll implement a basic detection for now based on the guide's "Supported patterns"
 
-                // Iterate over all keys in the row
+                // Iterate over all keys in the row, collecting redirect upserts
+                // so they run in one parallel batch instead of one awaited
+                // round-trip per column
+                const redirectUpserts: Promise<void>[] = [];
                 for (const [key, value] of Object.entries(row)) {
                     if (!value || key === 'destination_url' || key === 'slug' || key === 'title' || key === 'description' || key === 'tags') continue;
 
@@ -213,36 +218,40 @@ importRouter.post('/', authOrApiKeyMiddleware, requirePermission('create_links')
                         }
                     } else {
                         // Auto-detection
+                        // Lowercase/uppercase the key once instead of per comparison
+                        const keyUpper = key.toUpperCase();
+                        const keyLower = key.toLowerCase();
+
                         // Check for country codes
-                        if (countryCodes.includes(key.toUpperCase())) {
-                            countryCode = key.toUpperCase();
+                        if (COUNTRY_CODES.has(keyUpper)) {
+                            countryCode = keyUpper;
                         }
                         // Check for "United States", etc. (simplified)
-                        else if (key.toLowerCase().includes('united states') || key.toLowerCase() === 'us') countryCode = 'US';
-                        else if (key.toLowerCase().includes('united kingdom') || key.toLowerCase() === 'uk') countryCode = 'GB';
-                        // ... add more as needed or rely on the frontend to map them? 
-                        // The frontend guide says "The system automatically detects...". 
+                        else if (keyLower.includes('united states') || keyLower === 'us') countryCode = 'US';
+                        else if (keyLower.includes('united kingdom') || keyLower === 'uk') countryCode = 'GB';
+                        // ... add more as needed or rely on the frontend to map them?
+                        // The frontend guide says "The system automatically detects...".
                         // If the frontend does the detection, it should probably pass the mapping.
                         // But the current frontend implementation sends `columnMapping`.
 
                         // Check for devices
-                        else if (key.toLowerCase().includes('mobile')) deviceType = 'mobile';
-                        else if (key.toLowerCase().includes('desktop')) deviceType = 'desktop';
-                        else if (key.toLowerCase().includes('tablet')) deviceType = 'tablet';
+                        else if (keyLower.includes('mobile')) deviceType = 'mobile';
+                        else if (keyLower.includes('desktop')) deviceType = 'desktop';
+                        else if (keyLower.includes('tablet')) deviceType = 'tablet';
                     }
 
                     if (countryCode && isValidUrl(value as string)) {
-                        await upsertGeoRedirect(c.env, link.id, countryCode, value as string);
+                        redirectUpserts.push(upsertGeoRedirect(c.env, link.id, countryCode, value as string));
                     } else if (deviceType && isValidUrl(value as string)) {
-                        await upsertDeviceRedirect(c.env, link.id, deviceType as 'mobile' | 'desktop' | 'tablet', value as string);
+                        redirectUpserts.push(upsertDeviceRedirect(c.env, link.id, deviceType as 'mobile' | 'desktop' | 'tablet', value as string));
                     }
                 }
+                if (redirectUpserts.length > 0) {
+                    await Promise.all(redirectUpserts);
+                }
 
                 // Fetch redirects and cache the link for optimal redirect performance
-                const [geoRedirects, deviceRedirects] = await Promise.all([
-                    getGeoRedirects(c.env, link.id),
-                    getDeviceRedirects(c.env, link.id)
-                ]);
+                const { geo: geoRedirects, device: deviceRedirects } = await getLinkRedirects(c.env, link.id);
 
                 const cachedLink = {
                     destination_url: link.destination_url,
@@ -307,23 +316,30 @@ function parseCSV(text: string, delimiter: string): Record<string, string>[] {
         const line = lines[i].trim();
         if (!line) continue;
 
-        // Handle quotes
-        const values = [];
-        let inQuote = false;
-        let currentValue = '';
-
-        for (let j = 0; j < line.length; j++) {
-            const char = line[j];
-            if (char === '"') {
-                inQuote = !inQuote;
-            } else if (char === delimiter && !inQuote) {
-                values.push(currentValue);
-                currentValue = '';
-            } else {
-                currentValue += char;
+        // Handle quotes. The character-by-character scan only exists to honor
+        // quoted delimiters, so lines without any quote character (the common
+        // case) can skip it and split directly
+        let values: string[];
+        if (!line.includes('"')) {
+            values = line.split(delimiter);
+        } else {
+            values = [];
+            let inQuote = false;
+            let currentValue = '';
+
+            for (let j = 0; j < line.length; j++) {
+                const char = line[j];
+                if (char === '"') {
+                    inQuote = !inQuote;
+                } else if (char === delimiter && !inQuote) {
+                    values.push(currentValue);
+                    currentValue = '';
+                } else {
+                    currentValue += char;
+                }
             }
+            values.push(currentValue);
         }
-        values.push(currentValue);
 
         const row: Record<string, string> = {};
         for (let j = 0; j < headers.length; j++) {
@@ -18,12 +18,11 @@ import { getLinkTags, setLinkTags, getLinksTagsBatch } from '../db/tags';
 import { getCategoryById, getLinksCategoriesBatch } from '../db/categories';
 import { getDomainById } from '../db/domains';
 import {
-  getGeoRedirects,
-  getDeviceRedirects,
-  upsertGeoRedirect,
-  upsertDeviceRedirect,
-  clearAllGeoRedirects,
-  clearAllDeviceRedirects,
+  getLinkRedirects,
+  upsertGeoRedirects,
+  upsertDeviceRedirects,
+  replaceGeoRedirects,
+  replaceDeviceRedirects,
   getLinksGeoRedirectsBatch,
   getLinksDeviceRedirectsBatch,
 } from '../db/linkRedirects';
@@ -169,24 +168,26 @@ linksRouter.get('/', authOrApiKeyMiddleware, async (c) => {
       totalCount = result.totalCount;
     } else {
       // Optimized path: use database pagination with domain filtering
-      links = await listLinks(c.env, {
-        domainIds: accessibleDomainIds, // Database-level filtering
-        domainId: domainId || undefined, // Single domain if specified
-        status: status || undefined,
-        search: search || undefined,
-        categoryId: categoryId || undefined,
-        limit,
-        offset,
-      });
-
-      // Get total count for pagination
-      totalCount = await countLinks(c.env, {
-        domainIds: accessibleDomainIds,
-        domainId: domainId || undefined,
-        status: status || undefined,
-        search: search || undefined,
-        categoryId: categoryId || undefined,
-      });
+      // The page query and the total count are independent reads over the
+      // same filters, so run them in parallel instead of back to back
+      [links, totalCount] = await Promise.all([
+        listLinks(c.env, {
+          domainIds: accessibleDomainIds, // Database-level filtering
+          domainId: domainId || undefined, // Single domain if specified
+          status: status || undefined,
+          search: search || undefined,
+          categoryId: categoryId || undefined,
+          limit,
+          offset,
+        }),
+        countLinks(c.env, {
+          domainIds: accessibleDomainIds,
+          domainId: domainId || undefined,
+          status: status || undefined,
+          search: search || undefined,
+          categoryId: categoryId || undefined,
+        }),
+      ]);
     }
 
     // Batch fetch tags and categories (optimized - no N+1 queries)
@@ -386,11 +387,8 @@ linksRouter.get('/:id', authOrApiKeyMiddleware, async (c) => {
     }
   }
 
-  // Get geo and device redirects in parallel
-  const [geoRedirects, deviceRedirects] = await Promise.all([
-    getGeoRedirects(c.env, id),
-    getDeviceRedirects(c.env, id)
-  ]);
+  // Get geo and device redirects in one batched round-trip
+  const { geo: geoRedirects, device: deviceRedirects } = await getLinkRedirects(c.env, id);
 
   return c.json({
     success: true,
@@ -535,23 +533,15 @@ linksRouter.post('/', authOrApiKeyMiddleware, requirePermission('create_links'),
     await setLinkTags(c.env, link.id, validated.tags);
   }
 
-  // Save geo redirects
-  if (validated.geo_redirects && validated.geo_redirects.length > 0) {
-    for (const geo of validated.geo_redirects) {
-      await upsertGeoRedirect(c.env, link.id, geo.country_code, geo.destination_url);
-    }
-  }
-
-  // Save device redirects
-  if (validated.device_redirects && validated.device_redirects.length > 0) {
-    for (const device of validated.device_redirects) {
-      await upsertDeviceRedirect(c.env, link.id, device.device_type, device.destination_url);
-    }
-  }
+  // Save geo and device redirects as one batched statement group per table
+  // (a single D1 round-trip each) instead of one statement per entry
+  await Promise.all([
+    upsertGeoRedirects(c.env, link.id, validated.geo_redirects || []),
+    upsertDeviceRedirects(c.env, link.id, validated.device_redirects || []),
+  ]);
 
-  // Build cache with redirects
-  const geoRedirects = await getGeoRedirects(c.env, link.id);
-  const deviceRedirects = await getDeviceRedirects(c.env, link.id);
+  // Build cache with redirects (single batched round-trip for both tables)
+  const { geo: geoRedirects, device: deviceRedirects } = await getLinkRedirects(c.env, link.id);
 
   const cachedLink = {
     destination_url: link.destination_url,
@@ -684,41 +674,36 @@ linksRouter.put('/:id', authOrApiKeyMiddleware, requireLinkAccess('edit'), valid
     await setLinkTags(c.env, id, validated.tags);
   }
 
-  // Update geo redirects if provided
+  // Update geo redirects if provided (clear + inserts in one batched round-trip)
   if (validated.geo_redirects !== undefined) {
-    // Clear existing and add new
-    await clearAllGeoRedirects(c.env, id);
-    for (const geo of validated.geo_redirects) {
-      await upsertGeoRedirect(c.env, id, geo.country_code, geo.destination_url);
-    }
+    await replaceGeoRedirects(c.env, id, validated.geo_redirects);
   }
 
   // Update device redirects if provided
   if (validated.device_redirects !== undefined) {
-    await clearAllDeviceRedirects(c.env, id);
-    for (const device of validated.device_redirects) {
-      await upsertDeviceRedirect(c.env, id, device.device_type, device.destination_url);
-    }
+    await replaceDeviceRedirects(c.env, id, validated.device_redirects);
   }
 
-  // Get updated link with tags and category
-  const updatedLink = await getLinkById(c.env, id);
+  // Snapshot everything the response and cache rebuild need in one parallel
+  // pass instead of five sequential round-trips
+  const [updatedLink, tags, redirects, domain] = await Promise.all([
+    getLinkById(c.env, id),
+    getLinkTags(c.env, id),
+    getLinkRedirects(c.env, id),
+    getDomainById(c.env, existingLink.domain_id),
+  ]);
+  const { geo: geoRedirects, device: deviceRedirects } = redirects;
+
   if (!updatedLink) {
     throw new HTTPException(404, { message: 'Link not found' });
   }
 
-  const tags = await getLinkTags(c.env, id);
   let category = undefined;
   if (updatedLink.category_id) {
     category = await getCategoryById(c.env, updatedLink.category_id);
   }
 
-  // Get redirects
-  const geoRedirects = await getGeoRedirects(c.env, id);
-  const deviceRedirects = await getDeviceRedirects(c.env, id);
-
   // Rebuild cache with updated data (same structure as create)
-  const domain = await getDomainById(c.env, existingLink.domain_id);
   if (domain) {
     const cachedLink = {
       destination_url: updatedLink.destination_url,
@@ -805,18 +790,31 @@ linksRouter.post('/bulk', authOrApiKeyMiddleware, requirePermission('edit_links'
   // Check API key domain scoping
   const apiKey = (c as any).get?.('apiKey') as ApiKeyContext | undefined;
 
+  // Resolve the scoping check once before the loops: the key's domain list is
+  // invariant across the batch, so probe a Set per link instead of re-walking
+  // the apiKey.domain_ids chain and scanning the array for every id
+  const scopedDomainIds = apiKey && apiKey.domain_ids && apiKey.domain_ids.length > 0
+    ? new Set(apiKey.domain_ids)
+    : null;
+
+  // Resolve every target link with one IN query up front instead of a
+  // separate SELECT per id inside the loops (same filter as getLinkById)
+  const placeholders = link_ids.map(() => '?').join(',');
+  const linksResult = await c.env.DB.prepare(
+    `SELECT * FROM links WHERE id IN (${placeholders}) AND status != 'deleted'`
+  ).bind(...link_ids).all<Link>();
+  const linksById = new Map((linksResult.results || []).map((l) => [l.id, l]));
+
   const results = [];
 
   if (action === 'delete') {
     for (const id of link_ids) {
-      const link = await getLinkById(c.env, id);
+      const link = linksById.get(id);
       if (link) {
         // Check API key domain scoping
-        if (apiKey && apiKey.domain_ids && apiKey.domain_ids.length > 0) {
-          if (!apiKey.domain_ids.includes(link.domain_id)) {
-            results.push({ id, success: false, error: 'Domain not on scope' });
-            continue;
-          }
+        if (scopedDomainIds && !scopedDomainIds.has(link.domain_id)) {
+          results.push({ id, success: false, error: 'Domain not on scope' });
+          continue;
         }
 
         await deleteLink(c.env, id, false);
@@ -835,14 +833,12 @@ linksRouter.post('/bulk', authOrApiKeyMiddleware, requirePermission('edit_links'
     const { tags, category_id, route, metadata: metadataObj, geo_redirects, device_redirects, ...linkUpdates } = validated;
 
     for (const id of link_ids) {
-      const link = await getLinkById(c.env, id);
+      const link = linksById.get(id);
       if (link) {
         // Check API key domain scoping
-        if (apiKey && apiKey.domain_ids && apiKey.domain_ids.length > 0) {
-          if (!apiKey.domain_ids.includes(link.domain_id)) {
-            results.push({ id, success: false, error: 'Domain not on scope' });
-            continue;
-          }
+        if (scopedDomainIds && !scopedDomainIds.has(link.domain_id)) {
+          results.push({ id, success: false, error: 'Domain not on scope' });
+          continue;
         }
 
         // Prepare metadata updates
@@ -877,20 +873,14 @@ linksRouter.post('/bulk', authOrApiKeyMiddleware, requirePermission('edit_links'
           await setLinkTags(c.env, id, tags);
         }
 
-        // Handle geo redirects if provided
+        // Handle geo redirects if provided (clear + inserts in one batch)
         if (geo_redirects !== undefined) {
-          await clearAllGeoRedirects(c.env, id);
-          for (const geo of geo_redirects) {
-            await upsertGeoRedirect(c.env, id, geo.country_code, geo.destination_url);
-          }
+          await replaceGeoRedirects(c.env, id, geo_redirects);
         }
 
         // Handle device redirects if provided
         if (device_redirects !== undefined) {
-          await clearAllDeviceRedirects(c.env, id);
-          for (const device of device_redirects) {
-            await upsertDeviceRedirect(c.env, id, device.device_type, device.destination_url);
-          }
+          await replaceDeviceRedirects(c.env, id, device_redirects);
         }
 
         // Rebuild cache with updated data (same structure as create)
@@ -899,8 +889,7 @@ linksRouter.post('/bulk', authOrApiKeyMiddleware, requirePermission('edit_links'
           // Get updated link data
           const updatedLink = await getLinkById(c.env, id);
           if (updatedLink) {
-            const geoRedirects = await getGeoRedirects(c.env, id);
-            const deviceRedirects = await getDeviceRedirects(c.env, id);
+            const { geo: geoRedirects, device: deviceRedirects } = await getLinkRedirects(c.env, id);
 
             const cachedLink = {
               destination_url: updatedLink.destination_url,
@@ -1070,6 +1059,23 @@ linksRouter.post('/import', authOrApiKeyMiddleware, requirePermission('create_li
     const requiredFields = ['destination_url'];
     const results: Array<{ success: boolean; slug?: string; error?: string; row?: number }> = [];
 
+    // Resolve each mapped column to its header index once, not per row:
+    // exact match first, then case-insensitive against pre-normalized headers
+    const normalizedHeaders = headers.map(h => h.trim().toLowerCase());
+    const columnEntries = Object.entries(columnMapping).map(([csvColumn, linkField]) => {
+      let columnIndex = headers.indexOf(csvColumn);
+      if (columnIndex === -1) {
+        columnIndex = normalizedHeaders.indexOf(csvColumn.trim().toLowerCase());
+      }
+      return [csvColumn, linkField, columnIndex] as const;
+    });
+    const geoColumnEntries = Object.entries(geoColumns).map(([columnName, countryCode]) =>
+      [headers.indexOf(columnName), countryCode] as const
+    );
+    const deviceColumnEntries = Object.entries(deviceColumns).map(([columnName, deviceType]) =>
+      [headers.indexOf(columnName), deviceType] as const
+    );
+
     for (let i = 0; i < rows.length; i++) {
       const row = rows[i];
       const rowData: Record<string, string> = {};
@@ -1077,13 +1083,7 @@ linksRouter.post('/import', authOrApiKeyMiddleware, requirePermission('create_li
       const deviceRedirectsData: Record<string, string> = {}; // { deviceType: url }
 
       // Map CSV columns to data
-      for (const [csvColumn, linkField] of Object.entries(columnMapping)) {
-        // Try exact match first, then case-insensitive match
-        let columnIndex = headers.indexOf(csvColumn);
-        if (columnIndex === -1) {
-          // Try case-insensitive match
-          columnIndex = headers.findIndex(h => h.trim().toLowerCase() === csvColumn.trim().toLowerCase());
-        }
+      for (const [csvColumn, linkField, columnIndex] of columnEntries) {
         if (columnIndex !== -1 && columnIndex < row.length) {
           let value = row[columnIndex].trim();
 
@@ -1106,8 +1106,7 @@ linksRouter.post('/import', authOrApiKeyMiddleware, requirePermission('create_li
       }
 
       // Extract geo redirect URLs from detected columns
-      for (const [columnName, countryCode] of Object.entries(geoColumns)) {
-        const columnIndex = headers.indexOf(columnName);
+      for (const [columnIndex, countryCode] of geoColumnEntries) {
         if (columnIndex !== -1 && columnIndex < row.length) {
           const url = row[columnIndex].trim();
           if (url && isValidUrl(url)) {
@@ -1117,8 +1116,7 @@ linksRouter.post('/import', authOrApiKeyMiddleware, requirePermission('create_li
       }
 
       // Extract device redirect URLs from detected columns
-      for (const [columnName, deviceType] of Object.entries(deviceColumns)) {
-        const columnIndex = headers.indexOf(columnName);
+      for (const [columnIndex, deviceType] of deviceColumnEntries) {
         if (columnIndex !== -1 && columnIndex < row.length) {
           const url = row[columnIndex].trim();
           if (url && isValidUrl(url)) {
@@ -1238,25 +1236,16 @@ linksRouter.post('/import', authOrApiKeyMiddleware, requirePermission('create_li
           await setLinkTags(c.env, link.id, tags);
         }
 
-        // Set geo redirects if any
-        if (geoRedirects.length > 0) {
-          for (const geo of geoRedirects) {
-            await upsertGeoRedirect(c.env, link.id, geo.country_code, geo.destination_url);
-          }
-        }
-
-        // Set device redirects if any
-        if (deviceRedirects.length > 0) {
-          for (const device of deviceRedirects) {
-            await upsertDeviceRedirect(c.env, link.id, device.device_type, device.destination_url);
-          }
-        }
+        // Set geo and device redirects if any (one batched round-trip per table)
+        await Promise.all([
+          upsertGeoRedirects(c.env, link.id, geoRedirects),
+          upsertDeviceRedirects(c.env, link.id, deviceRedirects),
+        ]);
 
         // Build and cache link with redirects
         const domain = await getDomainById(c.env, domainId);
         if (domain) {
-          const cachedGeoRedirects = await getGeoRedirects(c.env, link.id);
-          const cachedDeviceRedirects = await getDeviceRedirects(c.env, link.id);
+          const { geo: cachedGeoRedirects, device: cachedDeviceRedirects } = await getLinkRedirects(c.env, link.id);
 
           const cachedLink = {
             destination_url: link.destination_url,
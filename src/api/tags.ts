@@ -99,7 +99,8 @@ tagsRouter.post('/', authMiddleware, requirePermission('manage_tags'), validateJ
 
   // Check if tag already exists for this domain
   const existingTags = await listTags(c.env, { domainId: validated.domain_id });
-  if (existingTags.some(t => t.name.toLowerCase() === validated.name.toLowerCase())) {
+  const newNameLower = validated.name.toLowerCase();
+  if (existingTags.some(t => t.name.toLowerCase() === newNameLower)) {
     throw new HTTPException(409, { message: 'Tag already exists' });
   }
 
@@ -8,7 +8,8 @@ import {
   getUserByUsername,
   getUserByEmail,
   createUser,
-  updateUser
+  updateUser,
+  invalidateUserMemo
 } from '../db/users';
 import { hashPassword } from '../utils/crypto';
 import { authMiddleware } from '../middleware/auth';
@@ -155,7 +156,7 @@ usersRouter.post('/', authMiddleware, requireRole(['admin', 'owner']), validateJ
 
   // Log user creation
   const currentUser = c.get('user') as { id: string };
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: currentUser.id,
     event_type: 'user_created',
     ip_address: getIpAddress(c.req.raw),
@@ -165,7 +166,7 @@ usersRouter.post('/', authMiddleware, requireRole(['admin', 'owner']), validateJ
       created_user_role: user.role,
       global_access: globalAccess === 1,
     },
-  });
+  }));
 
   // Get domain access for response
   const userDomains = globalAccess === 1
@@ -269,13 +270,13 @@ usersRouter.put('/:id', authMiddleware, requireRole(['admin', 'owner']), validat
 
   // Log user update
   const currentUser = c.get('user') as { id: string };
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: currentUser.id,
     event_type: 'user_updated',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
     details: { updated_user_id: id },
-  });
+  }));
 
   // Get domain access for response
   const userDomains = updatedUser.global_access === 1
@@ -334,7 +335,7 @@ usersRouter.put('/:id/domains', authMiddleware, requireRole(['admin', 'owner']),
 
     // Log domain access change
     const currentUser = c.get('user') as { id: string };
-    await logAuditEvent(c.env, {
+    c.executionCtx.waitUntil(logAuditEvent(c.env, {
       user_id: currentUser.id,
       event_type: 'user_updated',
       ip_address: getIpAddress(c.req.raw),
@@ -344,7 +345,7 @@ usersRouter.put('/:id/domains', authMiddleware, requireRole(['admin', 'owner']),
         global_access: validated.global_access,
         domain_ids: validated.domain_ids,
       },
-    });
+    }));
 
     // Get updated domain access
     const userDomains = validated.global_access
@@ -427,15 +428,16 @@ usersRouter.delete('/:id', authMiddleware, requireRole(['admin', 'owner']), asyn
 
   // Delete user from database (cascade will handle user_domains)
   await c.env.DB.prepare('DELETE FROM users WHERE id = ?').bind(targetUserId).run();
+  invalidateUserMemo(targetUserId);
 
   // Log user deletion
-  await logAuditEvent(c.env, {
+  c.executionCtx.waitUntil(logAuditEvent(c.env, {
     user_id: currentUser.id,
     event_type: 'user_deleted',
     ip_address: getIpAddress(c.req.raw),
     user_agent: getUserAgent(c.req.raw),
     details: { deleted_user_id: targetUserId, deleted_user_email: targetUser.email },
-  });
+  }));
 
   return c.json({
     success: true,
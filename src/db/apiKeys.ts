@@ -274,8 +274,10 @@ export async function getApiKeyDomains(env: Env, apiKeyId: string): Promise<Doma
  * Get all API key domain relationships (for batch processing)
  */
 export async function getAllApiKeyDomains(env: Env): Promise<{ api_key_id: string; domain_id: string }[]> {
+  // Project only the two columns callers consume instead of marshalling
+  // every column of every row across the D1 boundary
   const results = await env.DB.prepare(
-    `SELECT * FROM api_key_domains`
+    `SELECT api_key_id, domain_id FROM api_key_domains`
   ).all<{ api_key_id: string; domain_id: string }>();
 
   return results.results || [];
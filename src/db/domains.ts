@@ -83,6 +83,22 @@ export async function getDomainByName(env: Env, domainName: string): Promise<Dom
   return enrichDomain(result);
 }
 
+/**
+ * Resolve a domain by id or, failing that, by name in a single query.
+ * Used on UNIQUE-constraint recovery paths, where the old id-then-name
+ * fallback cost two sequential round-trips.
+ */
+async function getDomainByIdOrName(env: Env, domainId: string, domainName: string): Promise<Domain | null> {
+  const normalizedDomain = domainName.replace(/\/+$/, '').toLowerCase().trim();
+  const result = await env.DB.prepare(
+    `SELECT * FROM domains WHERE id = ? OR normalized_domain_name = ?
+     ORDER BY CASE WHEN id = ? THEN 0 ELSE 1 END LIMIT 1`
+  ).bind(domainId, normalizedDomain, domainId).first<Domain>();
+
+  if (!result) return null;
+  return enrichDomain(result);
+}
+
 export async function createDomain(
   env: Env,
   domain: Omit<Domain, 'id' | 'created_at' | 'updated_at'>
@@ -125,7 +141,7 @@ export async function createDomain(
     // Check if it's a UNIQUE constraint error - if so, domain already exists
     if (error instanceof Error && error.message.includes('UNIQUE constraint failed')) {
       // INSERT might have succeeded before constraint check, try to fetch existing domain
-      const existing = await getDomainById(env, id) || await getDomainByName(env, domain.domain_name);
+      const existing = await getDomainByIdOrName(env, id, domain.domain_name);
       if (existing) {
         await invalidateDomainCache(env);
         return existing;
@@ -171,17 +187,12 @@ export async function createDomain(
     // If UNIQUE constraint error, domain might already exist from RETURNING path
     // Try to fetch it instead of failing
     if (error instanceof Error && error.message.includes('UNIQUE constraint failed')) {
-      const existing = await getDomainById(env, id);
+      // Single id-or-name lookup instead of two sequential fallback queries
+      const existing = await getDomainByIdOrName(env, id, domain.domain_name);
       if (existing) {
         await invalidateDomainCache(env);
         return existing;
       }
-      // If not found by ID, try by name
-      const existingByName = await getDomainByName(env, domain.domain_name);
-      if (existingByName) {
-        await invalidateDomainCache(env);
-        return existingByName;
-      }
       // If still not found, re-throw the error
       throw error;
     }
@@ -293,6 +304,21 @@ export async function listDomains(env: Env, accountId?: string): Promise<Domain[
   return domains.map(domain => enrichDomain(domain));
 }
 
+// Route patterns are a small admin-configured set that repeats on every
+// redirect request; normalize each distinct pattern once per isolate instead
+// of re-running the wildcard/trailing-slash regexes per request
+const routePrefixMemo = new Map<string, string>();
+
+export function routePrefix(route: string): string {
+  let prefix = routePrefixMemo.get(route);
+  if (prefix === undefined) {
+    const routingPath = route.replace(/\*/g, '').replace(/\/$/, '');
+    prefix = routingPath.startsWith('/') ? routingPath : `/${routingPath}`;
+    routePrefixMemo.set(route, prefix);
+  }
+  return prefix;
+}
+
 export async function getDomainByRoutingPath(env: Env, domainName: string, path: string): Promise<{ domain: Domain, matchedRoute: string } | null> {
   // Try cache first
   let domains = await getCachedDomain(env, domainName);
@@ -304,7 +330,9 @@ export async function getDomainByRoutingPath(env: Env, domainName: string, path:
       `SELECT * FROM domains WHERE domain_name = ? AND status = 'active' ORDER BY created_at ASC`
     ).bind(domainName).all<Domain>();
 
-    domains = allDomains.results || [];
+    // Enrich before caching so the parsed routes are part of the persisted
+    // form and cache hits skip the per-request settings JSON.parse
+    domains = (allDomains.results || []).map(domain => enrichDomain(domain));
 
     // Cache the result to prevent race conditions and cascading cache misses
     // Awaited to ensure cache is populated before next request (consistent with other cache writes)
@@ -324,15 +352,15 @@ export async function getDomainByRoutingPath(env: Env, domainName: string, path:
   const normalizedPath = path.startsWith('/') ? path : `/${path}`;
 
   for (const domain of domains) {
-    // Enrich domain to get routes array
-    const enrichedDomain = enrichDomain(domain);
+    // Cached entries are already enriched; only parse settings for legacy
+    // cache entries or fresh DB rows that lack the routes array
+    const enrichedDomain = domain.routes ? domain : enrichDomain(domain);
     const routesToCheck = enrichedDomain.routes || [domain.routing_path];
 
     // Check each route
     for (const route of routesToCheck) {
-      // Remove wildcard and trailing slash for matching
-      const routingPath = route.replace(/\*/g, '').replace(/\/$/, '');
-      const normalizedRoutingPath = routingPath.startsWith('/') ? routingPath : `/${routingPath}`;
+      // Wildcard/trailing-slash stripping is memoized per distinct pattern
+      const normalizedRoutingPath = routePrefix(route);
 
       // Check if path matches routing path
       if (normalizedPath.startsWith(normalizedRoutingPath) || normalizedPath === normalizedRoutingPath) {
@@ -21,6 +21,25 @@ export interface LinkDeviceRedirect {
   updated_at: number;
 }
 
+/**
+ * Fetch a link's geo and device redirects together in one batched D1
+ * round-trip instead of two separate queries
+ */
+export async function getLinkRedirects(
+  env: Env,
+  linkId: string
+): Promise<{ geo: LinkGeoRedirect[]; device: LinkDeviceRedirect[] }> {
+  const [geoResult, deviceResult] = await env.DB.batch([
+    env.DB.prepare('SELECT * FROM link_geo_redirects WHERE link_id = ? ORDER BY country_code').bind(linkId),
+    env.DB.prepare('SELECT * FROM link_device_redirects WHERE link_id = ? ORDER BY device_type').bind(linkId),
+  ]);
+
+  return {
+    geo: (geoResult.results || []) as LinkGeoRedirect[],
+    device: (deviceResult.results || []) as LinkDeviceRedirect[],
+  };
+}
+
 // ===== GEO REDIRECTS =====
 
 export async function getGeoRedirects(env: Env, linkId: string): Promise<LinkGeoRedirect[]> {
@@ -52,6 +71,53 @@ export async function upsertGeoRedirect(
     .run();
 }
 
+// Write several geo redirects in one DB.batch round-trip instead of one
+// statement per entry
+export async function upsertGeoRedirects(
+  env: Env,
+  linkId: string,
+  redirects: Array<{ country_code: string; destination_url: string }>
+): Promise<void> {
+  if (redirects.length === 0) return;
+
+  const now = Date.now();
+  const stmt = env.DB.prepare(
+    `INSERT INTO link_geo_redirects (id, link_id, country_code, destination_url, created_at, updated_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, country_code)
+     DO UPDATE SET destination_url = ?, updated_at = ?`
+  );
+
+  await env.DB.batch(
+    redirects.map((r) =>
+      stmt.bind(generateId('geo'), linkId, r.country_code.toUpperCase(), r.destination_url, now, now, r.destination_url, now)
+    )
+  );
+}
+
+// Atomically replace a link's geo redirects: the delete and all inserts run
+// in a single batched transaction (one round-trip)
+export async function replaceGeoRedirects(
+  env: Env,
+  linkId: string,
+  redirects: Array<{ country_code: string; destination_url: string }>
+): Promise<void> {
+  const now = Date.now();
+  const insertStmt = env.DB.prepare(
+    `INSERT INTO link_geo_redirects (id, link_id, country_code, destination_url, created_at, updated_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, country_code)
+     DO UPDATE SET destination_url = ?, updated_at = ?`
+  );
+
+  await env.DB.batch([
+    env.DB.prepare('DELETE FROM link_geo_redirects WHERE link_id = ?').bind(linkId),
+    ...redirects.map((r) =>
+      insertStmt.bind(generateId('geo'), linkId, r.country_code.toUpperCase(), r.destination_url, now, now, r.destination_url, now)
+    ),
+  ]);
+}
+
 export async function deleteGeoRedirect(
   env: Env,
   linkId: string,
@@ -97,6 +163,53 @@ export async function upsertDeviceRedirect(
     .run();
 }
 
+// Write several device redirects in one DB.batch round-trip instead of one
+// statement per entry
+export async function upsertDeviceRedirects(
+  env: Env,
+  linkId: string,
+  redirects: Array<{ device_type: 'desktop' | 'mobile' | 'tablet'; destination_url: string }>
+): Promise<void> {
+  if (redirects.length === 0) return;
+
+  const now = Date.now();
+  const stmt = env.DB.prepare(
+    `INSERT INTO link_device_redirects (id, link_id, device_type, destination_url, created_at, updated_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, device_type)
+     DO UPDATE SET destination_url = ?, updated_at = ?`
+  );
+
+  await env.DB.batch(
+    redirects.map((r) =>
+      stmt.bind(generateId('device'), linkId, r.device_type, r.destination_url, now, now, r.destination_url, now)
+    )
+  );
+}
+
+// Atomically replace a link's device redirects: the delete and all inserts
+// run in a single batched transaction (one round-trip)
+export async function replaceDeviceRedirects(
+  env: Env,
+  linkId: string,
+  redirects: Array<{ device_type: 'desktop' | 'mobile' | 'tablet'; destination_url: string }>
+): Promise<void> {
+  const now = Date.now();
+  const insertStmt = env.DB.prepare(
+    `INSERT INTO link_device_redirects (id, link_id, device_type, destination_url, created_at, updated_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, device_type)
+     DO UPDATE SET destination_url = ?, updated_at = ?`
+  );
+
+  await env.DB.batch([
+    env.DB.prepare('DELETE FROM link_device_redirects WHERE link_id = ?').bind(linkId),
+    ...redirects.map((r) =>
+      insertStmt.bind(generateId('device'), linkId, r.device_type, r.destination_url, now, now, r.destination_url, now)
+    ),
+  ]);
+}
+
 export async function deleteDeviceRedirect(
   env: Env,
   linkId: string,
@@ -3,16 +3,24 @@
 import type { Link, Env } from '../types';
 import { generateId } from '../utils/id';
 
+// Only the redirect hot path resolves links by slug, and it only reads the
+// fields that go into the KV cache object - skip the rest of the row
+type RedirectLink = Pick<
+  Link,
+  'id' | 'destination_url' | 'redirect_code' | 'status' | 'expires_at' | 'password_hash' | 'metadata'
+>;
+
 export async function getLinkBySlug(
   env: Env,
   domainId: string,
   slug: string
-): Promise<Link | null> {
+): Promise<RedirectLink | null> {
   const result = await env.DB.prepare(
-    `SELECT * FROM links WHERE domain_id = ? AND slug = ? AND status != 'deleted'`
+    `SELECT id, destination_url, redirect_code, status, expires_at, password_hash, metadata
+     FROM links WHERE domain_id = ? AND slug = ? AND status != 'deleted'`
   )
     .bind(domainId, slug)
-    .first<Link>();
+    .first<RedirectLink>();
 
   return result || null;
 }
@@ -472,18 +480,22 @@ export async function listLinksWithTagFilter(
 // Status Check Operations
 
 // Get links that need status checking (prioritized by next_check_at)
+// The status checker only probes destination URLs, so these queries skip the
+// rest of the row instead of shipping full links it never reads
+export type StatusCheckLink = Pick<Link, 'id' | 'destination_url'>;
+
 export async function getLinksForStatusCheck(
   env: Env,
   batchSize: number = 100
-): Promise<Link[]> {
+): Promise<StatusCheckLink[]> {
   const now = Date.now();
 
   const result = await env.DB.prepare(
-    `SELECT * FROM links 
-     WHERE status = 'active' 
+    `SELECT id, destination_url FROM links
+     WHERE status = 'active'
        AND (next_status_check_at IS NULL OR next_status_check_at <= ?)
-     ORDER BY 
-       CASE 
+     ORDER BY
+       CASE
          WHEN next_status_check_at IS NULL THEN 0  -- Never checked (highest priority)
          ELSE 1
        END,
@@ -491,7 +503,7 @@ export async function getLinksForStatusCheck(
      LIMIT ?`
   )
     .bind(now, batchSize)
-    .all<Link>();
+    .all<StatusCheckLink>();
 
   return result.results || [];
 }
@@ -500,15 +512,15 @@ export async function getLinksForStatusCheck(
 export async function getTopLinksForDailyCheck(
   env: Env,
   limit: number = 100
-): Promise<Link[]> {
+): Promise<StatusCheckLink[]> {
   const result = await env.DB.prepare(
-    `SELECT * FROM links 
+    `SELECT id, destination_url FROM links
      WHERE status = 'active'
      ORDER BY click_count DESC, unique_visitors DESC
      LIMIT ?`
   )
     .bind(limit)
-    .all<Link>();
+    .all<StatusCheckLink>();
 
   return result.results || [];
 }
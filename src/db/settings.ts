@@ -77,20 +77,33 @@ export async function setStatusCheckFrequency(
   )
     .bind('status_check_frequency', value, now, userId, value, now, userId)
     .run();
+
+  // Drop the in-isolate memo so subsequent reads see the new value immediately
+  statusCheckMemo = null;
 }
 
+// In-isolate memo for status check settings: the scheduled job and the status
+// pages re-read this on every call even though it only changes when an admin
+// saves the form (same pattern as the analytics memos below)
+const STATUS_CHECK_MEMO_TTL_MS = 60 * 1000;
+let statusCheckMemo: { value: StatusCheckSettings; fetchedAt: number } | null = null;
+
 // Get default frequency (if not set, default to 2 weeks)
 export async function getStatusCheckFrequencyOrDefault(env: Env): Promise<StatusCheckSettings> {
-  const setting = await getStatusCheckFrequency(env);
-  if (setting) return setting;
+  if (statusCheckMemo && Date.now() - statusCheckMemo.fetchedAt < STATUS_CHECK_MEMO_TTL_MS) {
+    return statusCheckMemo.value;
+  }
 
-  return {
-    frequency: { value: 14, unit: 'days' },
+  const setting = await getStatusCheckFrequency(env);
+  const value = setting ?? {
+    frequency: { value: 14, unit: 'days' as const },
     enabled: true,
     check_top_100_daily: false,
     batch_size: 100,
     last_updated_at: Date.now(),
   };
+  statusCheckMemo = { value, fetchedAt: Date.now() };
+  return value;
 }
 
 // Analytics Aggregation Settings
@@ -129,6 +142,12 @@ export async function getAnalyticsAggregationEnabled(env: Env): Promise<Analytic
   }
 }
 
+// In-isolate memo for the aggregation flag: it gates every analytics query
+// but is effectively a boolean that changes rarely, so keep the answer local
+// instead of asking D1 each time (same pattern as the thresholds memo below)
+const AGGREGATION_MEMO_TTL_MS = 60 * 1000;
+let aggregationEnabledMemo: { value: AnalyticsAggregationSettings; fetchedAt: number } | null = null;
+
 // Get analytics aggregation enabled setting with default
 export async function getAnalyticsAggregationEnabledOrDefault(env: Env): Promise<AnalyticsAggregationSettings> {
   // Check environment variable first
@@ -139,15 +158,19 @@ export async function getAnalyticsAggregationEnabledOrDefault(env: Env): Promise
     };
   }
 
+  if (aggregationEnabledMemo && Date.now() - aggregationEnabledMemo.fetchedAt < AGGREGATION_MEMO_TTL_MS) {
+    return aggregationEnabledMemo.value;
+  }
+
   // Check database setting
   const setting = await getAnalyticsAggregationEnabled(env);
-  if (setting) return setting;
-
-  // Default: disabled
-  return {
+  const value = setting ?? {
+    // Default: disabled
     enabled: false,
     last_updated_at: Date.now(),
   };
+  aggregationEnabledMemo = { value, fetchedAt: Date.now() };
+  return value;
 }
 
 // Set analytics aggregation enabled setting
@@ -167,6 +190,9 @@ export async function setAnalyticsAggregationEnabled(
   )
     .bind('analytics_aggregation_enabled', value, now, userId, value, now, userId)
     .run();
+
+  // Drop the in-isolate memo so subsequent reads see the new value immediately
+  aggregationEnabledMemo = null;
 }
 
 // Get analytics thresholds
@@ -202,8 +228,23 @@ export async function getAnalyticsThresholds(env: Env): Promise<AnalyticsThresho
   }
 }
 
+// In-isolate memo for analytics thresholds. The value is read on every
+// analytics query and once per date in batch aggregation loops, but changes
+// rarely; a short TTL keeps repeated reads out of D1 while bounding staleness.
+const THRESHOLDS_MEMO_TTL_MS = 60 * 1000;
+let thresholdsMemo: { value: AnalyticsThresholds; fetchedAt: number } | null = null;
+
 // Get analytics thresholds with defaults
 export async function getAnalyticsThresholdsOrDefault(env: Env): Promise<AnalyticsThresholds> {
+  if (thresholdsMemo && Date.now() - thresholdsMemo.fetchedAt < THRESHOLDS_MEMO_TTL_MS) {
+    return thresholdsMemo.value;
+  }
+  const value = await fetchAnalyticsThresholdsOrDefault(env);
+  thresholdsMemo = { value, fetchedAt: Date.now() };
+  return value;
+}
+
+async function fetchAnalyticsThresholdsOrDefault(env: Env): Promise<AnalyticsThresholds> {
   // Check environment variables first (support both old and new format)
   // Default: 83 days (7-day buffer before Analytics Engine 90-day retention expires)
   const thresholdFromEnv = env.ANALYTICS_AGGREGATION_THRESHOLD_DAYS
@@ -247,5 +288,8 @@ export async function setAnalyticsThresholds(
   )
     .bind('analytics_thresholds', value, now, userId)
     .run();
+
+  // Drop the in-isolate memo so subsequent reads see the new value immediately
+  thresholdsMemo = null;
 }
 
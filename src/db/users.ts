@@ -4,8 +4,44 @@ import type { User, Env } from '../types';
 import { generateId } from '../utils/id';
 import { clearUserDomains } from './userDomains';
 
+// Latched per isolate: "users exist" can only flip from false to true (the
+// last user cannot be deleted), so once the setup guards have seen a user
+// they never need to count again
+let anyUsersExist = false;
+
+export async function hasAnyUsers(env: Env): Promise<boolean> {
+  if (anyUsersExist) return true;
+
+  const result = await env.DB.prepare(`SELECT COUNT(*) as count FROM users`).first<{ count: number }>();
+  if ((result?.count || 0) > 0) {
+    anyUsersExist = true;
+  }
+  return anyUsersExist;
+}
+
+// Every authenticated API request re-fetches the requesting user to confirm
+// it still exists, but user rows change rarely. Memoize them briefly per
+// isolate; the TTL keeps cross-isolate role or permission edits from
+// lingering longer than the session layer's domain-access cache already
+// tolerates, and local writes clear the entry immediately.
+const USER_MEMO_TTL_MS = 60 * 1000;
+const userMemo = new Map<string, { user: User; fetchedAt: number }>();
+
+export function invalidateUserMemo(userId: string): void {
+  userMemo.delete(userId);
+}
+
 export async function getUserById(env: Env, userId: string): Promise<User | null> {
+  const memo = userMemo.get(userId);
+  if (memo && Date.now() - memo.fetchedAt < USER_MEMO_TTL_MS) {
+    return memo.user;
+  }
   const result = await env.DB.prepare(`SELECT * FROM users WHERE id = ?`).bind(userId).first<User>();
+  if (result) {
+    userMemo.set(userId, { user: result, fetchedAt: Date.now() });
+  } else {
+    userMemo.delete(userId);
+  }
   return result || null;
 }
 
@@ -127,6 +163,7 @@ export async function updateUser(
 
   await env.DB.prepare(`UPDATE users SET ${fields.join(', ')} WHERE id = ?`).bind(...values).run();
 
+  invalidateUserMemo(userId);
   return getUserById(env, userId);
 }
 
@@ -134,5 +171,6 @@ export async function updateLastLogin(env: Env, userId: string): Promise<void> {
   await env.DB.prepare(`UPDATE users SET last_login_at = ? WHERE id = ?`)
     .bind(Date.now(), userId)
     .run();
+  invalidateUserMemo(userId);
 }
 
@@ -9,7 +9,8 @@ import { csrfProtection } from './middleware/csrf';
 import { securityHeaders } from './middleware/security';
 import { cacheControl } from './middleware/cache-control';
 import { handleRedirect } from './services/redirect';
-import { getDomainByRoutingPath } from './db/domains';
+import { getDomainByRoutingPath, routePrefix } from './db/domains';
+import { hasAnyUsers } from './db/users';
 
 // Import API routes (static - they're small and needed for functionality)
 import { linksRouter } from './api/links';
@@ -97,10 +98,7 @@ app.get('/dashboard/login', async (c) => {
 // Dashboard - Setup page (moved from /setup to /dashboard/setup)
 app.get('/dashboard/setup', async (c) => {
   // Check if users already exist
-  const existingUsers = await c.env.DB.prepare('SELECT COUNT(*) as count FROM users').first<{ count: number }>();
-  const userCount = existingUsers?.count || 0;
-
-  if (userCount > 0) {
+  if (await hasAnyUsers(c.env)) {
     // Users exist, redirect to login
     return c.redirect('/dashboard/login');
   }
@@ -165,10 +163,7 @@ app.route('/dashboard/api/v1/settings', settingsRouter);
 
 // Auto-create first user - also available under /dashboard/api
 app.post('/dashboard/api/v1/auth/setup-auto', async (c) => {
-  const existingUsers = await c.env.DB.prepare('SELECT COUNT(*) as count FROM users').first<{ count: number }>();
-  const userCount = existingUsers?.count || 0;
-
-  if (userCount > 0) {
+  if (await hasAnyUsers(c.env)) {
     return c.json({ success: false, message: 'Users already exist. Auto-setup is only for first user.' }, 400);
   }
 
@@ -219,10 +214,7 @@ app.get('/dashboard/*', async (c) => {
 
 // External API - for third-party integrations (requires /api/* Cloudflare route)
 app.post('/api/v1/auth/setup-auto', async (c) => {
-  const existingUsers = await c.env.DB.prepare('SELECT COUNT(*) as count FROM users').first<{ count: number }>();
-  const userCount = existingUsers?.count || 0;
-
-  if (userCount > 0) {
+  if (await hasAnyUsers(c.env)) {
     return c.json({ success: false, message: 'Users already exist. Auto-setup is only for first user.' }, 400);
   }
 
@@ -301,9 +293,15 @@ app.get('*', async (c) => {
 
   const { domain: domainObj, matchedRoute } = result;
 
-  // Extract slug from path using the matched route
-  const routingPath = matchedRoute.replace(/\*/g, '').replace(/\/$/, '');
-  const slug = path.replace(routingPath, '').replace(/^\//, '').replace(/\/$/, '');
+  // Extract slug from path using the matched route. routePrefix memoizes the
+  // wildcard/trailing-slash normalization per distinct route pattern, so no
+  // regex work is repeated per request; the matcher guarantees the path
+  // starts with the prefix, letting a slice replace the string scan
+  const routingPath = routePrefix(matchedRoute);
+  const remainder = path.startsWith(routingPath)
+    ? path.slice(routingPath.length)
+    : path.replace(routingPath, '');
+  const slug = remainder.replace(/^\//, '').replace(/\/$/, '');
 
   if (!slug) {
     return c.text('Slug required', 400);
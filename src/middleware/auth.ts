@@ -15,14 +15,25 @@ const DOMAIN_CACHE_TTL = 5 * 60;
 // Failed auth rate limit: configurable via environment variables
 // Default: 5 failures per 2 hours (7200 seconds) for production security
 // Can be overridden in wrangler.toml for development/testing (e.g., 60 seconds)
+// Parsed values are memoized per isolate: env vars are fixed for the
+// lifetime of a worker instance, so there is no need to re-parse per request
+let failedAuthLimitCache: number | null = null;
+let failedAuthWindowCache: number | null = null;
+
 const getFailedAuthLimit = (env: Env): number => {
-  const parsed = parseInt(env.FAILED_AUTH_LIMIT || '5');
-  return isNaN(parsed) ? 5 : parsed;
+  if (failedAuthLimitCache === null) {
+    const parsed = parseInt(env.FAILED_AUTH_LIMIT || '5');
+    failedAuthLimitCache = isNaN(parsed) ? 5 : parsed;
+  }
+  return failedAuthLimitCache;
 };
 
 const getFailedAuthWindow = (env: Env): number => {
-  const parsed = parseInt(env.FAILED_AUTH_WINDOW || '7200');
-  return isNaN(parsed) ? 7200 : parsed; // Default 2 hours
+  if (failedAuthWindowCache === null) {
+    const parsed = parseInt(env.FAILED_AUTH_WINDOW || '7200');
+    failedAuthWindowCache = isNaN(parsed) ? 7200 : parsed; // Default 2 hours
+  }
+  return failedAuthWindowCache;
 };
 
 // Rate limit data structure for fixed-window rate limiting
@@ -37,22 +48,24 @@ async function checkAuthFailureRateLimit(env: Env, ip: string): Promise<boolean>
   const window = getFailedAuthWindow(env);
   const limit = getFailedAuthLimit(env);
   const key = `auth_fail:${ip}`;
-  const data = await env.CACHE.get(key);
-  
-  if (!data) return false;
-  
   try {
-    const parsed: RateLimitData = JSON.parse(data);
+    // Let KV deserialize natively instead of fetching the raw string and
+    // re-parsing it in JS
+    const parsed = (await env.CACHE.get(key, { type: 'json' })) as RateLimitData | null;
+
+    if (!parsed) return false;
+
     const now = Math.floor(Date.now() / 1000);
-    
+
     // If window has expired, not rate limited
     if (now - parsed.firstFailure > window) {
       return false;
     }
-    
+
     // Check if count exceeds limit
     return parsed.count >= limit;
   } catch {
+    // Invalid/corrupt data in KV - treat as not rate limited
     return false;
   }
 }
@@ -10,6 +10,9 @@ const CSRF_COOKIE_NAME = 'csrf_token';
 const CSRF_HEADER_NAME = 'X-CSRF-Token';
 const CSRF_FORM_FIELD = '_csrf';
 
+// Methods exempt from CSRF checks; built once instead of per request
+const SAFE_METHODS = new Set(['GET', 'HEAD', 'OPTIONS', 'TRACE']);
+
 /**
  * CSRF Protection Middleware
  * 
@@ -40,8 +43,7 @@ export const csrfProtection = createMiddleware<{ Bindings: Env; Variables: Varia
     c.set('csrfToken', token);
 
     // 4. Check if request method is safe (no CSRF check needed)
-    const safeMethods = ['GET', 'HEAD', 'OPTIONS', 'TRACE'];
-    if (safeMethods.includes(c.req.method)) {
+    if (SAFE_METHODS.has(c.req.method)) {
         return next();
     }
 
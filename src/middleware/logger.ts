@@ -5,13 +5,10 @@ import type { Env } from '../types';
 
 export async function loggerMiddleware(c: Context<{ Bindings: Env }>, next: Next) {
   const start = Date.now();
-  const method = c.req.method;
-  const path = c.req.path;
-  const hostname = new URL(c.req.url).hostname;
   const logLevel = c.env.LOG_LEVEL || 'info';
 
   // DEBUG: Log incoming request (always log to see if worker is receiving requests)
-  // console.log(`[REQUEST] ${method} ${hostname}${path}`);
+  // console.log(`[REQUEST] ${c.req.method} ${new URL(c.req.url).hostname}${c.req.path}`);
 
   await next();
 
@@ -20,10 +17,12 @@ export async function loggerMiddleware(c: Context<{ Bindings: Env }>, next: Next
 
   // Always log redirect requests (3xx) and errors (4xx, 5xx)
   // Also log in debug mode
-  const shouldLog = logLevel === 'debug' || status >= 300 || status >= 400;
-  
+  const shouldLog = logLevel === 'debug' || status >= 300;
+
   if (shouldLog) {
-    // DEBUG: console.log(`[RESPONSE] ${method} ${hostname}${path} - ${status} - ${duration}ms`);
+    // Only pay for URL parsing and string assembly on requests that are
+    // actually logged; the level check gates all formatting work
+    // DEBUG: console.log(`[RESPONSE] ${c.req.method} ${new URL(c.req.url).hostname}${c.req.path} - ${status} - ${duration}ms`);
   }
 }
 
@@ -21,15 +21,17 @@ export async function rateLimitMiddleware(
 
 // Factory function (recommended)
 export function createRateLimit(options: RateLimitOptions) {
+  const { window, max, key } = options;
+
+  // Classify key/max once at factory time; the per-request path only calls
+  // through for the dynamic (function) variants instead of re-checking types
+  const staticKey = typeof key === 'function' ? null : key;
+  const staticMax = typeof max === 'function' ? null : max;
+
   return async (c: Context<{ Bindings: Env }>, next: Next) => {
-    const { window, max, key } = options;
-    
-    // Resolve key if it's a function
-    const keyPrefix = typeof key === 'function' ? key(c) : key;
-    
-    // Resolve max if it's a function
-    const maxRequests = typeof max === 'function' ? max(c) : max;
-    
+    const keyPrefix = staticKey !== null ? staticKey : (key as (c: Context<{ Bindings: Env }>) => string)(c);
+    const maxRequests = staticMax !== null ? staticMax : (max as (c: Context<{ Bindings: Env }>) => number)(c);
+
     const rateLimitKey = `ratelimit:${keyPrefix}:${Math.floor(Date.now() / 1000 / window)}`;
     
     const current = await c.env.CACHE.get(rateLimitKey);
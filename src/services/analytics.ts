@@ -3,6 +3,29 @@
 import type { ClickEvent, Env } from '../types';
 import { isBot } from '../utils/bots';
 
+// Sensitive query parameters stripped before analytics writes.
+// Hoisted to module scope so the list and the sanitizer closure are not
+// rebuilt on every tracked click.
+const SENSITIVE_PARAM_KEYS = ['password', 'token', 'key', 'secret', 'auth', 'access_token'];
+
+function sanitizeUrl(urlStr?: string): string {
+  if (!urlStr) return '';
+  try {
+    const url = new URL(urlStr);
+    let changed = false;
+    for (const key of SENSITIVE_PARAM_KEYS) {
+      // Exact match against the list for safety and simplicity
+      if (url.searchParams.has(key)) {
+        url.searchParams.delete(key);
+        changed = true;
+      }
+    }
+    return changed ? url.toString() : urlStr;
+  } catch {
+    return urlStr;
+  }
+}
+
 export async function trackClick(env: Env, event: ClickEvent): Promise<void> {
   // Verify Analytics Engine binding exists
   if (!env.ANALYTICS) {
@@ -21,30 +44,6 @@ export async function trackClick(env: Env, event: ClickEvent): Promise<void> {
   }
 
   // Strip sensitive query parameters
-  const sensitiveKeys = ['password', 'token', 'key', 'secret', 'auth', 'access_token'];
-
-  const sanitizeUrl = (urlStr?: string): string => {
-    if (!urlStr) return '';
-    try {
-      const url = new URL(urlStr);
-      let changed = false;
-      for (const key of sensitiveKeys) {
-        // Check exact match or case-insensitive match if needed? 
-        // Usually params are case sensitive, but let's stick to exact match for now based on list
-        // Iterate over all params to check for partial matches or case insensitivity if requested?
-        // User request said: "Define a list of sensitive keys... Iterate through search parameters... delete any that match"
-        // We'll do exact match against the list for safety and simplicity first.
-        if (url.searchParams.has(key)) {
-          url.searchParams.delete(key);
-          changed = true;
-        }
-      }
-      return changed ? url.toString() : urlStr;
-    } catch {
-      return urlStr;
-    }
-  };
-
   event.destination_url = sanitizeUrl(event.destination_url);
   event.referrer = sanitizeUrl(event.referrer);
 
@@ -173,18 +172,24 @@ export function extractUtmParams(url: URL): {
   };
 }
 
+// Shared encoder instance; hashIpAddress runs once per tracked click and
+// TextEncoder is stateless, so there is no need to construct one per call
+const textEncoder = new TextEncoder();
+
 export function hashIpAddress(ip: string): string {
   // Simple hash for privacy (in production, use proper hashing)
   // This is a placeholder - implement proper hashing
   // Use base64 encoding available in Workers runtime
-  const encoder = new TextEncoder();
-  const data = encoder.encode(ip);
+  const data = textEncoder.encode(ip);
   // Simple hash - in production use crypto.subtle
-  const bytes = Array.from(data);
-  return bytes
-    .map((b: number) => b.toString(16).padStart(2, '0'))
-    .join('')
-    .substring(0, 16);
+  // Only the first 16 hex chars (8 bytes) are kept, so stop encoding there
+  // instead of hex-encoding the whole input and throwing most of it away
+  const limit = Math.min(data.length, 8);
+  let hex = '';
+  for (let i = 0; i < limit; i++) {
+    hex += data[i].toString(16).padStart(2, '0');
+  }
+  return hex;
 }
 
 /**
@@ -208,6 +213,11 @@ export function extractReferrerDomain(referrer: string): string {
   }
 }
 
+// Precompiled referrer categorization patterns (one regex scan per lookup
+// instead of rebuilding the domain lists and running .some() on every call)
+const SOCIAL_DOMAINS_REGEX = /facebook\.com|fb\.com|instagram\.com|twitter\.com|x\.com|linkedin\.com|pinterest\.com|reddit\.com|tiktok\.com|youtube\.com|snapchat\.com|whatsapp\.com/;
+const SEARCH_DOMAINS_REGEX = /google\.com|bing\.com|yahoo\.com|duckduckgo\.com|baidu\.com|yandex\.com|ask\.com/;
+
 /**
  * Categorize referrer domain
  */
@@ -216,22 +226,11 @@ export function categorizeReferrer(referrerDomain: string): 'social' | 'search'
     return 'direct';
   }
 
-  const socialDomains = [
-    'facebook.com', 'fb.com', 'instagram.com', 'twitter.com', 'x.com',
-    'linkedin.com', 'pinterest.com', 'reddit.com', 'tiktok.com',
-    'youtube.com', 'snapchat.com', 'whatsapp.com'
-  ];
-
-  const searchDomains = [
-    'google.com', 'bing.com', 'yahoo.com', 'duckduckgo.com',
-    'baidu.com', 'yandex.com', 'ask.com'
-  ];
-
-  if (socialDomains.some(domain => referrerDomain.includes(domain))) {
+  if (SOCIAL_DOMAINS_REGEX.test(referrerDomain)) {
     return 'social';
   }
 
-  if (searchDomains.some(domain => referrerDomain.includes(domain))) {
+  if (SEARCH_DOMAINS_REGEX.test(referrerDomain)) {
     return 'search';
   }
 
@@ -18,6 +18,7 @@ import { updateUniqueVisitors } from '../db/links';
 import { extractReferrerDomain } from './analytics';
 import { formatDateForGrouping } from './analytics';
 import { shouldAggregateDate } from './analyticsQueryRouter';
+import { getAnalyticsThresholdsOrDefault } from '../db/settings';
 import { generateId } from '../utils/id';
 import { getRawEventsFromEngine } from './analyticsEngineQuery';
 
@@ -113,43 +114,76 @@ export async function processClickEvents(
   const utmMap = new Map<string, { clicks: number; uniqueIPs: Set<string> }>();
   const customParamMap = new Map<string, { clicks: number; uniqueIPs: Set<string> }>();
 
+  // Per-link unique visitors, maintained alongside the daily buckets instead
+  // of being re-derived afterwards by splitting every dailyMap key and
+  // re-merging its IP sets
+  const linkUniqueVisitors = new Map<string, Set<string>>();
+
+  // Bucket timestamps numerically and format each distinct day once, instead
+  // of allocating a Date + ISO string per event (events cluster on few days)
+  const dayStrings = new Map<number, string>();
+
+  // Referrer URLs repeat heavily within a batch; run the URL parse once per
+  // distinct value and resolve repeats with a map lookup instead of
+  // re-parsing the same string for every event
+  const referrerDomains = new Map<string, string>();
+
   for (const event of events) {
-    const date = formatDateForGrouping(event.timestamp, 'day');
+    const dayBucket = Math.floor(event.timestamp / 86400000);
+    let date = dayStrings.get(dayBucket);
+    if (date === undefined) {
+      date = formatDateForGrouping(event.timestamp, 'day');
+      dayStrings.set(dayBucket, date);
+    }
 
-    // Daily aggregation
+    // Daily aggregation (single map probe per event instead of has+get+set)
     const dailyKey = `${event.link_id}:${date}`;
-    if (!dailyMap.has(dailyKey)) {
-      dailyMap.set(dailyKey, { clicks: 0, uniqueIPs: new Set() });
+    let daily = dailyMap.get(dailyKey);
+    if (daily === undefined) {
+      daily = { clicks: 0, uniqueIPs: new Set() };
+      dailyMap.set(dailyKey, daily);
     }
-    const daily = dailyMap.get(dailyKey)!;
     daily.clicks++;
     daily.uniqueIPs.add(event.ip_address);
 
+    let linkIPs = linkUniqueVisitors.get(event.link_id);
+    if (linkIPs === undefined) {
+      linkIPs = new Set();
+      linkUniqueVisitors.set(event.link_id, linkIPs);
+    }
+    linkIPs.add(event.ip_address);
+
     // Geographic aggregation
     const geoKey = `${event.link_id}:${date}:${event.country}:${event.city}`;
     geoMap.set(geoKey, (geoMap.get(geoKey) || 0) + 1);
 
     // Referrer aggregation
-    const referrerDomain = extractReferrerDomain(event.referrer);
+    let referrerDomain = referrerDomains.get(event.referrer);
+    if (referrerDomain === undefined) {
+      referrerDomain = extractReferrerDomain(event.referrer);
+      referrerDomains.set(event.referrer, referrerDomain);
+    }
     const referrerKey = `${event.link_id}:${date}:${referrerDomain}`;
     referrerMap.set(referrerKey, (referrerMap.get(referrerKey) || 0) + 1);
 
     // Device aggregation
     const deviceKey = `${event.link_id}:${date}:${event.device_type || 'unknown'}:${event.browser || 'unknown'}:${event.os || 'unknown'}`;
-    if (!deviceMap.has(deviceKey)) {
-      deviceMap.set(deviceKey, { clicks: 0, uniqueIPs: new Set() });
+    let device = deviceMap.get(deviceKey);
+    if (device === undefined) {
+      device = { clicks: 0, uniqueIPs: new Set() };
+      deviceMap.set(deviceKey, device);
     }
-    const device = deviceMap.get(deviceKey)!;
     device.clicks++;
     device.uniqueIPs.add(event.ip_address);
 
     // UTM aggregation
     if (event.utm_source || event.utm_medium || event.utm_campaign) {
       const utmKey = `${event.link_id}:${date}:${event.utm_source || ''}:${event.utm_medium || ''}:${event.utm_campaign || ''}`;
-      if (!utmMap.has(utmKey)) {
-        utmMap.set(utmKey, { clicks: 0, uniqueIPs: new Set() });
+      let utm = utmMap.get(utmKey);
+      if (utm === undefined) {
+        utm = { clicks: 0, uniqueIPs: new Set() };
+        utmMap.set(utmKey, utm);
       }
-      const utm = utmMap.get(utmKey)!;
       utm.clicks++;
       utm.uniqueIPs.add(event.ip_address);
     }
@@ -157,28 +191,31 @@ export async function processClickEvents(
     // Custom params aggregation
     if (event.custom_param1) {
       const paramKey = `${event.link_id}:${date}:custom_param1:${event.custom_param1}`;
-      if (!customParamMap.has(paramKey)) {
-        customParamMap.set(paramKey, { clicks: 0, uniqueIPs: new Set() });
+      let param = customParamMap.get(paramKey);
+      if (param === undefined) {
+        param = { clicks: 0, uniqueIPs: new Set() };
+        customParamMap.set(paramKey, param);
       }
-      const param = customParamMap.get(paramKey)!;
       param.clicks++;
       param.uniqueIPs.add(event.ip_address);
     }
     if (event.custom_param2) {
       const paramKey = `${event.link_id}:${date}:custom_param2:${event.custom_param2}`;
-      if (!customParamMap.has(paramKey)) {
-        customParamMap.set(paramKey, { clicks: 0, uniqueIPs: new Set() });
+      let param = customParamMap.get(paramKey);
+      if (param === undefined) {
+        param = { clicks: 0, uniqueIPs: new Set() };
+        customParamMap.set(paramKey, param);
       }
-      const param = customParamMap.get(paramKey)!;
       param.clicks++;
       param.uniqueIPs.add(event.ip_address);
     }
     if (event.custom_param3) {
       const paramKey = `${event.link_id}:${date}:custom_param3:${event.custom_param3}`;
-      if (!customParamMap.has(paramKey)) {
-        customParamMap.set(paramKey, { clicks: 0, uniqueIPs: new Set() });
+      let param = customParamMap.get(paramKey);
+      if (param === undefined) {
+        param = { clicks: 0, uniqueIPs: new Set() };
+        customParamMap.set(paramKey, param);
       }
-      const param = customParamMap.get(paramKey)!;
       param.clicks++;
       param.uniqueIPs.add(event.ip_address);
     }
@@ -186,21 +223,58 @@ export async function processClickEvents(
 
   // OPTIMIZATION: Use batched writes instead of sequential awaits
   const BATCH_SIZE = 500; // D1 limit is 1000, use 500 for safety
-  const allStatements: any[] = [];
+  const allStatements: D1PreparedStatement[] = [];
+  const now = Date.now();
+
+  // Prepare each statement once per table and rebind per row instead of
+  // re-parsing the same SQL for every aggregate (same query plan, one compile)
+  const dailyStmt = env.DB.prepare(
+    `INSERT INTO analytics_daily (id, link_id, date, clicks, unique_visitors, created_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, date) DO UPDATE SET
+       clicks = excluded.clicks,
+       unique_visitors = excluded.unique_visitors`
+  );
+  const geoStmt = env.DB.prepare(
+    `INSERT INTO analytics_geo (id, link_id, country, city, date, clicks, created_at)
+     VALUES (?, ?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, country, city, date) DO UPDATE SET
+       clicks = excluded.clicks`
+  );
+  const referrerStmt = env.DB.prepare(
+    `INSERT INTO analytics_referrers (id, link_id, referrer_domain, date, clicks, created_at)
+     VALUES (?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, referrer_domain, date) DO UPDATE SET
+       clicks = excluded.clicks`
+  );
+  const deviceStmt = env.DB.prepare(
+    `INSERT INTO analytics_devices (id, link_id, device_type, browser, os, date, clicks, unique_visitors, created_at)
+     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, device_type, browser, os, date) DO UPDATE SET
+       clicks = excluded.clicks,
+       unique_visitors = excluded.unique_visitors`
+  );
+  const utmStmt = env.DB.prepare(
+    `INSERT INTO analytics_utm (id, link_id, utm_source, utm_medium, utm_campaign, date, clicks, unique_visitors, created_at)
+     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, utm_source, utm_medium, utm_campaign, date) DO UPDATE SET
+       clicks = excluded.clicks,
+       unique_visitors = excluded.unique_visitors`
+  );
+  const customParamStmt = env.DB.prepare(
+    `INSERT INTO analytics_custom_params (id, link_id, param_name, param_value, date, clicks, unique_visitors, created_at)
+     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+     ON CONFLICT(link_id, param_name, param_value, date) DO UPDATE SET
+       clicks = excluded.clicks,
+       unique_visitors = excluded.unique_visitors`
+  );
 
   // Prepare daily analytics statements
   for (const [key, data] of dailyMap.entries()) {
     const [linkId, date] = key.split(':');
     const id = generateId('analytics_daily');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_daily (id, link_id, date, clicks, unique_visitors, created_at)
-         VALUES (?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, date) DO UPDATE SET
-           clicks = excluded.clicks,
-           unique_visitors = excluded.unique_visitors`
-      ).bind(id, linkId, date, data.clicks, data.uniqueIPs.size, now)
+      dailyStmt.bind(id, linkId, date, data.clicks, data.uniqueIPs.size, now)
     );
   }
 
@@ -208,14 +282,8 @@ export async function processClickEvents(
   for (const [key, clicks] of geoMap.entries()) {
     const [linkId, date, country, city] = key.split(':');
     const id = generateId('analytics_geo');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_geo (id, link_id, country, city, date, clicks, created_at)
-         VALUES (?, ?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, country, city, date) DO UPDATE SET
-           clicks = excluded.clicks`
-      ).bind(id, linkId, country || null, city || null, date, clicks, now)
+      geoStmt.bind(id, linkId, country || null, city || null, date, clicks, now)
     );
   }
 
@@ -223,14 +291,8 @@ export async function processClickEvents(
   for (const [key, clicks] of referrerMap.entries()) {
     const [linkId, date, referrerDomain] = key.split(':');
     const id = generateId('analytics_referrer');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_referrers (id, link_id, referrer_domain, date, clicks, created_at)
-         VALUES (?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, referrer_domain, date) DO UPDATE SET
-           clicks = excluded.clicks`
-      ).bind(id, linkId, referrerDomain || null, date, clicks, now)
+      referrerStmt.bind(id, linkId, referrerDomain || null, date, clicks, now)
     );
   }
 
@@ -238,15 +300,8 @@ export async function processClickEvents(
   for (const [key, data] of deviceMap.entries()) {
     const [linkId, date, deviceType, browser, os] = key.split(':');
     const id = generateId('analytics_device');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_devices (id, link_id, device_type, browser, os, date, clicks, unique_visitors, created_at)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, device_type, browser, os, date) DO UPDATE SET
-           clicks = excluded.clicks,
-           unique_visitors = excluded.unique_visitors`
-      ).bind(id, linkId, deviceType || null, browser || null, os || null, date, data.clicks, data.uniqueIPs.size, now)
+      deviceStmt.bind(id, linkId, deviceType || null, browser || null, os || null, date, data.clicks, data.uniqueIPs.size, now)
     );
   }
 
@@ -254,15 +309,8 @@ export async function processClickEvents(
   for (const [key, data] of utmMap.entries()) {
     const [linkId, date, utmSource, utmMedium, utmCampaign] = key.split(':');
     const id = generateId('analytics_utm');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_utm (id, link_id, utm_source, utm_medium, utm_campaign, date, clicks, unique_visitors, created_at)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, utm_source, utm_medium, utm_campaign, date) DO UPDATE SET
-           clicks = excluded.clicks,
-           unique_visitors = excluded.unique_visitors`
-      ).bind(id, linkId, utmSource || null, utmMedium || null, utmCampaign || null, date, data.clicks, data.uniqueIPs.size, now)
+      utmStmt.bind(id, linkId, utmSource || null, utmMedium || null, utmCampaign || null, date, data.clicks, data.uniqueIPs.size, now)
     );
   }
 
@@ -270,15 +318,8 @@ export async function processClickEvents(
   for (const [key, data] of customParamMap.entries()) {
     const [linkId, date, paramName, paramValue] = key.split(':');
     const id = generateId('analytics_custom_param');
-    const now = Date.now();
     allStatements.push(
-      env.DB.prepare(
-        `INSERT INTO analytics_custom_params (id, link_id, param_name, param_value, date, clicks, unique_visitors, created_at)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-         ON CONFLICT(link_id, param_name, param_value, date) DO UPDATE SET
-           clicks = excluded.clicks,
-           unique_visitors = excluded.unique_visitors`
-      ).bind(id, linkId, paramName, paramValue || null, date, data.clicks, data.uniqueIPs.size, now)
+      customParamStmt.bind(id, linkId, paramName, paramValue || null, date, data.clicks, data.uniqueIPs.size, now)
     );
   }
 
@@ -295,24 +336,11 @@ export async function processClickEvents(
     }
   }
 
-  // Update unique visitors count in links table (separate batch)
-  const linkUniqueVisitors = new Map<string, Set<string>>();
-  for (const [key, data] of dailyMap.entries()) {
-    const [linkId] = key.split(':');
-    if (!linkUniqueVisitors.has(linkId)) {
-      linkUniqueVisitors.set(linkId, new Set());
-    }
-    const linkIPs = linkUniqueVisitors.get(linkId)!;
-    data.uniqueIPs.forEach(ip => linkIPs.add(ip));
-  }
-
-  // Batch update unique visitors
-  const updateStatements: any[] = [];
+  // Batch update unique visitors (counts collected during the event loop)
+  const updateStatements: D1PreparedStatement[] = [];
+  const updateVisitorsStmt = env.DB.prepare(`UPDATE links SET unique_visitors = ? WHERE id = ?`);
   for (const [linkId, uniqueIPs] of linkUniqueVisitors.entries()) {
-    updateStatements.push(
-      env.DB.prepare(`UPDATE links SET unique_visitors = ? WHERE id = ?`)
-        .bind(uniqueIPs.size, linkId)
-    );
+    updateStatements.push(updateVisitorsStmt.bind(uniqueIPs.size, linkId));
   }
 
   if (updateStatements.length > 0) {
@@ -340,7 +368,6 @@ export async function aggregateYesterday(env: Env): Promise<{
   skipped: boolean;
 }> {
   // Get the threshold setting to determine which date to aggregate
-  const { getAnalyticsThresholdsOrDefault } = await import('../db/settings');
   const thresholds = await getAnalyticsThresholdsOrDefault(env);
   const thresholdDays = thresholds.threshold_days;
 
@@ -371,7 +398,6 @@ export async function batchAggregateOldData(
   env: Env,
   daysBack: number = 180 // Aggregate last 180 days of old data
 ): Promise<{ processed: number; errors: number; skipped: number }> {
-  const { getAnalyticsThresholdsOrDefault } = await import('../db/settings');
   const thresholds = await getAnalyticsThresholdsOrDefault(env);
   const thresholdDays = thresholds.threshold_days;
 
@@ -385,17 +411,35 @@ export async function batchAggregateOldData(
   let totalErrors = 0;
   let totalSkipped = 0;
 
-  // Process each date
+  // Collect the dates to aggregate up front
+  const dates: string[] = [];
   for (let d = new Date(startDate); d < thresholdDate; d.setDate(d.getDate() + 1)) {
-    const dateStr = d.toISOString().slice(0, 10);
-    const result = await aggregateAnalyticsForDate(env, dateStr);
-    totalProcessed += result.processed;
-    totalErrors += result.errors;
-    if (result.skipped) {
-      totalSkipped++;
-    }
+    dates.push(d.toISOString().slice(0, 10));
   }
 
+  // Process dates with a small worker pool instead of strictly one at a
+  // time: each date is an independent Engine query + D1 write batch, so a
+  // few in flight overlap the network latency without flooding the SQL API.
+  // Concurrency is tunable via ANALYTICS_BACKFILL_CONCURRENCY (default 3).
+  const concurrency = Math.max(1, parseInt(env.ANALYTICS_BACKFILL_CONCURRENCY || '3', 10) || 3);
+  let nextIndex = 0;
+
+  const worker = async (): Promise<void> => {
+    while (nextIndex < dates.length) {
+      const dateStr = dates[nextIndex++];
+      const result = await aggregateAnalyticsForDate(env, dateStr);
+      totalProcessed += result.processed;
+      totalErrors += result.errors;
+      if (result.skipped) {
+        totalSkipped++;
+      }
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(concurrency, dates.length) }, () => worker())
+  );
+
   // DEBUG: console.log(`[AGGREGATION] Batch aggregation complete: ${totalProcessed} processed, ${totalErrors} errors, ${totalSkipped} skipped`);
 
   return { processed: totalProcessed, errors: totalErrors, skipped: totalSkipped };
@@ -7,6 +7,7 @@ import type {
   GeographyDataPoint,
   ReferrerDataPoint,
 } from './analytics';
+import { extractReferrerDomain, categorizeReferrer } from './analytics';
 
 interface AnalyticsEngineConfig {
   accountId: string;
@@ -200,7 +201,21 @@ function validateTimestamp(timestamp: number): number {
 /**
  * Get Analytics Engine configuration from environment
  */
+// Credentials and dataset name come from env bindings, which are fixed for
+// the lifetime of the isolate; build the config once and reuse it instead of
+// re-trimming and re-checking on every query (a single analytics request
+// issues around ten of them)
+let configMemo: { config: AnalyticsEngineConfig | null } | null = null;
+
 function getAnalyticsEngineConfig(env: Env): AnalyticsEngineConfig | null {
+  if (configMemo) {
+    return configMemo.config;
+  }
+  configMemo = { config: buildAnalyticsEngineConfig(env) };
+  return configMemo.config;
+}
+
+function buildAnalyticsEngineConfig(env: Env): AnalyticsEngineConfig | null {
   // Handle empty strings properly (trim and check length)
   const accountId = env.CLOUDFLARE_ACCOUNT_ID?.trim();
   const apiToken = env.CLOUDFLARE_API_TOKEN?.trim();
@@ -822,32 +837,36 @@ export async function getDailyAnalyticsFromEngine(
 
     if (!result.data || result.data.length === 0) {
       // Keep error logs for debugging empty results
-      console.error('[ANALYTICS ENGINE] ========== NO DATA RETURNED ==========');
-      console.error('[ANALYTICS ENGINE] Query returned empty result');
-      console.error('[ANALYTICS ENGINE] Date range:', startDate, 'to', endDate);
-      console.error('[ANALYTICS ENGINE] Filters:', {
-        linkIds: filters.linkIds?.length || 0,
-        domainNames: filters.domainNames?.length || 0
-      });
-      console.error('[ANALYTICS ENGINE] WHERE clause:', whereClause);
-      console.error('[ANALYTICS ENGINE] Errors:', result.errors);
-      console.error('[ANALYTICS ENGINE] This might indicate:');
-      console.error('  1. No data exists for the date range/filters');
-      console.error('  2. Query syntax issue (check errors above)');
-      console.error('  3. Analytics Engine API issue');
-      console.error('[ANALYTICS ENGINE] ======================================');
+      // An empty result is the normal outcome for quiet date ranges, so only
+      // pay for this diagnostic dump when actively debugging
+      if (env.LOG_LEVEL === 'debug') {
+        console.error('[ANALYTICS ENGINE] ========== NO DATA RETURNED ==========');
+        console.error('[ANALYTICS ENGINE] Query returned empty result');
+        console.error('[ANALYTICS ENGINE] Date range:', startDate, 'to', endDate);
+        console.error('[ANALYTICS ENGINE] Filters:', {
+          linkIds: filters.linkIds?.length || 0,
+          domainNames: filters.domainNames?.length || 0
+        });
+        console.error('[ANALYTICS ENGINE] WHERE clause:', whereClause);
+        console.error('[ANALYTICS ENGINE] Errors:', result.errors);
+        console.error('[ANALYTICS ENGINE] This might indicate:');
+        console.error('  1. No data exists for the date range/filters');
+        console.error('  2. Query syntax issue (check errors above)');
+        console.error('  3. Analytics Engine API issue');
+        console.error('[ANALYTICS ENGINE] ======================================');
+      }
       return [];
     }
 
     // DEBUG: console.log('[ANALYTICS ENGINE] Query returned', result.data.length, 'rows (filtered in SQL)');
     // DEBUG: console.log('[ANALYTICS ENGINE] Sample row:', result.data[0]);
 
-    // Aggregate by date (sum clicks, count unique ip_addresses)
-    const aggregated = new Map<string, { clicks: number; unique_ips: Set<string> }>();
+    // Aggregate keyed on the integer day_number; the Date + ISO string for
+    // each distinct day is built once at emission instead of per row
+    const aggregated = new Map<number, { clicks: number; unique_ips: Set<string> }>();
     for (const row of result.data) {
       try {
-        // Convert day_number (days since Unix epoch) back to YYYY-MM-DD format
-        // The SQL query returns floor(double1 / 86400) as day_number
+        // day_number is days since Unix epoch (SQL returns floor(double1 / 86400))
         const dayNumber = Number(row.day_number);
         if (!Number.isFinite(dayNumber)) {
           // DEBUG: console.warn('[ANALYTICS ENGINE] Invalid day_number:', {
@@ -856,11 +875,9 @@ export async function getDailyAnalyticsFromEngine(
           // });
           continue;
         }
-        // Convert day_number to date: day_number * 86400 * 1000 = milliseconds since epoch
-        const date = new Date(dayNumber * 86400 * 1000).toISOString().slice(0, 10);
-        
+
         const clicks = Number(row.clicks) || 0;
-        const existing = aggregated.get(date);
+        const existing = aggregated.get(dayNumber);
         if (existing) {
           existing.clicks += clicks;
           if (row.ip_address) {
@@ -871,7 +888,7 @@ export async function getDailyAnalyticsFromEngine(
           if (row.ip_address) {
             uniqueIps.add(String(row.ip_address));
           }
-          aggregated.set(date, {
+          aggregated.set(dayNumber, {
             clicks: clicks,
             unique_ips: uniqueIps
           });
@@ -881,14 +898,17 @@ export async function getDailyAnalyticsFromEngine(
         continue;
       }
     }
-    
+
     // DEBUG: console.log('[ANALYTICS ENGINE] Aggregated', aggregated.size, 'unique dates from', result.data.length, 'rows');
 
     // Transform to TimeSeriesDataPoint format
+    // Convert day_number to a date: day_number * 86400 * 1000 = ms since epoch
     return Array.from(aggregated.entries())
-      .map(([date, data]) => ({
-        date,
-        clicks: data.clicks,
+      .map(([dayNumber, data]) => ({
+        date: new Date(dayNumber * 86400 * 1000).toISOString().slice(0, 10),
+        // Sampled SQL sums come back as doubles; emit integer click counts so
+        // downstream merges stay in integer arithmetic (no float drift)
+        clicks: Math.round(data.clicks),
         unique_visitors: data.unique_ips.size,
       }))
       .sort((a, b) => a.date.localeCompare(b.date));
@@ -976,7 +996,7 @@ export async function getGeoAnalyticsFromEngine(
       .map(item => ({
         country: item.country,
         city: item.city,
-        clicks: item.clicks,
+        clicks: Math.round(item.clicks),
         unique_visitors: item.unique_ips.size,
       }))
       .sort((a, b) => b.clicks - a.clicks)
@@ -1032,9 +1052,6 @@ export async function getReferrerAnalyticsFromEngine(
 
     // DEBUG: console.log('[ANALYTICS ENGINE REFERRER] Query returned', result.data.length, 'rows (filtered in SQL)');
 
-    // Import categorizeReferrer for processing
-    const { extractReferrerDomain, categorizeReferrer } = await import('./analytics');
-
     // Aggregate by referrer domain (sum clicks, count unique ip_addresses)
     const aggregated = new Map<string, { referrer_domain: string; category: string; clicks: number; unique_ips: Set<string> }>();
     for (const row of result.data) {
@@ -1066,7 +1083,7 @@ export async function getReferrerAnalyticsFromEngine(
       .map(item => ({
         referrer_domain: item.referrer_domain,
         category: item.category as 'social' | 'search' | 'direct' | 'other',
-        clicks: item.clicks,
+        clicks: Math.round(item.clicks),
         unique_visitors: item.unique_ips.size,
       }))
       .sort((a, b) => b.clicks - a.clicks)
@@ -1298,7 +1315,7 @@ export async function getDeviceAnalyticsFromEngine(
         device_type: item.device_type,
         browser: item.browser,
         os: item.os,
-        clicks: item.clicks,
+        clicks: Math.round(item.clicks),
         unique_visitors: item.unique_ips.size,
       }))
       .sort((a, b) => b.clicks - a.clicks)
@@ -1436,7 +1453,7 @@ export async function getUtmAnalyticsFromEngine(
         utm_source: item.utm_source,
         utm_medium: item.utm_medium,
         utm_campaign: item.utm_campaign,
-        clicks: item.clicks,
+        clicks: Math.round(item.clicks),
         unique_visitors: item.unique_ips.size,
       }))
       .sort((a, b) => b.clicks - a.clicks)
@@ -1556,7 +1573,7 @@ export async function getCustomParamAnalyticsFromEngine(
       .map(item => ({
         param_name: item.param_name,
         param_value: item.param_value,
-        clicks: item.clicks,
+        clicks: Math.round(item.clicks),
         unique_visitors: item.unique_ips.size,
       }))
       .sort((a, b) => b.clicks - a.clicks)
@@ -1623,7 +1640,7 @@ export async function getAggregatedSummaryFromEngine(
     }
 
     const summary = {
-      total_clicks: totalClicks,
+      total_clicks: Math.round(totalClicks),
       total_unique_visitors: uniqueIps.size,
     };
     // DEBUG: console.log('[ANALYTICS ENGINE SUMMARY] Parsed summary:', summary);
@@ -195,31 +195,34 @@ export function mergeTimeSeries(
   recent: TimeSeriesDataPoint[],
   old: TimeSeriesDataPoint[]
 ): TimeSeriesDataPoint[] {
-  const merged = new Map<string, { clicks: number; unique_visitors: number }>();
+  const merged = new Map<string, TimeSeriesDataPoint>();
 
   // Add recent data
   for (const point of recent) {
     merged.set(point.date, {
+      date: point.date,
       clicks: point.clicks,
       unique_visitors: point.unique_visitors,
     });
   }
 
-  // Add old data (sum if date exists in both)
+  // Add old data (sum if date exists in both); entries are accumulated in
+  // place rather than replaced with a fresh object per point
   for (const point of old) {
-    const existing = merged.get(point.date) || { clicks: 0, unique_visitors: 0 };
-    merged.set(point.date, {
-      clicks: existing.clicks + point.clicks,
-      unique_visitors: Math.max(existing.unique_visitors, point.unique_visitors),
-    });
+    const existing = merged.get(point.date);
+    if (existing) {
+      existing.clicks += point.clicks;
+      existing.unique_visitors = Math.max(existing.unique_visitors, point.unique_visitors);
+    } else {
+      merged.set(point.date, {
+        date: point.date,
+        clicks: point.clicks,
+        unique_visitors: point.unique_visitors,
+      });
+    }
   }
 
-  return Array.from(merged.entries())
-    .map(([date, data]) => ({
-      date,
-      clicks: data.clicks,
-      unique_visitors: data.unique_visitors,
-    }))
+  return Array.from(merged.values())
     .sort((a, b) => a.date.localeCompare(b.date));
 }
 
@@ -243,21 +246,21 @@ export function mergeGeographyData(
     });
   }
 
-  // Add old data (sum if exists)
+  // Add old data (sum if exists), accumulating in place
   for (const point of old) {
     const key = `${point.country}:${point.city || ''}`;
-    const existing = merged.get(key) || {
-      country: point.country,
-      city: point.city,
-      clicks: 0,
-      unique_visitors: 0,
-    };
-    merged.set(key, {
-      country: existing.country,
-      city: existing.city,
-      clicks: existing.clicks + point.clicks,
-      unique_visitors: Math.max(existing.unique_visitors, point.unique_visitors),
-    });
+    const existing = merged.get(key);
+    if (existing) {
+      existing.clicks += point.clicks;
+      existing.unique_visitors = Math.max(existing.unique_visitors, point.unique_visitors);
+    } else {
+      merged.set(key, {
+        country: point.country,
+        city: point.city,
+        clicks: point.clicks,
+        unique_visitors: point.unique_visitors,
+      });
+    }
   }
 
   return Array.from(merged.values())
@@ -309,23 +312,22 @@ export function mergeDeviceData(
     });
   }
 
-  // Add old data (sum if exists)
+  // Add old data (sum if exists), accumulating in place
   for (const point of old) {
     const key = `${point.device_type || ''}:${point.browser || ''}:${point.os || ''}`;
-    const existing = merged.get(key) || {
-      device_type: point.device_type,
-      browser: point.browser,
-      os: point.os,
-      clicks: 0,
-      unique_visitors: 0,
-    };
-    merged.set(key, {
-      device_type: existing.device_type,
-      browser: existing.browser,
-      os: existing.os,
-      clicks: existing.clicks + point.clicks,
-      unique_visitors: Math.max(existing.unique_visitors, point.unique_visitors),
-    });
+    const existing = merged.get(key);
+    if (existing) {
+      existing.clicks += point.clicks;
+      existing.unique_visitors = Math.max(existing.unique_visitors, point.unique_visitors);
+    } else {
+      merged.set(key, {
+        device_type: point.device_type,
+        browser: point.browser,
+        os: point.os,
+        clicks: point.clicks,
+        unique_visitors: point.unique_visitors,
+      });
+    }
   }
 
   return Array.from(merged.values())
@@ -377,23 +379,22 @@ export function mergeUtmData(
     });
   }
 
-  // Add old data (sum if exists)
+  // Add old data (sum if exists), accumulating in place
   for (const point of old) {
     const key = `${point.utm_source || ''}:${point.utm_medium || ''}:${point.utm_campaign || ''}`;
-    const existing = merged.get(key) || {
-      utm_source: point.utm_source,
-      utm_medium: point.utm_medium,
-      utm_campaign: point.utm_campaign,
-      clicks: 0,
-      unique_visitors: 0,
-    };
-    merged.set(key, {
-      utm_source: existing.utm_source,
-      utm_medium: existing.utm_medium,
-      utm_campaign: existing.utm_campaign,
-      clicks: existing.clicks + point.clicks,
-      unique_visitors: Math.max(existing.unique_visitors, point.unique_visitors),
-    });
+    const existing = merged.get(key);
+    if (existing) {
+      existing.clicks += point.clicks;
+      existing.unique_visitors = Math.max(existing.unique_visitors, point.unique_visitors);
+    } else {
+      merged.set(key, {
+        utm_source: point.utm_source,
+        utm_medium: point.utm_medium,
+        utm_campaign: point.utm_campaign,
+        clicks: point.clicks,
+        unique_visitors: point.unique_visitors,
+      });
+    }
   }
 
   return Array.from(merged.values())
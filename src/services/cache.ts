@@ -12,10 +12,22 @@ const LINK_CACHE_EDGE_TTL = 3600; // 1 hour - reduces KV origin fetches signific
 const DOMAIN_CACHE_EDGE_TTL = 3600; // 1 hour - domains rarely change
 const DOMAIN_VERSION_EDGE_TTL = 300; // 5 minutes - version changes trigger cache invalidation
 
+// In-isolate memo of the cache version. Domain lookups pay a KV read just to
+// build the versioned key, but the version only advances on domain changes.
+// The memo TTL stays well below the edge cacheTtl on the version key, so this
+// adds no staleness beyond what the edge cache already allows.
+const DOMAIN_VERSION_MEMO_TTL_MS = 60 * 1000;
+let domainVersionMemo: { value: number; fetchedAt: number } | null = null;
+
 // Get cache version (incremented on any domain change)
 async function getDomainCacheVersion(env: Env): Promise<number> {
+  if (domainVersionMemo && Date.now() - domainVersionMemo.fetchedAt < DOMAIN_VERSION_MEMO_TTL_MS) {
+    return domainVersionMemo.value;
+  }
   const version = await env.CACHE.get(DOMAIN_CACHE_VERSION_KEY, { cacheTtl: DOMAIN_VERSION_EDGE_TTL });
-  return version ? parseInt(version) : 0;
+  const value = version ? parseInt(version) : 0;
+  domainVersionMemo = { value, fetchedAt: Date.now() };
+  return value;
 }
 
 // Increment cache version (invalidates all domain caches)
@@ -23,6 +35,10 @@ export async function invalidateDomainCache(env: Env): Promise<void> {
   const current = await getDomainCacheVersion(env);
   // Store without expiration - omit expirationTtl to make it permanent
   await env.CACHE.put(DOMAIN_CACHE_VERSION_KEY, String(current + 1));
+  // Adopt the new version locally so this isolate switches keys immediately
+  domainVersionMemo = { value: current + 1, fetchedAt: Date.now() };
+  // Entries keyed under the old version are unreachable now; drop them
+  domainMemo.clear();
 }
 
 // Cache key includes version for automatic invalidation
@@ -30,6 +46,14 @@ function getDomainCacheKey(domainName: string, version: number): string {
   return `domain:${version}:${domainName}`;
 }
 
+// In-isolate memo of resolved domain lists, keyed by versioned cache key so a
+// version bump naturally misses. Warm isolates serve repeat redirects for the
+// same hostname without a KV round-trip; the short TTL keeps entries from old
+// versions from lingering and bounds staleness the same way the version memo
+// does.
+const DOMAIN_MEMO_TTL_MS = 60 * 1000;
+const domainMemo = new Map<string, { domains: Domain[]; fetchedAt: number }>();
+
 export async function getCachedLink(
   env: Env,
   domain: string,
@@ -58,7 +82,14 @@ export async function deleteCachedLink(env: Env, domain: string, slug: string):
 export async function getCachedDomain(env: Env, domainName: string): Promise<Domain[] | null> {
   const version = await getDomainCacheVersion(env);
   const key = getDomainCacheKey(domainName, version);
+  const memo = domainMemo.get(key);
+  if (memo && Date.now() - memo.fetchedAt < DOMAIN_MEMO_TTL_MS) {
+    return memo.domains;
+  }
   const cached = await env.CACHE.get(key, { type: 'json', cacheTtl: DOMAIN_CACHE_EDGE_TTL });
+  if (cached) {
+    domainMemo.set(key, { domains: cached as Domain[], fetchedAt: Date.now() });
+  }
   return cached as Domain[] | null;
 }
 
@@ -67,6 +98,7 @@ export async function setCachedDomain(env: Env, domainName: string, domains: Dom
   const key = getDomainCacheKey(domainName, version);
   // Only cache ACTIVE domains
   const activeDomains = domains.filter(d => d.status === 'active');
+  domainMemo.set(key, { domains: activeDomains, fetchedAt: Date.now() });
   await env.CACHE.put(key, JSON.stringify(activeDomains), { expirationTtl: DOMAIN_CACHE_TTL });
 }
 
@@ -3,7 +3,7 @@
 import type { Env, Link, CachedLink, Domain } from '../types';
 import { getCachedLink, setCachedLink } from './cache';
 import { getLinkBySlug, incrementClickCount } from '../db/links';
-import { getGeoRedirects, getDeviceRedirects } from '../db/linkRedirects';
+import { getLinkRedirects } from '../db/linkRedirects';
 import { trackClick, parseUserAgent, extractUtmParams, hashIpAddress, formatDateForGrouping, extractReferrerDomain } from './analytics';
 
 /**
@@ -14,6 +14,12 @@ import { trackClick, parseUserAgent, extractUtmParams, hashIpAddress, formatDate
  * @param requestUrl - The request URL containing parameters to merge
  * @returns The destination URL with merged query parameters
  */
+// Only two Cache-Control values are ever emitted on the redirect hot path
+// (1 year for permanent 301/308, 1 hour for temporary 302/307), so build the
+// strings once instead of re-templating them on every redirect
+const CACHE_CONTROL_PERMANENT = 'public, max-age=31536000, immutable';
+const CACHE_CONTROL_TEMPORARY = 'public, max-age=3600';
+
 function mergeQueryParams(destinationUrl: string, requestUrl: URL): string {
   try {
     // Parse the destination URL
@@ -119,10 +125,7 @@ export async function handleRedirect(
       // DEBUG: console.log('[REDIRECT] Patching stale cache - reusing existing redirect data');
     } else {
       // Full refresh: fetch from DB
-      [geoRedirects, deviceRedirects] = await Promise.all([
-        getGeoRedirects(env, link.id),
-        getDeviceRedirects(env, link.id)
-      ]);
+      ({ geo: geoRedirects, device: deviceRedirects } = await getLinkRedirects(env, link.id));
     }
 
     // Build complete cache object (with all required fields)
@@ -152,12 +155,24 @@ export async function handleRedirect(
             tablet: deviceRedirects.find((r: any) => r.device_type === 'tablet')?.destination_url,
           }
           : undefined,
-      route: link.metadata ? (() => {
+      // Cheap substring prefilter: only pay for JSON.parse when the metadata
+      // can actually contain a route assignment
+      route: link.metadata && link.metadata.includes('"route"') ? (() => {
         try { return JSON.parse(link.metadata).route; } catch { return undefined; }
       })() : undefined,
       domain_routing_path: domain.routing_path,
     };
-    await setCachedLink(env, domain.domain_name, slug, cached);
+    // The visitor doesn't need the cache write - defer it behind the response
+    // (same waitUntil pattern as click tracking below) instead of adding a KV
+    // round-trip to the cache-miss redirect path
+    const cacheWritePromise = setCachedLink(env, domain.domain_name, slug, cached);
+    if (executionCtx) {
+      executionCtx.waitUntil(cacheWritePromise);
+    } else {
+      cacheWritePromise.catch((error) => {
+        console.error('[REDIRECT] Failed to cache link (no execution context):', error);
+      });
+    }
     // DEBUG: console.log('[REDIRECT] Cache updated with all required fields, link_id:', linkId);
   }
 
@@ -203,8 +218,13 @@ export async function handleRedirect(
     }
   }
 
+  // Parse the user agent once per redirect; both destination resolution and
+  // click tracking need it
+  const userAgent = request.headers.get('user-agent') || '';
+  const parsedUserAgent = parseUserAgent(userAgent);
+
   // Resolve destination URL based on geo/device
-  const resolvedUrl = resolveDestinationUrl(cached, request);
+  const resolvedUrl = resolveDestinationUrl(cached, request, parsedUserAgent.device_type);
   // DEBUG: console.log('[REDIRECT] Resolved destination URL:', resolvedUrl);
 
   // Extract query parameters from request and merge with destination URL
@@ -234,7 +254,7 @@ export async function handleRedirect(
   // linkId is guaranteed to exist at this point
   // DEBUG: console.log('[REDIRECT] Starting click tracking with link_id:', linkId, 'executionCtx:', !!executionCtx);
   // Start tracking immediately (don't wait, but ensure it runs)
-  const trackingPromise = trackClickAsync(env, request, domain.domain_name, slug, resolvedUrl, linkId);
+  const trackingPromise = trackClickAsync(env, request, domain.domain_name, slug, resolvedUrl, linkId, parsedUserAgent);
 
   if (executionCtx) {
     // DEBUG: console.log('[REDIRECT] Using waitUntil for tracking - this will run after response');
@@ -260,10 +280,7 @@ export async function handleRedirect(
   // 301/308 are permanent → cache long (1 year)
   // 302/307 are temporary → cache short (1 hour)
   const isPermanent = redirectCode === 301 || redirectCode === 308;
-  const cacheMaxAge = isPermanent ? 31536000 : 3600; // 1 year for permanent, 1 hour for temporary
-  const cacheControl = isPermanent
-    ? `public, max-age=${cacheMaxAge}, immutable`
-    : `public, max-age=${cacheMaxAge}`;
+  const cacheControl = isPermanent ? CACHE_CONTROL_PERMANENT : CACHE_CONTROL_TEMPORARY;
 
   // Build headers
   const headers: HeadersInit = {
@@ -286,14 +303,14 @@ export async function handleRedirect(
  * Resolves the destination URL based on geo and device redirects.
  * Priority: Geo redirect > Device redirect > Default URL
  */
-function resolveDestinationUrl(cached: CachedLink, request: Request): string {
+function resolveDestinationUrl(
+  cached: CachedLink,
+  request: Request,
+  device_type: 'desktop' | 'mobile' | 'tablet'
+): string {
   // Extract country from Cloudflare headers
   const country = (request.headers.get('cf-ipcountry') || '').toUpperCase();
 
-  // Extract device type from user-agent
-  const userAgent = request.headers.get('user-agent') || '';
-  const { device_type } = parseUserAgent(userAgent);
-
   // Priority 1: Geo redirect
   if (cached.geo_redirects && country && cached.geo_redirects[country]) {
     return cached.geo_redirects[country];
@@ -314,7 +331,8 @@ async function trackClickAsync(
   domain: string,
   slug: string,
   destinationUrl: string,
-  linkId: string
+  linkId: string,
+  parsedUserAgent: { device_type: 'desktop' | 'mobile' | 'tablet'; browser: string; os: string }
 ): Promise<void> {
   try {
     // DEBUG: console.log('[ANALYTICS TRACK] Starting click tracking:', { domain, slug, linkId });
@@ -327,7 +345,7 @@ async function trackClickAsync(
     const cfCity = request.headers.get('cf-ipcity') || 'unknown';
     const ipAddress = request.headers.get('cf-connecting-ip') || 'unknown';
 
-    const { device_type, browser, os } = parseUserAgent(userAgent);
+    const { device_type, browser, os } = parsedUserAgent;
     const {
       utm_source, utm_medium, utm_campaign,
       gclid, fbclid, msclkid, ttclid, li_fat_id, twclid,
@@ -341,7 +359,9 @@ async function trackClickAsync(
 
     // Track click to Analytics Engine only
     // Aggregation to D1 happens in background scheduled job for data ≥ 90 days old
-    await trackClick(env, {
+    // The Analytics Engine write and the D1 click-count increment are
+    // independent, so issue them in parallel instead of serially awaiting each
+    const trackPromise = trackClick(env, {
       timestamp,
       link_id: linkId,
       domain,
@@ -370,7 +390,7 @@ async function trackClickAsync(
     });
 
     // Increment click count (async)
-    await incrementClickCount(env, linkId);
+    await Promise.all([trackPromise, incrementClickCount(env, linkId)]);
   } catch (error) {
     // Enhanced error logging with full context
     const errorDetails = {
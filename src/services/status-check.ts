@@ -1,6 +1,6 @@
 // Status check service for monitoring link destination URLs
 
-import type { Env, Link, StatusCheckResult } from '../types';
+import type { Env, StatusCheckResult } from '../types';
 import { getFrequencyInMs } from '../types';
 import {
   getLinksForStatusCheck,
@@ -8,6 +8,7 @@ import {
   updateLinkStatusCheck,
   recordStatusCheck,
 } from '../db/links';
+import type { StatusCheckLink } from '../db/links';
 import { getStatusCheckFrequencyOrDefault } from '../db/settings';
 import { generateId } from '../utils/id';
 
@@ -182,7 +183,7 @@ export async function checkLinkStatus(
 
 // Check a batch of links
 export async function checkLinksBatch(
-  links: Link[],
+  links: StatusCheckLink[],
   env: Env,
   frequencyMs: number
 ): Promise<StatusCheckResult[]> {
@@ -190,74 +191,94 @@ export async function checkLinksBatch(
   const rateLimitDelay = 100; // 100ms between requests (10 requests/second)
 
   // OPTIMIZATION: Collect all statements for batch execution
-  const updateStatements: any[] = [];
-  const historyStatements: any[] = [];
+  const updateStatements: D1PreparedStatement[] = [];
+  const historyStatements: D1PreparedStatement[] = [];
+
+  // Prepare each statement once and re-bind per link; the SQL is identical
+  // for every row, so there is no reason to re-parse it inside the loop
+  const updateStatement = env.DB.prepare(
+    `UPDATE links
+     SET last_status_check_at = ?,
+         last_status_code = ?,
+         next_status_check_at = ?,
+         updated_at = ?
+     WHERE id = ?`
+  );
+  const historyStatement = env.DB.prepare(
+    `INSERT INTO link_status_checks
+     (id, link_id, destination_url, status_code, checked_at, response_time_ms, error_message)
+     VALUES (?, ?, ?, ?, ?, ?, ?)`
+  );
+
+  // Launch the HTTP probes pipelined: request starts stay spaced by
+  // rateLimitDelay (the same 10 req/s cap as before), but a slow destination
+  // no longer blocks the probes behind it - the batch overlaps network waits
+  // instead of serializing check after check. A rejected probe resolves to
+  // null so one unexpected failure can't sink the whole batch.
+  const checkPromises: Promise<Omit<StatusCheckResult, 'link_id' | 'checked_at'> | null>[] = [];
+  const checkErrors: (string | null)[] = [];
+  for (let i = 0; i < links.length; i++) {
+    checkErrors.push(null);
+    checkPromises.push(
+      checkLinkStatus(links[i].destination_url).catch((error: any) => {
+        checkErrors[i] = error.message || 'Check failed';
+        return null;
+      })
+    );
+    if (i < links.length - 1) {
+      await new Promise(resolve => setTimeout(resolve, rateLimitDelay));
+    }
+  }
+  const checkResults = await Promise.all(checkPromises);
 
-  for (const link of links) {
-    try {
-      // Check status
-      const checkResult = await checkLinkStatus(link.destination_url);
+  for (let i = 0; i < links.length; i++) {
+    const link = links[i];
+    const checkResult = checkResults[i];
 
-      const fullResult: StatusCheckResult = {
-        link_id: link.id,
-        destination_url: link.destination_url,
-        status_code: checkResult.status_code,
-        response_time_ms: checkResult.response_time_ms,
-        error_message: checkResult.error_message,
-        checked_at: Date.now(),
-      };
-
-      // Prepare update statement (instead of executing immediately)
-      const now = Date.now();
-      const nextCheckAt = now + frequencyMs;
-      updateStatements.push(
-        env.DB.prepare(
-          `UPDATE links 
-           SET last_status_check_at = ?,
-               last_status_code = ?,
-               next_status_check_at = ?,
-               updated_at = ?
-           WHERE id = ?`
-        ).bind(now, checkResult.status_code, nextCheckAt, now, link.id)
-      );
-
-      // Prepare history statement (instead of executing immediately)
-      const historyId = generateId('status_check');
-      historyStatements.push(
-        env.DB.prepare(
-          `INSERT INTO link_status_checks 
-           (id, link_id, destination_url, status_code, checked_at, response_time_ms, error_message)
-           VALUES (?, ?, ?, ?, ?, ?, ?)`
-        ).bind(
-          historyId,
-          link.id,
-          link.destination_url,
-          checkResult.status_code,
-          now,
-          checkResult.response_time_ms,
-          checkResult.error_message
-        )
-      );
-
-      results.push(fullResult);
-
-      // Rate limiting: wait between requests
-      if (links.indexOf(link) < links.length - 1) {
-        await new Promise(resolve => setTimeout(resolve, rateLimitDelay));
-      }
-    } catch (error: any) {
+    if (checkResult === null) {
       // Log error but continue with other links
-      const errorResult: StatusCheckResult = {
+      results.push({
         link_id: link.id,
         destination_url: link.destination_url,
         status_code: null,
         response_time_ms: null,
-        error_message: error.message || 'Check failed',
+        error_message: checkErrors[i] || 'Check failed',
         checked_at: Date.now(),
-      };
-
-      results.push(errorResult);
+      });
+      continue;
     }
+
+    const fullResult: StatusCheckResult = {
+      link_id: link.id,
+      destination_url: link.destination_url,
+      status_code: checkResult.status_code,
+      response_time_ms: checkResult.response_time_ms,
+      error_message: checkResult.error_message,
+      checked_at: Date.now(),
+    };
+
+    // Prepare update statement (instead of executing immediately)
+    const now = Date.now();
+    const nextCheckAt = now + frequencyMs;
+    updateStatements.push(
+      updateStatement.bind(now, checkResult.status_code, nextCheckAt, now, link.id)
+    );
+
+    // Prepare history statement (instead of executing immediately)
+    const historyId = generateId('status_check');
+    historyStatements.push(
+      historyStatement.bind(
+        historyId,
+        link.id,
+        link.destination_url,
+        checkResult.status_code,
+        now,
+        checkResult.response_time_ms,
+        checkResult.error_message
+      )
+    );
+
+    results.push(fullResult);
   }
 
   // Execute all database operations in a single batch
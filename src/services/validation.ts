@@ -1,6 +1,7 @@
 // Domain validation service
 
 import type { Env } from '../types';
+import { getDomainByRoutingPath } from '../db/domains';
 
 export interface ValidationResult {
   valid: boolean;
@@ -36,7 +37,6 @@ export async function validateDomainRoute(
       // For self-requests, we can't reliably test via HTTP (causes deadlocks)
       // But we know if it's in our DB and routes match, it should work
       // Since we're already running in this Worker, we can assume it's configured
-      const { getDomainByRoutingPath } = await import('../db/domains');
       let routePath = route.replace(/\/?\*$/, '').replace(/\/$/, '');
       if (!routePath.startsWith('/')) {
         routePath = '/' + routePath;
@@ -220,6 +220,7 @@ export interface Env {
   ANALYTICS_ENGINE_THRESHOLD_DAYS?: string; // Days threshold for using Analytics Engine (default: "89")
   ANALYTICS_AGGREGATION_THRESHOLD_DAYS?: string; // Days threshold for aggregation (default: "90")
   ANALYTICS_AGGREGATION_ENABLED?: string; // "true" or "false" (default: check settings table)
+  ANALYTICS_BACKFILL_CONCURRENCY?: string; // Dates aggregated in parallel during backfill (default: "3")
   // Rate limiting (optional - defaults will be used if not set)
   RATE_LIMIT_API_KEY?: string; // Default: 100 requests/minute
   RATE_LIMIT_USER?: string; // Default: 100 requests/minute
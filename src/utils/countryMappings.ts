@@ -344,6 +344,23 @@ export const COUNTRY_MAPPINGS: Record<string, string> = {
   'ivorycoast': 'CI',
 };
 
+// All suffixes detectCountryCode recognizes and strips; built once at module
+// load so per-header classification is suffix strip + dict lookups only
+const HEADER_SUFFIXES = [
+  ' url',   // "United States URL"
+  ' link',  // "United States Link"
+  ' page',  // "United States Page"
+  '_url',   // "united_states_url" or "us_url"
+  '_link',  // "united_states_link" or "us_link"
+  '_page',  // "united_states_page"
+  '-url',   // "united-states-url" or "us-url"
+  '-link',  // "united-states-link"
+  '-page',  // "united-states-page"
+  'url',    // "unitedstatesurl" (no separator)
+  'link',   // "unitedstateslink"
+  'page',   // "unitedstatespage"
+];
+
 /**
  * Detects country code from a column header
  * Supports all naming patterns: spaces, underscores, hyphens, suffixes, etc.
@@ -351,26 +368,10 @@ export const COUNTRY_MAPPINGS: Record<string, string> = {
 export function detectCountryCode(header: string): string | null {
   const original = header.trim();
   let clean = original.toLowerCase();
-  
-  // All suffixes to recognize and strip
-  const suffixes = [
-    ' url',   // "United States URL"
-    ' link',  // "United States Link"
-    ' page',  // "United States Page"
-    '_url',   // "united_states_url" or "us_url"
-    '_link',  // "united_states_link" or "us_link"
-    '_page',  // "united_states_page"
-    '-url',   // "united-states-url" or "us-url"
-    '-link',  // "united-states-link"
-    '-page',  // "united-states-page"
-    'url',    // "unitedstatesurl" (no separator)
-    'link',   // "unitedstateslink"
-    'page',   // "unitedstatespage"
-  ];
-  
+
   // Try removing each suffix
   let withoutSuffix = clean;
-  for (const suffix of suffixes) {
+  for (const suffix of HEADER_SUFFIXES) {
     if (clean.endsWith(suffix)) {
       withoutSuffix = clean.slice(0, -suffix.length).trim();
       // Remove trailing separator if any
@@ -413,144 +414,146 @@ export function detectCountryCode(header: string): string | null {
   return null;
 }
 
+// Hoisted so the ~130-entry table is built once at module load instead of
+// being reallocated on every getCountryName call
+const COUNTRY_NAMES: Record<string, string> = {
+  'US': 'United States',
+  'GB': 'United Kingdom',
+  'CA': 'Canada',
+  'AU': 'Australia',
+  'DE': 'Germany',
+  'FR': 'France',
+  'IT': 'Italy',
+  'ES': 'Spain',
+  'JP': 'Japan',
+  'CN': 'China',
+  'IN': 'India',
+  'BR': 'Brazil',
+  'MX': 'Mexico',
+  'NL': 'Netherlands',
+  'SE': 'Sweden',
+  'NO': 'Norway',
+  'DK': 'Denmark',
+  'FI': 'Finland',
+  'PL': 'Poland',
+  'RU': 'Russia',
+  'KR': 'South Korea',
+  'TR': 'Turkey',
+  'SA': 'Saudi Arabia',
+  'AE': 'United Arab Emirates',
+  'IL': 'Israel',
+  'EG': 'Egypt',
+  'ZA': 'South Africa',
+  'NZ': 'New Zealand',
+  'SG': 'Singapore',
+  'HK': 'Hong Kong',
+  'MY': 'Malaysia',
+  'TH': 'Thailand',
+  'ID': 'Indonesia',
+  'PH': 'Philippines',
+  'VN': 'Vietnam',
+  'AR': 'Argentina',
+  'CL': 'Chile',
+  'CO': 'Colombia',
+  'VE': 'Venezuela',
+  'PE': 'Peru',
+  'AT': 'Austria',
+  'BE': 'Belgium',
+  'CH': 'Switzerland',
+  'CZ': 'Czech Republic',
+  'GR': 'Greece',
+  'IE': 'Ireland',
+  'PT': 'Portugal',
+  'RO': 'Romania',
+  'HU': 'Hungary',
+  'BG': 'Bulgaria',
+  'SK': 'Slovakia',
+  'HR': 'Croatia',
+  'SI': 'Slovenia',
+  'LT': 'Lithuania',
+  'LV': 'Latvia',
+  'EE': 'Estonia',
+  'UA': 'Ukraine',
+  'BY': 'Belarus',
+  'RS': 'Serbia',
+  'BA': 'Bosnia and Herzegovina',
+  'MK': 'Macedonia',
+  'AL': 'Albania',
+  'IS': 'Iceland',
+  'LU': 'Luxembourg',
+  'MT': 'Malta',
+  'CY': 'Cyprus',
+  'NG': 'Nigeria',
+  'KE': 'Kenya',
+  'GH': 'Ghana',
+  'TZ': 'Tanzania',
+  'UG': 'Uganda',
+  'ET': 'Ethiopia',
+  'MA': 'Morocco',
+  'DZ': 'Algeria',
+  'TN': 'Tunisia',
+  'LY': 'Libya',
+  'SD': 'Sudan',
+  'AO': 'Angola',
+  'MZ': 'Mozambique',
+  'ZW': 'Zimbabwe',
+  'BW': 'Botswana',
+  'NA': 'Namibia',
+  'MW': 'Malawi',
+  'ZM': 'Zambia',
+  'SN': 'Senegal',
+  'CI': 'Ivory Coast',
+  'CM': 'Cameroon',
+  'BD': 'Bangladesh',
+  'PK': 'Pakistan',
+  'LK': 'Sri Lanka',
+  'NP': 'Nepal',
+  'MM': 'Myanmar',
+  'KH': 'Cambodia',
+  'LA': 'Laos',
+  'MN': 'Mongolia',
+  'KZ': 'Kazakhstan',
+  'UZ': 'Uzbekistan',
+  'GE': 'Georgia',
+  'AM': 'Armenia',
+  'AZ': 'Azerbaijan',
+  'IQ': 'Iraq',
+  'IR': 'Iran',
+  'JO': 'Jordan',
+  'KW': 'Kuwait',
+  'LB': 'Lebanon',
+  'OM': 'Oman',
+  'QA': 'Qatar',
+  'SY': 'Syria',
+  'YE': 'Yemen',
+  'BH': 'Bahrain',
+  'EC': 'Ecuador',
+  'UY': 'Uruguay',
+  'PY': 'Paraguay',
+  'BO': 'Bolivia',
+  'CR': 'Costa Rica',
+  'PA': 'Panama',
+  'GT': 'Guatemala',
+  'HN': 'Honduras',
+  'NI': 'Nicaragua',
+  'SV': 'El Salvador',
+  'DO': 'Dominican Republic',
+  'CU': 'Cuba',
+  'JM': 'Jamaica',
+  'TT': 'Trinidad and Tobago',
+  'BS': 'Bahamas',
+  'BB': 'Barbados',
+  'GY': 'Guyana',
+  'SR': 'Suriname',
+  'BZ': 'Belize',
+  'FJ': 'Fiji',
+  'PG': 'Papua New Guinea',
+};
+
 /**
  * Get human-readable country name from ISO code
  */
 export function getCountryName(countryCode: string): string {
-  const countryNames: Record<string, string> = {
-    'US': 'United States',
-    'GB': 'United Kingdom',
-    'CA': 'Canada',
-    'AU': 'Australia',
-    'DE': 'Germany',
-    'FR': 'France',
-    'IT': 'Italy',
-    'ES': 'Spain',
-    'JP': 'Japan',
-    'CN': 'China',
-    'IN': 'India',
-    'BR': 'Brazil',
-    'MX': 'Mexico',
-    'NL': 'Netherlands',
-    'SE': 'Sweden',
-    'NO': 'Norway',
-    'DK': 'Denmark',
-    'FI': 'Finland',
-    'PL': 'Poland',
-    'RU': 'Russia',
-    'KR': 'South Korea',
-    'TR': 'Turkey',
-    'SA': 'Saudi Arabia',
-    'AE': 'United Arab Emirates',
-    'IL': 'Israel',
-    'EG': 'Egypt',
-    'ZA': 'South Africa',
-    'NZ': 'New Zealand',
-    'SG': 'Singapore',
-    'HK': 'Hong Kong',
-    'MY': 'Malaysia',
-    'TH': 'Thailand',
-    'ID': 'Indonesia',
-    'PH': 'Philippines',
-    'VN': 'Vietnam',
-    'AR': 'Argentina',
-    'CL': 'Chile',
-    'CO': 'Colombia',
-    'VE': 'Venezuela',
-    'PE': 'Peru',
-    'AT': 'Austria',
-    'BE': 'Belgium',
-    'CH': 'Switzerland',
-    'CZ': 'Czech Republic',
-    'GR': 'Greece',
-    'IE': 'Ireland',
-    'PT': 'Portugal',
-    'RO': 'Romania',
-    'HU': 'Hungary',
-    'BG': 'Bulgaria',
-    'SK': 'Slovakia',
-    'HR': 'Croatia',
-    'SI': 'Slovenia',
-    'LT': 'Lithuania',
-    'LV': 'Latvia',
-    'EE': 'Estonia',
-    'UA': 'Ukraine',
-    'BY': 'Belarus',
-    'RS': 'Serbia',
-    'BA': 'Bosnia and Herzegovina',
-    'MK': 'Macedonia',
-    'AL': 'Albania',
-    'IS': 'Iceland',
-    'LU': 'Luxembourg',
-    'MT': 'Malta',
-    'CY': 'Cyprus',
-    'NG': 'Nigeria',
-    'KE': 'Kenya',
-    'GH': 'Ghana',
-    'TZ': 'Tanzania',
-    'UG': 'Uganda',
-    'ET': 'Ethiopia',
-    'MA': 'Morocco',
-    'DZ': 'Algeria',
-    'TN': 'Tunisia',
-    'LY': 'Libya',
-    'SD': 'Sudan',
-    'AO': 'Angola',
-    'MZ': 'Mozambique',
-    'ZW': 'Zimbabwe',
-    'BW': 'Botswana',
-    'NA': 'Namibia',
-    'MW': 'Malawi',
-    'ZM': 'Zambia',
-    'SN': 'Senegal',
-    'CI': 'Ivory Coast',
-    'CM': 'Cameroon',
-    'BD': 'Bangladesh',
-    'PK': 'Pakistan',
-    'LK': 'Sri Lanka',
-    'NP': 'Nepal',
-    'MM': 'Myanmar',
-    'KH': 'Cambodia',
-    'LA': 'Laos',
-    'MN': 'Mongolia',
-    'KZ': 'Kazakhstan',
-    'UZ': 'Uzbekistan',
-    'GE': 'Georgia',
-    'AM': 'Armenia',
-    'AZ': 'Azerbaijan',
-    'IQ': 'Iraq',
-    'IR': 'Iran',
-    'JO': 'Jordan',
-    'KW': 'Kuwait',
-    'LB': 'Lebanon',
-    'OM': 'Oman',
-    'QA': 'Qatar',
-    'SY': 'Syria',
-    'YE': 'Yemen',
-    'BH': 'Bahrain',
-    'EC': 'Ecuador',
-    'UY': 'Uruguay',
-    'PY': 'Paraguay',
-    'BO': 'Bolivia',
-    'CR': 'Costa Rica',
-    'PA': 'Panama',
-    'GT': 'Guatemala',
-    'HN': 'Honduras',
-    'NI': 'Nicaragua',
-    'SV': 'El Salvador',
-    'DO': 'Dominican Republic',
-    'CU': 'Cuba',
-    'JM': 'Jamaica',
-    'TT': 'Trinidad and Tobago',
-    'BS': 'Bahamas',
-    'BB': 'Barbados',
-    'GY': 'Guyana',
-    'SR': 'Suriname',
-    'BZ': 'Belize',
-    'FJ': 'Fiji',
-    'PG': 'Papua New Guinea',
-  };
-  
-  return countryNames[countryCode] || countryCode;
+  return COUNTRY_NAMES[countryCode] || countryCode;
 }
 
@@ -1,13 +1,16 @@
 // Cryptographic utilities for password hashing and verification
 
+// Shared encoder set up once at module load; TextEncoder is stateless and
+// hashing/verification each allocated a fresh one per call
+const textEncoder = new TextEncoder();
+
 // Hash password using Web Crypto API (PBKDF2)
 export async function hashPassword(password: string): Promise<string> {
   // Generate a random salt
   const salt = crypto.getRandomValues(new Uint8Array(16));
   
   // Convert password to Uint8Array
-  const encoder = new TextEncoder();
-  const passwordData = encoder.encode(password);
+  const passwordData = textEncoder.encode(password);
   
   // Import key material
   const keyMaterial = await crypto.subtle.importKey(
@@ -50,8 +53,7 @@ export async function verifyPassword(password: string, storedHash: string): Prom
     const hash = new Uint8Array(hashHex.match(/.{1,2}/g)!.map(byte => parseInt(byte, 16)));
     
     // Convert password to Uint8Array
-    const encoder = new TextEncoder();
-    const passwordData = encoder.encode(password);
+    const passwordData = textEncoder.encode(password);
     
     // Import key material
     const keyMaterial = await crypto.subtle.importKey(
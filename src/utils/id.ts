@@ -4,10 +4,15 @@ export function generateId(prefix = ''): string {
   const timestamp = Date.now().toString(36);
   // Use cryptographically secure random bytes instead of Math.random()
   const randomBytes = crypto.getRandomValues(new Uint8Array(5));
-  const random = Array.from(randomBytes)
-    .map(b => b.toString(36).padStart(2, '0'))
-    .join('')
-    .substring(0, 9);
+  // Encode in a plain loop: this runs once per generated row in aggregation
+  // and status-check batches, and the Array.from/map/join chain allocated
+  // three intermediate structures per call for a 9-character string
+  let random = '';
+  for (let i = 0; i < randomBytes.length; i++) {
+    const piece = randomBytes[i].toString(36);
+    random += piece.length < 2 ? '0' + piece : piece;
+  }
+  random = random.substring(0, 9);
   return prefix ? `${prefix}_${timestamp}_${random}` : `${timestamp}_${random}`;
 }
 
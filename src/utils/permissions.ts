@@ -4,32 +4,34 @@ import type { User, Domain, Link, Tag, Category } from '../types';
 import { hasDomainAccess, getUserDomainIds } from '../db/userDomains';
 import type { Env } from '../types';
 
+// Permission matrix - built once at module load as role sets so hasPermission
+// (called on every authorized request, often several times) is two lookups
+// instead of rebuilding the matrix and scanning an array
+const PERMISSIONS: Record<string, Set<string>> = {
+  'manage_users': new Set(['admin']),
+  'manage_domains': new Set(['admin']),
+  'create_links': new Set(['admin', 'user']),
+  'edit_links': new Set(['admin', 'user']),
+  'delete_links': new Set(['admin', 'user']),
+  'view_analytics': new Set(['admin', 'user', 'analyst']),
+  'manage_tags': new Set(['admin', 'user']),
+  'manage_categories': new Set(['admin', 'user']),
+  'manage_api_keys': new Set(['admin']),
+};
+
 /**
  * Check if user has a specific permission based on role
  */
 export function hasPermission(user: User, permission: string): boolean {
   const role = user.role;
-  
+
   // Admin has all permissions
   if (role === 'admin' || role === 'owner') {
     return true;
   }
-  
-  // Permission matrix
-  const permissions: Record<string, string[]> = {
-    'manage_users': ['admin'],
-    'manage_domains': ['admin'],
-    'create_links': ['admin', 'user'],
-    'edit_links': ['admin', 'user'],
-    'delete_links': ['admin', 'user'],
-    'view_analytics': ['admin', 'user', 'analyst'],
-    'manage_tags': ['admin', 'user'],
-    'manage_categories': ['admin', 'user'],
-    'manage_api_keys': ['admin'],
-  };
-  
-  const allowedRoles = permissions[permission] || [];
-  return allowedRoles.includes(role);
+
+  const allowedRoles = PERMISSIONS[permission];
+  return allowedRoles !== undefined && allowedRoles.has(role);
 }
 
 /**
@@ -85,22 +85,17 @@ export function sanitizeHtml(input: unknown): string {
   }
 }
 
-export function sanitizeSearchInput(search: string): string {
-  // Detect SQL injection patterns
-  const sqlInjectionPatterns = [
-    /('|(\-\-)|(;)|(\|\|)|(\*))/, // SQL special characters
-    /(\bOR\b.*=.*)/i, // OR with equals
-    /(\bAND\b.*=.*)/i, // AND with equals
-    /(UNION.*SELECT)/i, // UNION SELECT
-    /(DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\s+(TABLE|DATABASE)/i, // DDL/DML
-    /\/\*.*\*\//,  // SQL comments
-  ];
+// SQL injection detection as a single compiled alternation, so the input is
+// scanned once instead of once per pattern. Branches, in order:
+// special characters / OR with equals / AND with equals / UNION SELECT /
+// DDL-DML on tables or databases / SQL comments. All branches are either
+// case-insensitive or contain no letters, so one /i flag covers them.
+const SQL_INJECTION_PATTERN = /('|(\-\-)|(;)|(\|\|)|(\*))|(\bOR\b.*=.*)|(\bAND\b.*=.*)|(UNION.*SELECT)|((DROP|DELETE|INSERT|UPDATE|ALTER|CREATE)\s+(TABLE|DATABASE))|\/\*.*\*\//i;
 
+export function sanitizeSearchInput(search: string): string {
   // Check for SQL injection patterns
-  for (const pattern of sqlInjectionPatterns) {
-    if (pattern.test(search)) {
-      throw new Error('Invalid search input: potentially malicious pattern detected');
-    }
+  if (SQL_INJECTION_PATTERN.test(search)) {
+    throw new Error('Invalid search input: potentially malicious pattern detected');
   }
 
   // Return sanitized search (trim and limit length)
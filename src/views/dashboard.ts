@@ -1125,7 +1125,13 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     </div>
   </div>
 
-  <script nonce="${nonce}">
+  <script nonce="${nonce}">` + DASHBOARD_STATIC_BODY;
+}
+
+// Everything inside the main dashboard <script> tag (and the closing tags)
+// is static. Render it once at module load instead of re-assembling the
+// ~12k-line script body on every dashboard request.
+const DASHBOARD_STATIC_BODY = `
     // API Client logic moved to /static/dashboard/utils/api-client.js
     
     // ============================================================================
@@ -1457,9 +1463,41 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         updateToggleButton(collapsed);
       });
     }
+    // The .page sections and the domain selector are part of the static
+    // layout, so resolve them once and reuse the handles on every navigation
+    // instead of re-running the queries per page switch
+    let pageElements = null;
+    let domainSelectorElement;
+    const PAGES_WITHOUT_DOMAIN_SELECTOR = new Set([
+      'settings-account-info',
+      'settings-security',
+      'settings-status-check',
+      'settings-analytics-aggregation',
+      'settings-user-management',
+      'settings-audit-log',
+      'help',
+      'domains',
+      'integrations',
+      'manual-integration',
+      'status-monitor',
+      'analytics',
+      'analytics-geography',
+      'analytics-devices',
+      'analytics-referrers',
+      'analytics-utm',
+      'analytics-custom-params',
+      'analytics-os',
+      'analytics-browsers',
+      'link-analytics',
+      'links-by-destination'
+    ]);
+
     async function showPage(pageName) {
       // DEBUG: console.log('showPage called with:', pageName);
-      const pages = document.querySelectorAll('.page');
+      if (pageElements === null) {
+        pageElements = document.querySelectorAll('.page');
+      }
+      const pages = pageElements;
       // DEBUG: console.log('Found', pages.length, 'pages');
       // Hide all pages - remove active class (CSS .page { display: none; } handles hiding)
       pages.forEach(page => {
@@ -1478,35 +1516,14 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         // DEBUG: console.log('Page activated:', pageName);
         
         // Hide domain selector on Settings, Domains, Integrations, Link Monitor, and Analytics pages
-        const domainSelector = document.getElementById('domain-selector');
-        if (domainSelector) {
-          const pagesToHideSelector = [
-            'settings-account-info',
-            'settings-security',
-            'settings-status-check',
-            'settings-analytics-aggregation',
-            'settings-user-management',
-            'settings-audit-log',
-            'help',
-            'domains', 
-            'integrations', 
-            'manual-integration', 
-            'status-monitor',
-            'analytics',
-            'analytics-geography',
-            'analytics-devices',
-            'analytics-referrers',
-            'analytics-utm',
-            'analytics-custom-params',
-            'analytics-os',
-            'analytics-browsers',
-            'link-analytics',
-            'links-by-destination'
-          ];
-          if (pagesToHideSelector.includes(pageName)) {
-            domainSelector.style.display = 'none';
+        if (domainSelectorElement === undefined) {
+          domainSelectorElement = document.getElementById('domain-selector');
+        }
+        if (domainSelectorElement) {
+          if (PAGES_WITHOUT_DOMAIN_SELECTOR.has(pageName)) {
+            domainSelectorElement.style.display = 'none';
           } else {
-            domainSelector.style.display = 'block';
+            domainSelectorElement.style.display = 'block';
           }
         }
         
@@ -1646,6 +1663,50 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         '</tr>';
     }
 
+    // Last-loaded links by id, so single-link mutations can patch their own
+    // table row instead of refetching and re-rendering the whole page
+    let loadedLinksById = {};
+
+    function buildLinkRow(link) {
+      const category = link.category ? '<span class="category-badge" style="background: #e7f3ff; color: #004085; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem;">' + escapeHtml(link.category.name) + '</span>' : '';
+      const titleOrUrl = link.title || link.destination_url;
+      const truncatedTitle = titleOrUrl.substring(0, 50) + (titleOrUrl.length > 50 ? '...' : '');
+      const linkIdEscaped = escapeAttr(link.id);
+      const categoryDisplay = category || '<span style="color: #999;">No category</span>';
+      
+      // Extract route from metadata
+      let route = '';
+      try {
+        if (link.metadata) {
+          const meta = JSON.parse(link.metadata);
+          route = meta.route || '';
+        }
+      } catch (e) {}
+      
+      // Construct short URL
+      const shortUrl = constructShortUrl(link.domain_name, link.slug, route);
+      
+      return '<tr>' +
+        '<td style="width: var(--col-short-url-width, 300px); max-width: var(--col-short-url-width, 300px);">' +
+          '<div style="display: flex; align-items: center; gap: 0.5rem;">' +
+            '<a href="' + escapeAttr(shortUrl) + '" target="_blank" rel="noopener" style="color: var(--primary-color); text-decoration: none; flex: 1; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; min-width: 0;" title="' + escapeAttr(shortUrl) + '">' + escapeHtml(shortUrl) + '</a>' +
+            '<button class="copy-url-btn" data-url="' + escapeAttr(shortUrl) + '" style="background: var(--primary-color); color: white; border: none; cursor: pointer; padding: 0.25rem 0.5rem; font-size: 0.75rem; border-radius: 4px; white-space: nowrap; transition: opacity 0.2s; flex-shrink: 0;" title="Copy to clipboard">Copy</button>' +
+          '</div>' +
+        '</td>' +
+        '<td style="width: var(--col-destination-width, 400px); max-width: var(--col-destination-width, 400px);"><a href="' + escapeAttr(link.destination_url) + '" target="_blank" style="display: block; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;" title="' + escapeAttr(link.destination_url) + '">' + escapeHtml(link.destination_url) + '</a></td>' +
+        '<td>' + (link.click_count || 0) + '</td>' +
+        '<td><span class="status-badge status-' + escapeHtml(link.status) + '">' + escapeHtml(link.status) + '</span></td>' +
+        '<td>' + categoryDisplay + '</td>' +
+        '<td>' + new Date(link.created_at).toLocaleDateString() + '</td>' +
+        '<td>' +
+          '\u003cbutton class=\"btn btn-sm\" data-action=\"edit\" data-link-id=\"' + linkIdEscaped + '\" style=\"margin-right: 0.5rem;\"\u003eEdit\u003c/button\u003e' +
+          '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"qr\" data-link-id=\"' + linkIdEscaped + '\" data-domain=\"' + escapeAttr(link.domain_name || '') + '\" data-slug=\"' + escapeAttr(link.slug || '') + '\" data-route=\"' + escapeAttr(route) + '\" style=\"margin-right: 0.5rem;\"\u003e📱 QR\u003c/button\u003e' +
+          '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"analytics\" data-link-id=\"' + linkIdEscaped + '\" style=\"margin-right: 0.5rem;\"\u003e📊 Analytics\u003c/button\u003e' +
+          '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"delete\" data-link-id=\"' + linkIdEscaped + '\"\u003eDelete\u003c/button\u003e' +
+        '</td>' +
+      '</tr>';
+    }
+
     async function loadLinks(page = null, perPage = null) {
       try {
         showTableLoading('links-tbody');
@@ -1690,45 +1751,9 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         if (links.length === 0) {
           tbody.innerHTML = '<tr><td colspan="7">No links found</td></tr>';
         } else {
-          tbody.innerHTML = links.map(link => {
-            const category = link.category ? '<span class="category-badge" style="background: #e7f3ff; color: #004085; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem;">' + escapeHtml(link.category.name) + '</span>' : '';
-            const titleOrUrl = link.title || link.destination_url;
-            const truncatedTitle = titleOrUrl.substring(0, 50) + (titleOrUrl.length > 50 ? '...' : '');
-            const linkIdEscaped = escapeAttr(link.id);
-            const categoryDisplay = category || '<span style="color: #999;">No category</span>';
-            
-            // Extract route from metadata
-            let route = '';
-            try {
-              if (link.metadata) {
-                const meta = JSON.parse(link.metadata);
-                route = meta.route || '';
-              }
-            } catch (e) {}
-            
-            // Construct short URL
-            const shortUrl = constructShortUrl(link.domain_name, link.slug, route);
-            
-            return '<tr>' +
-              '<td style="width: var(--col-short-url-width, 300px); max-width: var(--col-short-url-width, 300px);">' +
-                '<div style="display: flex; align-items: center; gap: 0.5rem;">' +
-                  '<a href="' + escapeAttr(shortUrl) + '" target="_blank" rel="noopener" style="color: var(--primary-color); text-decoration: none; flex: 1; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; min-width: 0;" title="' + escapeAttr(shortUrl) + '">' + escapeHtml(shortUrl) + '</a>' +
-                  '<button class="copy-url-btn" data-url="' + escapeAttr(shortUrl) + '" style="background: var(--primary-color); color: white; border: none; cursor: pointer; padding: 0.25rem 0.5rem; font-size: 0.75rem; border-radius: 4px; white-space: nowrap; transition: opacity 0.2s; flex-shrink: 0;" title="Copy to clipboard">Copy</button>' +
-                '</div>' +
-              '</td>' +
-              '<td style="width: var(--col-destination-width, 400px); max-width: var(--col-destination-width, 400px);"><a href="' + escapeAttr(link.destination_url) + '" target="_blank" style="display: block; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;" title="' + escapeAttr(link.destination_url) + '">' + escapeHtml(link.destination_url) + '</a></td>' +
-              '<td>' + (link.click_count || 0) + '</td>' +
-              '<td><span class="status-badge status-' + escapeHtml(link.status) + '">' + escapeHtml(link.status) + '</span></td>' +
-              '<td>' + categoryDisplay + '</td>' +
-              '<td>' + new Date(link.created_at).toLocaleDateString() + '</td>' +
-              '<td>' +
-                '\u003cbutton class=\"btn btn-sm\" data-action=\"edit\" data-link-id=\"' + linkIdEscaped + '\" style=\"margin-right: 0.5rem;\"\u003eEdit\u003c/button\u003e' +
-                '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"qr\" data-link-id=\"' + linkIdEscaped + '\" data-domain=\"' + escapeAttr(link.domain_name || '') + '\" data-slug=\"' + escapeAttr(link.slug || '') + '\" data-route=\"' + escapeAttr(route) + '\" style=\"margin-right: 0.5rem;\"\u003e📱 QR\u003c/button\u003e' +
-                '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"analytics\" data-link-id=\"' + linkIdEscaped + '\" style=\"margin-right: 0.5rem;\"\u003e📊 Analytics\u003c/button\u003e' +
-                '\u003cbutton class=\"btn btn-sm btn-secondary\" data-action=\"delete\" data-link-id=\"' + linkIdEscaped + '\"\u003eDelete\u003c/button\u003e' +
-              '</td>' +
-            '</tr>';
-          }).join('');
+          loadedLinksById = {};
+          links.forEach(link => { loadedLinksById[link.id] = link; });
+          tbody.innerHTML = links.map(buildLinkRow).join('');
           
           // Attach event delegation for button clicks and short URL clicks (CSP-compliant)
           tbody.removeEventListener('click', handleLinkButtonClick);
@@ -1993,11 +2018,38 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       }
     }
     // Utility functions for escaping HTML and attributes
+    const HTML_ESCAPE_MAP = { '&': '&amp;', '<': '&lt;', '>': '&gt;' };
+
+    // Analytics panels re-render by replacing innerHTML, which discards the
+    // canvas but leaves the Chart instance (and its resize observers) alive in
+    // Chart.js's registry. Reap any chart whose canvas is no longer in the
+    // document before creating a new one, so long sessions don't accumulate
+    // orphaned instances.
+    function destroyDetachedCharts() {
+      if (typeof Chart === 'undefined') return;
+      Object.values(Chart.instances).forEach((chart) => {
+        if (!chart.canvas || !chart.canvas.isConnected) {
+          chart.destroy();
+        }
+      });
+    }
+
+    // Shared number formatter: every analytics table and metric card formats
+    // click counts, and each bare toLocaleString() call constructs a fresh
+    // Intl.NumberFormat under the hood - build one and reuse it
+    const countFormatter = new Intl.NumberFormat();
+    function formatCount(value) {
+      return countFormatter.format(value || 0);
+    }
+
     function escapeHtml(text) {
       if (!text) return '';
-      const div = document.createElement('div');
-      div.textContent = text;
-      return div.innerHTML;
+      // Plain string replacement; the old implementation allocated a detached
+      // div and did a textContent/innerHTML round-trip through the DOM for
+      // every escaped value (same & < > output, quotes untouched either way)
+      return String(text).replace(/[&<>]/g, function (char) {
+        return HTML_ESCAPE_MAP[char];
+      });
     }
     
     // Note: escapeAttr is defined once in the tag/category section (around line 3080)
@@ -2083,29 +2135,32 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // Edit link function
     async function editLink(linkId) {
       try {
-        const link = await apiRequest('/links/' + linkId);
+        // The link, domain list, categories and tags come from independent
+        // endpoints (categories/tags filter on the global domain selector,
+        // not the modal field), so fetch all four in one round instead of
+        // serializing the modal open on four back-to-back requests
+        const [link] = await Promise.all([
+          apiRequest('/links/' + linkId),
+          loadDomainsForSelect(),
+          loadCategories(),
+          loadTags(),
+        ]);
         const modal = document.getElementById('create-link-modal');
         const form = document.getElementById('create-link-form');
         const title = modal.querySelector('h2');
-        
+
         title.textContent = 'Edit Link';
         const submitBtn = document.getElementById('submit-link-btn');
         if (submitBtn) submitBtn.textContent = 'Save Edit';
-        
-        // Set domain first (needed for loading categories/tags filtered by domain)
-        await loadDomainsForSelect();
+
         document.getElementById('link-domain').value = link.data.domain_id;
         document.getElementById('link-domain').disabled = true; // Domain cannot be changed
         // Show domain help text
         document.getElementById('domain-help-text').style.display = 'block';
         // Trigger route update
         updateRouteOptions(link.data.domain_id);
-        
-        // Load categories and tags BEFORE setting values
-        await loadCategories();
-        await loadTags();
-        
-        // Now set form fields
+
+        // Now set form fields (categories and tags are already loaded above)
         document.getElementById('link-slug').value = link.data.slug;
         document.getElementById('link-slug').disabled = true; // Slug cannot be changed
         // Show slug help text
@@ -2201,7 +2256,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
               formData.device_redirects = [];
             }
             
-            await apiRequest('/links/' + linkId, { method: 'PUT', body: JSON.stringify(formData) });
+            const updateResponse = await apiRequest('/links/' + linkId, { method: 'PUT', body: JSON.stringify(formData) });
             modal.classList.remove('active');
             // Reset modal state after successful edit
             form.reset();
@@ -2225,7 +2280,18 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             const submitBtn = document.getElementById('submit-link-btn');
             if (submitBtn) submitBtn.textContent = 'Create Link';
             form.onsubmit = async (e) => { e.preventDefault(); await createLink(); };
-            await loadLinks();
+
+            // Only this link can have changed: patch its table row in place
+            // and fall back to a full reload only if the row isn't on screen
+            const existing = loadedLinksById[linkId];
+            const editBtn = document.querySelector('#links-tbody [data-action="edit"][data-link-id="' + linkId + '"]');
+            const row = editBtn ? editBtn.closest('tr') : null;
+            if (existing && updateResponse && updateResponse.data && row) {
+              Object.assign(existing, updateResponse.data);
+              row.outerHTML = buildLinkRow(existing);
+            } else {
+              await loadLinks();
+            }
             showToast('Link updated successfully!', 'success');
           } catch (error) {
             showToast('Failed to update link: ' + error.message, 'error');
@@ -2257,6 +2323,22 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // ============================================================================
     
     // Check authentication on load
+    // Shared current-user lookup. Ten init/page loaders each asked the API
+    // for /auth/me even though the answer is fixed for the life of the page
+    // (role changes require a re-login); fetch it once and hand the same
+    // promise to every caller. A failed fetch clears the memo so the next
+    // caller retries instead of caching the error.
+    let currentUserPromise = null;
+    function fetchCurrentUser() {
+      if (currentUserPromise === null) {
+        currentUserPromise = apiRequest('/auth/me').catch((error) => {
+          currentUserPromise = null;
+          throw error;
+        });
+      }
+      return currentUserPromise;
+    }
+
     async function checkAuth() {
       try {
         const token = getAuthToken();
@@ -2314,7 +2396,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // Update UI visibility based on user role
     async function updateUIVisibilityByRole() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         
@@ -2398,6 +2480,13 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           loadLinks(1); // Reset to page 1 on search
         }, 500);
       });
+      // Enter commits the search immediately instead of waiting out the debounce
+      searchInput?.addEventListener('keydown', (e) => {
+        if (e.key === 'Enter') {
+          clearTimeout(searchTimeout);
+          loadLinks(1);
+        }
+      });
       
       // Tag and category filters are now handled by searchable dropdowns
       initSearchableDropdowns();
@@ -2428,6 +2517,12 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           loadTagsManagement(1); // Reset to page 1 on search
         }, 300);
       });
+      tagsSearch?.addEventListener('keydown', (e) => {
+        if (e.key === 'Enter') {
+          clearTimeout(tagsSearchTimeout);
+          loadTagsManagement(1);
+        }
+      });
       
       const categoriesSearch = document.getElementById('categories-search');
       let categoriesSearchTimeout;
@@ -2437,6 +2532,12 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           loadCategoriesManagement(1); // Reset to page 1 on search
         }, 300);
       });
+      categoriesSearch?.addEventListener('keydown', (e) => {
+        if (e.key === 'Enter') {
+          clearTimeout(categoriesSearchTimeout);
+          loadCategoriesManagement(1);
+        }
+      });
     }
     
     // Tags and Categories management
@@ -2444,6 +2545,10 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     let allTagsForFilter = []; // All tags across all domains for filter dropdown
     let allCategories = [];
     let selectedTags = [];
+    // Id set mirroring selectedTags, maintained by updateTagsUI after every
+    // mutation so the autocomplete can test membership in O(1) per tag
+    // instead of scanning selectedTags for each candidate on each keystroke
+    let selectedTagIds = new Set();
     
     // Geo and Device redirects management
     let geoRedirectCount = 0;
@@ -2684,9 +2789,11 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     }
     
     function updateTagsUI() {
+      selectedTagIds = new Set(selectedTags.map(t => t.id));
+
       const container = document.getElementById('link-tags-container');
       if (!container) return;
-      
+
       container.innerHTML = selectedTags.map(tag => 
         '<span class="tag-badge" style="background: ' + (tag.color || '#007bff') + '; color: white; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.75rem; cursor: pointer;" data-tag-id="' + tag.id + '" onclick="removeTag(this.dataset.tagId)">' +
           tag.name + ' ×' +
@@ -2808,11 +2915,15 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           filterDropdownItems(tagSearch, tagDropdown);
         });
         
+        // Keep focus on the input while clicking a dropdown item so the item's
+        // click handler fires, then hide immediately on blur (event-driven
+        // instead of a 200ms timer race)
+        tagDropdown.addEventListener('mousedown', (e) => {
+          e.preventDefault();
+        });
+
         tagSearch.addEventListener('blur', () => {
-          // Delay to allow click on dropdown item
-          setTimeout(() => {
-            tagDropdown.style.display = 'none';
-          }, 200);
+          tagDropdown.style.display = 'none';
         });
         
         // Clear filter when clicking "All Tags"
@@ -2838,11 +2949,14 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           filterDropdownItems(categorySearch, categoryDropdown);
         });
         
+        // Same event-driven hide as the tag dropdown: item clicks keep focus
+        // (and close the dropdown themselves), blur hides immediately
+        categoryDropdown.addEventListener('mousedown', (e) => {
+          e.preventDefault();
+        });
+
         categorySearch.addEventListener('blur', () => {
-          // Delay to allow click on dropdown item
-          setTimeout(() => {
-            categoryDropdown.style.display = 'none';
-          }, 200);
+          categoryDropdown.style.display = 'none';
         });
         
         // Allow clearing filter by clicking when empty
@@ -2863,16 +2977,40 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       });
     }
     
+    // Lowercase text index per searchable dropdown. A MutationObserver
+    // registered once per dropdown rebuilds the index whenever its items are
+    // repopulated, so per-keystroke filtering walks a plain array instead of
+    // re-querying the DOM and re-reading textContent for every item
+    const dropdownItemIndex = new WeakMap();
+
+    function indexDropdownItems(dropdown) {
+      const index = [];
+      dropdown.querySelectorAll('.dropdown-item').forEach(item => {
+        index.push({ item: item, text: item.textContent.toLowerCase() });
+      });
+      dropdownItemIndex.set(dropdown, index);
+      return index;
+    }
+
+    function getDropdownItemIndex(dropdown) {
+      let index = dropdownItemIndex.get(dropdown);
+      if (!index) {
+        index = indexDropdownItems(dropdown);
+        new MutationObserver(() => {
+          indexDropdownItems(dropdown);
+        }).observe(dropdown, { childList: true });
+      }
+      return index;
+    }
+
     function filterDropdownItems(searchInput, dropdown) {
       const searchValue = searchInput.value.toLowerCase();
-      const items = dropdown.querySelectorAll('.dropdown-item');
-      
-      items.forEach(item => {
-        const text = item.textContent.toLowerCase();
-        if (text.includes(searchValue) || searchValue === '') {
-          item.style.display = 'block';
+
+      getDropdownItemIndex(dropdown).forEach(entry => {
+        if (searchValue === '' || entry.text.includes(searchValue)) {
+          entry.item.style.display = 'block';
         } else {
-          item.style.display = 'none';
+          entry.item.style.display = 'none';
         }
       });
     }
@@ -2892,14 +3030,24 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         autocompleteContainer = document.createElement('div');
         autocompleteContainer.id = 'tags-autocomplete';
         autocompleteContainer.style.cssText = 'position: absolute; top: 100%; left: 0; right: 0; background: white; border: 1px solid #ddd; border-radius: 4px; max-height: 200px; overflow-y: auto; z-index: 1000; display: none; box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin-top: 0.25rem;';
+        // Keep the input focused while a suggestion is clicked so blur can
+        // hide the list immediately instead of after a 200ms timer
+        autocompleteContainer.addEventListener('mousedown', (e) => {
+          e.preventDefault();
+        });
         input.parentNode.appendChild(autocompleteContainer);
       }
       
       function showSuggestions(value = '') {
         const searchValue = value.toLowerCase();
+        // Rebuild defensively in case selectedTags was reassigned without
+        // going through updateTagsUI
+        if (selectedTagIds.size !== selectedTags.length) {
+          selectedTagIds = new Set(selectedTags.map(t => t.id));
+        }
         // Filter tags that aren't already selected
         const suggestions = allTags.filter(t => {
-          const isNotSelected = !selectedTags.find(st => st.id === t.id);
+          const isNotSelected = !selectedTagIds.has(t.id);
           const matchesSearch = searchValue === '' || t.name.toLowerCase().includes(searchValue);
           return isNotSelected && matchesSearch;
         });
@@ -2948,7 +3096,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       
       window.selectTagFromAutocomplete = (tagId) => {
         const tag = allTags.find(t => t.id === tagId);
-        if (tag && !selectedTags.find(st => st.id === tag.id)) {
+        if (tag && !selectedTagIds.has(tag.id)) {
           selectedTags.push(tag);
           updateTagsUI();
           input.value = '';
@@ -2966,8 +3114,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         
         // Auto-select if exact match
         if (value.length > 0) {
-        const suggestions = allTags.filter(t => 
-            t.name.toLowerCase() === value && !selectedTags.find(st => st.id === t.id)
+        const suggestions = allTags.filter(t =>
+            t.name.toLowerCase() === value && !selectedTagIds.has(t.id)
         );
           if (suggestions.length === 1) {
           selectedTags.push(suggestions[0]);
@@ -2979,8 +3127,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       });
       
       input.addEventListener('blur', (e) => {
-        // Delay hiding to allow click on suggestions
-        setTimeout(() => hideSuggestions(), 200);
+        hideSuggestions();
       });
       
       input.addEventListener('keydown', async (e) => {
@@ -2991,7 +3138,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           
           // Check if tag exists
           const existing = allTags.find(t => t.name.toLowerCase() === value.toLowerCase());
-          if (existing && !selectedTags.find(st => st.id === existing.id)) {
+          if (existing && !selectedTagIds.has(existing.id)) {
             selectedTags.push(existing);
             updateTagsUI();
             e.target.value = '';
@@ -3079,28 +3226,24 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // Note: escapeHtml is defined earlier in the script
     
     // Escape for HTML attribute values (handles quotes and special chars)
+    // Map used by escapeAttr; newlines map to '' (stripped, matching the old loop)
+    const ATTR_ESCAPE_MAP = {
+      '&': '&amp;',
+      '<': '&lt;',
+      '>': '&gt;',
+      '"': '&quot;',
+      "'": '&#039;',
+      '\\n': '',
+      '\\r': ''
+    };
+
     function escapeAttr(text) {
       if (!text) return '';
-      const str = String(text);
-      let result = '';
-      for (let i = 0; i < str.length; i++) {
-        const char = str[i];
-        const charCode = char.charCodeAt(0);
-        if (char === '&') {
-          result += '&amp;';
-        } else if (char === '<') {
-          result += '&lt;';
-        } else if (char === '>') {
-          result += '&gt;';
-        } else if (char === '"') {
-          result += '&quot;';
-        } else if (charCode === 39) {
-          result += '&#039;';
-        } else if (charCode !== 10 && charCode !== 13) {
-          result += char;
-        }
-      }
-      return result;
+      // Single regex pass: the engine scans in native code instead of a
+      // per-character JS loop (this runs for every cell in the links table)
+      return String(text).replace(/[&<>"'\\n\\r]/g, function (char) {
+        return ATTR_ESCAPE_MAP[char];
+      });
     }
     
     // Sanitize for use in HTML IDs (removes invalid characters)
@@ -3575,6 +3718,16 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     window.saveCategoryEdit = saveCategoryEdit;
     window.cancelCategoryEdit = cancelCategoryEdit;
     
+    // Nav links are static markup; query them once and reuse the list for
+    // every page switch instead of re-walking the DOM per click
+    let cachedNavLinks = null;
+    function setActiveNavLink(page) {
+      if (!cachedNavLinks) cachedNavLinks = document.querySelectorAll('.nav-link');
+      cachedNavLinks.forEach(l => l.classList.remove('active'));
+      const link = document.querySelector('[data-page="' + page + '"]');
+      if (link) link.classList.add('active');
+    }
+    
     function initTagsCategoriesModals() {
       // Tag and category management buttons navigate to pages
       const manageTagsBtn = document.getElementById('manage-tags-btn');
@@ -3583,39 +3736,27 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       manageTagsBtn?.addEventListener('click', () => {
         // Navigate to tags page
         window.location.hash = 'tags';
-        const navLinks = document.querySelectorAll('.nav-link');
-        navLinks.forEach(l => l.classList.remove('active'));
-        const tagsLink = document.querySelector('[data-page="tags"]');
-        if (tagsLink) tagsLink.classList.add('active');
+        setActiveNavLink('tags');
         showPage('tags');
       });
       
       manageCategoriesBtn?.addEventListener('click', () => {
         // Navigate to categories page
         window.location.hash = 'categories';
-        const navLinks = document.querySelectorAll('.nav-link');
-        navLinks.forEach(l => l.classList.remove('active'));
-        const categoriesLink = document.querySelector('[data-page="categories"]');
-        if (categoriesLink) categoriesLink.classList.add('active');
+        setActiveNavLink('categories');
         showPage('categories');
       });
       
       // Back buttons
       document.getElementById('back-to-links-from-tags')?.addEventListener('click', () => {
         window.location.hash = 'dashboard';
-        const navLinks = document.querySelectorAll('.nav-link');
-        navLinks.forEach(l => l.classList.remove('active'));
-        const dashboardLink = document.querySelector('[data-page="dashboard"]');
-        if (dashboardLink) dashboardLink.classList.add('active');
+        setActiveNavLink('dashboard');
         showPage('dashboard');
       });
       
       document.getElementById('back-to-links-from-categories')?.addEventListener('click', () => {
         window.location.hash = 'dashboard';
-        const navLinks = document.querySelectorAll('.nav-link');
-        navLinks.forEach(l => l.classList.remove('active'));
-        const dashboardLink = document.querySelector('[data-page="dashboard"]');
-        if (dashboardLink) dashboardLink.classList.add('active');
+        setActiveNavLink('dashboard');
         showPage('dashboard');
       });
       
@@ -3676,21 +3817,21 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         '</div>';
       }).join('');
       
-      // Attach event listeners to route inputs
-      routesContainer.querySelectorAll('.route-input').forEach(input => {
-        input.addEventListener('input', (e) => {
-          const index = parseInt(e.target.getAttribute('data-index'));
-          domainRoutes[index] = e.target.value;
-        });
-      });
-      
-      // Attach event listeners to remove buttons
-      routesContainer.querySelectorAll('.remove-route-btn').forEach(btn => {
-        btn.addEventListener('click', (e) => {
-          const index = parseInt(e.target.getAttribute('data-index'));
-          domainRoutes.splice(index, 1);
-          renderRoutes();
-        });
+      // Attach event listeners to route inputs and remove buttons
+      // (single querySelectorAll pass, dispatch by class)
+      routesContainer.querySelectorAll('.route-input, .remove-route-btn').forEach(el => {
+        if (el.classList.contains('route-input')) {
+          el.addEventListener('input', (e) => {
+            const index = parseInt(e.target.getAttribute('data-index'));
+            domainRoutes[index] = e.target.value;
+          });
+        } else {
+          el.addEventListener('click', (e) => {
+            const index = parseInt(e.target.getAttribute('data-index'));
+            domainRoutes.splice(index, 1);
+            renderRoutes();
+          });
+        }
       });
     }
     
@@ -3975,7 +4116,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         // Check user role to determine if delete buttons should be shown
         let isAdminOrOwner = false;
         try {
-          const user = await apiRequest('/auth/me');
+          const user = await fetchCurrentUser();
           isAdminOrOwner = user.data?.role === 'owner' || user.data?.role === 'admin';
         } catch (error) {
           console.error('Failed to get user role:', error);
@@ -4152,17 +4293,17 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         metricsRow.innerHTML = [
           '<div class="analytics-card col-span-3">',
             '<h3>📊 Total Clicks</h3>',
-            '<div class="metric-value">' + (summary.total_clicks || 0).toLocaleString() + '</div>',
+            '<div class="metric-value">' + formatCount(summary.total_clicks || 0) + '</div>',
             '<div class="metric-sub">All time clicks</div>',
           '</div>',
           '<div class="analytics-card col-span-3">',
             '<h3>👥 Unique Visitors</h3>',
-            '<div class="metric-value">' + (summary.total_unique_visitors || 0).toLocaleString() + '</div>',
+            '<div class="metric-value">' + formatCount(summary.total_unique_visitors || 0) + '</div>',
             '<div class="metric-sub">Distinct visitors</div>',
           '</div>',
           '<div class="analytics-card col-span-3">',
             '<h3>🔗 Total Links</h3>',
-            '<div class="metric-value">' + (summary.total_links || 0).toLocaleString() + '</div>',
+            '<div class="metric-value">' + formatCount(summary.total_links || 0) + '</div>',
             '<div class="metric-sub">All links</div>',
           '</div>'
         ].join('');
@@ -4475,21 +4616,20 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         dropdown.style.display = 'block';
       });
       
-      // Hide dropdown on blur (with delay for click)
+      // Keep focus on the input while clicking an item (the click handler
+      // below closes the dropdown), then hide immediately on blur instead of
+      // racing a 200ms timer against the click
+      dropdown.addEventListener('mousedown', (e) => {
+        e.preventDefault();
+      });
+
       searchInput.addEventListener('blur', () => {
-        setTimeout(() => {
-          dropdown.style.display = 'none';
-        }, 200);
+        dropdown.style.display = 'none';
       });
       
-      // Filter dropdown items
+      // Filter dropdown items against the cached text index
       searchInput.addEventListener('input', () => {
-        const filter = searchInput.value.toLowerCase();
-        const items = dropdown.querySelectorAll('.dropdown-item');
-        items.forEach(item => {
-          const text = item.textContent.toLowerCase();
-          item.style.display = text.includes(filter) ? 'block' : 'none';
-        });
+        filterDropdownItems(searchInput, dropdown);
       });
       
       // Handle item selection
@@ -4520,20 +4660,21 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         return;
       }
       
-      // Destroy existing chart if it exists
-      if (ctx.chart) {
-        ctx.chart.destroy();
-      }
-      
       // Aggregate data based on breakdown
       const aggregated = aggregateTimeSeries(timeSeries, breakdown);
       // DEBUG: console.log('[RENDER CHART] Aggregated data:', aggregated);
       // DEBUG: console.log('[RENDER CHART] Aggregated length:', aggregated.length);
       
-      const labels = aggregated.map(d => d.label || d.date);
-      const clicksData = aggregated.map(d => d.clicks || 0);
-      const visitorsData = aggregated.map(d => d.unique_visitors || 0);
-      
+      // Extract all three series in one pass instead of three maps
+      const labels = [];
+      const clicksData = [];
+      const visitorsData = [];
+      for (const d of aggregated) {
+        labels.push(d.label || d.date);
+        clicksData.push(d.clicks || 0);
+        visitorsData.push(d.unique_visitors || 0);
+      }
+
       // DEBUG: console.log('[RENDER CHART] Labels:', labels);
       // DEBUG: console.log('[RENDER CHART] Clicks data:', clicksData);
       // DEBUG: console.log('[RENDER CHART] Visitors data:', visitorsData);
@@ -4549,7 +4690,18 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       if (aggregated.length === 0 || (clicksData.every(v => v === 0) && visitorsData.every(v => v === 0))) {
         // DEBUG: console.warn('[RENDER CHART] No data to display');
       }
-      
+
+      // Reuse the existing chart instance: swapping the data and calling
+      // update() only redraws, while destroy + new Chart re-runs full
+      // initialization and layout on every filter change
+      if (ctx.chart) {
+        ctx.chart.data.labels = labels;
+        ctx.chart.data.datasets[0].data = clicksData;
+        ctx.chart.data.datasets[1].data = visitorsData;
+        ctx.chart.update();
+        return;
+      }
+
       ctx.chart = new Chart(ctx, {
         type: 'line',
         data: {
@@ -4606,6 +4758,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         return;
       }
       
+      destroyDetachedCharts();
       new Chart(ctx, {
         type: 'doughnut',
         data: {
@@ -4645,6 +4798,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         return;
       }
       
+      destroyDetachedCharts();
       new Chart(ctx, {
         type: 'doughnut',
         data: {
@@ -4677,7 +4831,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       const html = geography.slice(0, 10).map(g => 
         '<div style="display: flex; justify-content: space-between; padding: 0.5rem; border-bottom: 1px solid var(--border-color);">' +
           '<span>' + (g.country || 'Unknown') + (g.city ? ', ' + g.city : '') + '</span>' +
-          '<span style="font-weight: 600;">' + (g.clicks || 0).toLocaleString() + '</span>' +
+          '<span style="font-weight: 600;">' + formatCount(g.clicks || 0) + '</span>' +
         '</div>'
       ).join('');
       
@@ -4697,7 +4851,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       const html = referrers.slice(0, 10).map(r => 
         '<div style="display: flex; justify-content: space-between; padding: 0.5rem; border-bottom: 1px solid var(--border-color);">' +
           '<span>' + (r.referrer_domain || 'Direct') + '</span>' +
-          '<span style="font-weight: 600;">' + (r.clicks || 0).toLocaleString() + '</span>' +
+          '<span style="font-weight: 600;">' + formatCount(r.clicks || 0) + '</span>' +
         '</div>'
       ).join('');
       
@@ -4721,7 +4875,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             (u.utm_medium ? ' / ' + u.utm_medium : '') + 
             (u.utm_campaign ? ' / ' + u.utm_campaign : '') +
           '</span>' +
-          '<span style="font-weight: 600;">' + (u.clicks || 0).toLocaleString() + '</span>' +
+          '<span style="font-weight: 600;">' + formatCount(u.clicks || 0) + '</span>' +
         '</div>'
       ).join('');
       
@@ -4977,7 +5131,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>Countries/Cities</h3>' +
@@ -4998,7 +5152,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           const tableRows = geography.map(item => {
             const country = escapeHtml(item.country || 'Unknown');
             const city = escapeHtml(item.city || '-');
-            const clicks = item.clicks.toLocaleString();
+            const clicks = formatCount(item.clicks);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + country + '</td><td>' + city + '</td><td>' + clicks + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5017,6 +5171,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           const ctx = document.getElementById('geography-chart');
           if (ctx && typeof Chart !== 'undefined') {
             const top10 = geography.slice(0, 10);
+            destroyDetachedCharts();
             new Chart(ctx, {
               type: 'bar',
               data: {
@@ -5129,7 +5284,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>Device Types</h3>' +
@@ -5149,8 +5304,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             const deviceType = escapeHtml(item.device_type || 'Unknown');
             const browser = escapeHtml(item.browser || 'Unknown');
             const os = escapeHtml(item.os || 'Unknown');
-            const clicks = item.clicks.toLocaleString();
-            const uniqueVisitors = (item.unique_visitors || 0).toLocaleString();
+            const clicks = formatCount(item.clicks);
+            const uniqueVisitors = formatCount(item.unique_visitors || 0);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + deviceType + '</td><td>' + browser + '</td><td>' + os + '</td><td>' + clicks + '</td><td>' + uniqueVisitors + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5175,6 +5330,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           const ctx = document.getElementById('devices-pie-chart');
           if (ctx && typeof Chart !== 'undefined') {
             const deviceTypes = Array.from(deviceTypeMap.entries()).sort((a, b) => b[1] - a[1]);
+            destroyDetachedCharts();
             new Chart(ctx, {
               type: 'pie',
               data: {
@@ -5280,7 +5436,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>Referrer Sources</h3>' +
@@ -5292,7 +5448,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           const referrerRows = referrers.map(item => {
             const domain = escapeHtml(item.referrer_domain || 'direct');
             const category = escapeHtml(item.category || 'other');
-            const clicks = item.clicks.toLocaleString();
+            const clicks = formatCount(item.clicks);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + domain + '</td><td><span class="badge badge-secondary">' + category + '</span></td><td>' + clicks + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5316,6 +5472,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           const ctx = document.getElementById('referrers-chart');
           if (ctx && typeof Chart !== 'undefined') {
             const top10 = referrers.slice(0, 10);
+            destroyDetachedCharts();
             new Chart(ctx, {
               type: 'bar',
               data: {
@@ -5430,7 +5587,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>UTM Campaigns</h3>' +
@@ -5443,8 +5600,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             const source = escapeHtml(item.utm_source || '-');
             const medium = escapeHtml(item.utm_medium || '-');
             const campaign = escapeHtml(item.utm_campaign || '-');
-            const clicks = item.clicks.toLocaleString();
-            const uniqueVisitors = (item.unique_visitors || 0).toLocaleString();
+            const clicks = formatCount(item.clicks);
+            const uniqueVisitors = formatCount(item.unique_visitors || 0);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + source + '</td><td>' + medium + '</td><td>' + campaign + '</td><td>' + clicks + '</td><td>' + uniqueVisitors + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5552,7 +5709,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '</div>' +
           '<div class="breakdown-tabs" id="custom-params-tabs">' +
@@ -5574,8 +5731,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           if (paramData.length > 0) {
             const paramRows = paramData.map(item => {
               const value = escapeHtml(item.param_value || '-');
-              const clicks = item.clicks.toLocaleString();
-              const uniqueVisitors = (item.unique_visitors || 0).toLocaleString();
+              const clicks = formatCount(item.clicks);
+              const uniqueVisitors = formatCount(item.unique_visitors || 0);
               const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
               return '<tr><td>' + value + '</td><td>' + clicks + '</td><td>' + uniqueVisitors + '</td><td>' + percent + '%</td></tr>';
             }).join('');
@@ -5594,11 +5751,14 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
 
         content.innerHTML = html;
 
-        // Tab switching
-        document.querySelectorAll('#custom-params-tabs .breakdown-tab').forEach(tab => {
+        // Tab switching - query tabs and panels once after render instead of
+        // re-querying both lists on every click
+        const paramTabs = document.querySelectorAll('#custom-params-tabs .breakdown-tab');
+        const paramContents = document.querySelectorAll('.custom-param-content');
+        paramTabs.forEach(tab => {
           tab.addEventListener('click', () => {
-            document.querySelectorAll('#custom-params-tabs .breakdown-tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.custom-param-content').forEach(c => c.style.display = 'none');
+            paramTabs.forEach(t => t.classList.remove('active'));
+            paramContents.forEach(c => c.style.display = 'none');
             tab.classList.add('active');
             const param = tab.dataset.param;
             const contentDiv = document.getElementById('custom-params-' + param + '-content');
@@ -5682,7 +5842,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>Operating Systems</h3>' +
@@ -5693,8 +5853,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         if (os.length > 0) {
           const osRows = os.map(item => {
             const osName = escapeHtml(item.os || 'Unknown');
-            const clicks = item.clicks.toLocaleString();
-            const uniqueVisitors = (item.unique_visitors || 0).toLocaleString();
+            const clicks = formatCount(item.clicks);
+            const uniqueVisitors = formatCount(item.unique_visitors || 0);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + osName + '</td><td>' + clicks + '</td><td>' + uniqueVisitors + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5717,6 +5877,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
 
           const ctx = document.getElementById('os-chart');
           if (ctx && typeof Chart !== 'undefined') {
+            destroyDetachedCharts();
             new Chart(ctx, {
               type: 'pie',
               data: {
@@ -5822,7 +5983,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         let html = '<div class="summary-cards">' +
           '<div class="summary-card">' +
           '<h3>Total Clicks</h3>' +
-          '<div class="value">' + totalClicks.toLocaleString() + '</div>' +
+          '<div class="value">' + formatCount(totalClicks) + '</div>' +
           '</div>' +
           '<div class="summary-card">' +
           '<h3>Browsers</h3>' +
@@ -5833,8 +5994,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         if (browsers.length > 0) {
           const browserRows = browsers.map(item => {
             const browserName = escapeHtml(item.browser || 'Unknown');
-            const clicks = item.clicks.toLocaleString();
-            const uniqueVisitors = (item.unique_visitors || 0).toLocaleString();
+            const clicks = formatCount(item.clicks);
+            const uniqueVisitors = formatCount(item.unique_visitors || 0);
             const percent = totalClicks > 0 ? ((item.clicks / totalClicks) * 100).toFixed(2) : 0;
             return '<tr><td>' + browserName + '</td><td>' + clicks + '</td><td>' + uniqueVisitors + '</td><td>' + percent + '%</td></tr>';
           }).join('');
@@ -5857,6 +6018,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
 
           const ctx = document.getElementById('browsers-chart');
           if (ctx && typeof Chart !== 'undefined') {
+            destroyDetachedCharts();
             new Chart(ctx, {
               type: 'doughnut',
               data: {
@@ -5895,7 +6057,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // Settings page loaders - each page loads independently
     async function loadAccountInfoPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         await loadAccountInfoSection(userData);
       } catch (error) {
@@ -5908,7 +6070,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadSecurityPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         await loadSecuritySection(isAdminOrOwner);
@@ -5922,7 +6084,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadStatusCheckPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         if (!isAdminOrOwner) {
@@ -5943,7 +6105,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadAnalyticsAggregationPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         if (!isAdminOrOwner) {
@@ -5964,7 +6126,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadUserManagementPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         if (!isAdminOrOwner) {
@@ -5985,7 +6147,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadAuditLogPage() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         if (!isAdminOrOwner) {
@@ -6007,7 +6169,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     // Initialize settings menu visibility based on user role
     async function initializeSettingsMenuVisibility() {
       try {
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const userData = user.data || {};
         const isAdminOrOwner = userData.role === 'owner' || userData.role === 'admin';
         
@@ -6236,8 +6398,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         html += '<div class="help-box">';
         html += '<strong style="display: block; margin-bottom: 0.5rem;">Current Throughput:</strong>';
         html += '<div style="display: grid; gap: 0.25rem; font-size: 0.9rem;">';
-        html += '<div>Links checked per day: <strong>' + linksPerDay.toLocaleString() + '</strong></div>';
-        html += '<div>Links checked per week: <strong>' + linksPerWeek.toLocaleString() + '</strong></div>';
+        html += '<div>Links checked per day: <strong>' + formatCount(linksPerDay) + '</strong></div>';
+        html += '<div>Links checked per week: <strong>' + formatCount(linksPerWeek) + '</strong></div>';
         html += '</div>';
         html += '</div>';
         
@@ -6882,8 +7044,10 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         // Load and select domains
         loadDomainsForUserModal(domainsList);
         if (domainSelect && userData.domain_ids) {
+          // Set membership instead of an array scan per option
+          const userDomainIds = new Set(userData.domain_ids);
           Array.from(domainSelect.options).forEach(option => {
-            option.selected = userData.domain_ids.includes(option.value);
+            option.selected = userDomainIds.has(option.value);
           });
         }
         
@@ -7019,7 +7183,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         if (!mfaStatusDiv) return;
         
         // Get user info which now includes mfa_enabled
-        const user = await apiRequest('/auth/me');
+        const user = await fetchCurrentUser();
         const mfaEnabled = user.data?.mfa_enabled || false;
         
         if (mfaEnabled) {
@@ -9180,11 +9344,11 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       // Scroll to playground section
       const playgroundSection = document.getElementById('playground-request-builder');
       if (playgroundSection) {
-        playgroundSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
-        // Small delay to ensure form is fully rendered
-        setTimeout(() => {
+        // Scroll after the next layout pass so the freshly populated form is
+        // measured, instead of guessing with a fixed 100ms delay
+        requestAnimationFrame(() => {
           playgroundSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
-        }, 100);
+        });
       }
       
       showToast('Endpoint loaded into playground', 'success');
@@ -9375,8 +9539,10 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         return domains;
       }
       
-      // Filter to only allowed domains
-      return domains.filter(domain => apiKeyInfo.domain_ids.includes(domain.id));
+      // Filter to only allowed domains (Set membership instead of an
+      // array scan per domain)
+      const allowedIds = new Set(apiKeyInfo.domain_ids);
+      return domains.filter(domain => allowedIds.has(domain.id));
     }
     
     function openApiKeySelectionModal() {
@@ -9780,36 +9946,56 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       updateSendButton();
     }
     
+    // updateUrlPreview runs on every keystroke in the playground form. The
+    // param inputs only change when the endpoint form is rebuilt, so cache the
+    // resolved references and re-query only when the endpoint changes or a
+    // cached node is no longer connected to the document (i.e. went stale)
+    let cachedPreviewRefs = null;
+
     window.updateUrlPreview = function() {
       const endpointSelect = document.getElementById('playground-endpoint');
       if (!endpointSelect || !endpointSelect.value) return;
-      
+
       const endpoint = apiEndpoints.find(ep => ep.id === endpointSelect.value);
       if (!endpoint) return;
-      
+
+      let refs = cachedPreviewRefs;
+      const stale = !refs || refs.endpointId !== endpoint.id ||
+        refs.pathInputs.some(entry => !entry.el || !entry.el.isConnected) ||
+        refs.queryInputs.some(entry => !entry.el || !entry.el.isConnected);
+      if (stale) {
+        refs = {
+          endpointId: endpoint.id,
+          pathInputs: endpoint.pathParams.map(param => ({ name: param.name, el: document.getElementById('path-' + param.name) })),
+          queryInputs: endpoint.queryParams.map(param => ({ name: param.name, el: document.getElementById('query-' + param.name) })),
+          urlEl: document.getElementById('playground-url')
+        };
+        cachedPreviewRefs = refs;
+      }
+
       let path = endpoint.path;
-      
+
       // Replace path parameters
-      endpoint.pathParams.forEach(param => {
-        const input = document.getElementById('path-' + param.name);
-        if (input && input.value) {
-          path = path.replace(':' + param.name, input.value);
+      refs.pathInputs.forEach(entry => {
+        if (entry.el && entry.el.value) {
+          path = path.replace(':' + entry.name, entry.el.value);
         }
       });
-      
+
       // Build query string
       const queryParams = [];
-      endpoint.queryParams.forEach(param => {
-        const input = document.getElementById('query-' + param.name);
-        if (input && input.value) {
-          queryParams.push(param.name + '=' + encodeURIComponent(input.value));
+      refs.queryInputs.forEach(entry => {
+        if (entry.el && entry.el.value) {
+          queryParams.push(entry.name + '=' + encodeURIComponent(entry.el.value));
         }
       });
-      
+
       const queryString = queryParams.length > 0 ? '?' + queryParams.join('&') : '';
       const fullUrl = API_BASE + path + queryString;
-      
-      document.getElementById('playground-url').textContent = fullUrl;
+
+      if (refs.urlEl) {
+        refs.urlEl.textContent = fullUrl;
+      }
     };
     
     async function sendPlaygroundRequest() {
@@ -10233,11 +10419,32 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         .replace(/([{}[\],:])/g, '<span class="json-punctuation">$1</span>');
     }
     
+    // In-memory copy of the playground request history. localStorage is
+    // parsed once and the copy is kept in sync by the writers below, so
+    // saving, rendering and replaying requests no longer re-parse the whole
+    // blob on every call. The 'storage' event pushes writes made by other
+    // tabs; outside of that the cached copy is authoritative.
+    const HISTORY_STORAGE_KEY = 'api-playground-history';
+    let playgroundHistory = null;
+
+    function getRequestHistory() {
+      if (playgroundHistory === null) {
+        playgroundHistory = JSON.parse(localStorage.getItem(HISTORY_STORAGE_KEY) || '{"requests":[],"maxItems":50}');
+      }
+      return playgroundHistory;
+    }
+
+    window.addEventListener('storage', (e) => {
+      if (e.key === HISTORY_STORAGE_KEY) {
+        playgroundHistory = null;
+      }
+    });
+
     function saveRequestToHistory(requestData) {
       try {
-        const history = JSON.parse(localStorage.getItem('api-playground-history') || '{"requests":[],"maxItems":50}');
+        const history = getRequestHistory();
         const historyItem = {
-          id: Date.now().toString() + '-' + Math.random().toString(36).substr(2, 9),
+          id: Date.now().toString() + '-' + Math.random().toString(36).slice(2, 11),
           timestamp: Date.now(),
           ...requestData
         };
@@ -10247,7 +10454,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           history.requests = history.requests.slice(0, history.maxItems);
         }
         
-        localStorage.setItem('api-playground-history', JSON.stringify(history));
+        localStorage.setItem(HISTORY_STORAGE_KEY, JSON.stringify(history));
         loadRequestHistory();
       } catch (e) {
         console.error('Failed to save request to history:', e);
@@ -10259,8 +10466,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       if (!historyList) return;
       
       try {
-        const history = JSON.parse(localStorage.getItem('api-playground-history') || '{"requests":[]}');
-        
+        const history = getRequestHistory();
+
         if (history.requests.length === 0) {
           historyList.innerHTML = '<p style="color: #666; text-align: center; padding: 1rem;">No requests yet. Send a request to see history.</p>';
           return;
@@ -10289,7 +10496,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     window.loadRequestFromHistory = function(historyId) {
       try {
-        const history = JSON.parse(localStorage.getItem('api-playground-history') || '{"requests":[]}');
+        const history = getRequestHistory();
         const item = history.requests.find(r => r.id === historyId);
         if (!item) return;
         
@@ -10357,7 +10564,8 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       if (!confirm('Clear all request history?')) return;
       
       try {
-        localStorage.setItem('api-playground-history', JSON.stringify({ requests: [], maxItems: 50 }));
+        playgroundHistory = { requests: [], maxItems: 50 };
+        localStorage.setItem(HISTORY_STORAGE_KEY, JSON.stringify(playgroundHistory));
         loadRequestHistory();
         showToast('History cleared', 'success');
       } catch (e) {
@@ -10848,8 +11056,9 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     };
     
     async function loadStatusMonitor() {
-      await loadStatusSummary();
-      await loadStatusLinks();
+      // The summary cards, link list and domain filter hit independent
+      // endpoints; load them concurrently
+      await Promise.all([loadStatusSummary(), loadStatusLinks()]);
       loadDomainsForStatusFilter();
       
       // Attach event listeners
@@ -10886,6 +11095,14 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             loadStatusLinks();
           }, 500);
         });
+        searchInput.addEventListener('keydown', (e) => {
+          if (e.key === 'Enter') {
+            clearTimeout(searchTimeout);
+            statusMonitorState.searchFilter = e.target.value;
+            statusMonitorState.currentPage = 1;
+            loadStatusLinks();
+          }
+        });
       }
       
       if (perPageSelect) {
@@ -10910,19 +11127,17 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     
     async function loadStatusSummary() {
       try {
-        // Get summary from all status codes
-        const summary = {};
-        const statusCodes = [200, 301, 302, 404, 500];
-        
-        for (const code of statusCodes) {
-          try {
-            const response = await apiRequest('/links/status/' + code + '?limit=1');
-            if (response.status_summary) {
-              Object.assign(summary, response.status_summary);
-            }
-          } catch (e) {
-            // Ignore errors for individual status codes
+        // The status endpoint returns the summary for every status code, so a
+        // single probe carries the whole picture; the code in the URL only
+        // affects the (discarded) link list
+        let summary = {};
+        try {
+          const response = await apiRequest('/links/status/200?limit=1');
+          if (response && response.status_summary) {
+            summary = response.status_summary;
           }
+        } catch (summaryError) {
+          // Leave the cards at zero if the probe fails
         }
         
         // Update summary cards
@@ -11005,29 +11220,12 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         html += '</tbody></table>';
         listDiv.innerHTML = html;
         
-        // Attach event listeners for "View Slugs" buttons
-        const viewSlugsButtons = document.querySelectorAll('.view-slugs-btn');
-        viewSlugsButtons.forEach(btn => {
-          btn.addEventListener('click', () => {
-            const destinationUrl = btn.getAttribute('data-destination-url');
-            if (destinationUrl) {
-              viewSlugsForDestination(destinationUrl);
-            }
-          });
-        });
-        
-        // Attach event listeners for "Edit" buttons (bulk edit)
-        const editDestinationButtons = document.querySelectorAll('.edit-destination-btn');
-        editDestinationButtons.forEach(btn => {
-          btn.addEventListener('click', () => {
-            const destinationUrl = btn.getAttribute('data-destination-url');
-            const linkIds = btn.getAttribute('data-link-ids');
-            if (destinationUrl && linkIds) {
-              editLinkDestinationBulk(destinationUrl, linkIds.split(','));
-            }
-          });
-        });
-        
+        // Delegate button clicks to the list container (matches the links
+        // table pattern) instead of re-querying the document and attaching a
+        // listener per button on every render
+        listDiv.removeEventListener('click', handleStatusListClick);
+        listDiv.addEventListener('click', handleStatusListClick);
+
         updateStatusPagination(pagination);
       } catch (error) {
         console.error('Error loading status links:', error);
@@ -11040,6 +11238,25 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       }
     }
     
+    // Handler for status monitor list button clicks (event delegation)
+    function handleStatusListClick(e) {
+      const target = e.target;
+      if (!target || !target.classList) return;
+
+      if (target.classList.contains('view-slugs-btn')) {
+        const destinationUrl = target.getAttribute('data-destination-url');
+        if (destinationUrl) {
+          viewSlugsForDestination(destinationUrl);
+        }
+      } else if (target.classList.contains('edit-destination-btn')) {
+        const destinationUrl = target.getAttribute('data-destination-url');
+        const linkIds = target.getAttribute('data-link-ids');
+        if (destinationUrl && linkIds) {
+          editLinkDestinationBulk(destinationUrl, linkIds.split(','));
+        }
+      }
+    }
+
     function updateStatusPagination(pagination) {
       const infoDiv = document.getElementById('status-pagination-info');
       
@@ -11123,8 +11340,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         
         showToast('Recheck completed: ' + response.data.checked + ' links checked', 'success');
         statusMonitorState.selectedLinks.clear();
-        await loadStatusSummary();
-        await loadStatusLinks();
+        await Promise.all([loadStatusSummary(), loadStatusLinks()]);
       } catch (error) {
         showToast('Failed to recheck links: ' + error.message, 'error');
       }
@@ -11223,23 +11439,27 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         html += '</tbody></table>';
         listDiv.innerHTML = html;
         
-        // Attach event listeners for Edit Link buttons (CSP-compliant)
-        const editLinkButtons = document.querySelectorAll('.edit-link-btn');
-        editLinkButtons.forEach(btn => {
-          btn.addEventListener('click', () => {
-            const linkId = btn.getAttribute('data-link-id');
-            if (linkId) {
-              editLink(linkId);
-            }
-          });
-        });
-        
+        // Delegate Edit Link button clicks to the container (CSP-compliant)
+        listDiv.removeEventListener('click', handleLinksByDestinationClick);
+        listDiv.addEventListener('click', handleLinksByDestinationClick);
+
         updateLinksByDestinationPagination(pagination);
       } catch (error) {
         listDiv.innerHTML = '<p style="color: #dc3545;">Failed to load links: ' + error.message + '</p>';
       }
     }
     
+    // Handler for links-by-destination list button clicks (event delegation)
+    function handleLinksByDestinationClick(e) {
+      const target = e.target;
+      if (!target || !target.classList || !target.classList.contains('edit-link-btn')) return;
+
+      const linkId = target.getAttribute('data-link-id');
+      if (linkId) {
+        editLink(linkId);
+      }
+    }
+
     function updateLinksByDestinationPagination(pagination) {
       const controlsDiv = document.getElementById('links-by-destination-pagination');
       
@@ -11333,19 +11553,26 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
             saveBtn.textContent = 'Updating...';
             
             try {
-              // Update all links
+              // Update all links with a single bulk request instead of one
+              // PUT per link; the server reports per-link success either way
+              const response = await apiRequest('/links/bulk', {
+                method: 'POST',
+                body: JSON.stringify({
+                  action: 'update',
+                  link_ids: linkIds,
+                  updates: { destination_url: newUrl },
+                }),
+              });
+
+              const results = response?.data || [];
               let successCount = 0;
               let errorCount = 0;
-              
-              for (const linkId of linkIds) {
-                try {
-                  await apiRequest('/links/' + linkId, {
-                    method: 'PUT',
-                    body: JSON.stringify({ destination_url: newUrl }),
-                  });
+
+              for (const result of results) {
+                if (result.success) {
                   successCount++;
-                } catch (error) {
-                  console.error('Failed to update link ' + linkId + ':', error);
+                } else {
+                  console.error('Failed to update link ' + result.id + ':', result.error);
                   errorCount++;
                 }
               }
@@ -11392,19 +11619,18 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     window.toggleDomainStatus = toggleDomainStatus;
     window.editDomain = editDomain;
     
-    document.addEventListener('DOMContentLoaded', async () => {
-      // Initialize settings menu visibility based on user role
-      await initializeSettingsMenuVisibility();
+    async function initDashboard() {
       // DEBUG: console.log('DOM Content Loaded - starting initialization');
-      
-      // Initialize navigation immediately
+
+      // Initialize navigation immediately - local setup should not sit behind
+      // a network round-trip
       try {
         initNavigation();
         // DEBUG: console.log('Navigation initialized');
       } catch (error) {
         console.error('Navigation init error:', error);
       }
-      
+
       // Initialize sidebar toggle
       try {
         initSidebarToggle();
@@ -11412,7 +11638,7 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       } catch (error) {
         console.error('Sidebar toggle init error:', error);
       }
-      
+
       // Check auth
       try {
         const isAuthenticated = await checkAuth();
@@ -11421,9 +11647,12 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
           return; // Will redirect in checkAuth
         }
         // DEBUG: console.log('Authentication successful');
-        
+
         // Update UI visibility based on user role
         await updateUIVisibilityByRole();
+        // Settings menu visibility depends on the same role lookup; run it
+        // once auth has settled rather than before anything else
+        await initializeSettingsMenuVisibility();
       } catch (error) {
         console.error('Auth check error:', error);
         window.location.href = '/dashboard/login';
@@ -11522,8 +11751,17 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
       
       // Don't override hash-based routing - initNavigation already handles initial page load
       // showPage('dashboard'); // Removed - let hash routing handle it
-    });
-    
+    }
+
+    // The script is injected at the end of the body, so by the time it runs
+    // the DOM is usually already parsed - only wait for DOMContentLoaded when
+    // it genuinely hasn't fired yet
+    if (document.readyState === 'loading') {
+      document.addEventListener('DOMContentLoaded', initDashboard);
+    } else {
+      initDashboard();
+    }
+
     // Export links function
     async function exportLinks() {
       try {
@@ -11560,18 +11798,27 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
 
         // 3. Map Data Rows
         const rows = links.map(function(link) {
-          // Helper to get device redirect URL
+          // Index this link's redirects once so the per-column lookups below
+          // are O(1) instead of a linear scan per country/device column
+          const deviceUrls = {};
+          if (link.device_redirects && Array.isArray(link.device_redirects)) {
+            link.device_redirects.forEach(function(d) {
+              if (d.device_type) deviceUrls[d.device_type] = d.destination_url;
+            });
+          }
+          const geoUrls = {};
+          if (link.geo_redirects && Array.isArray(link.geo_redirects)) {
+            link.geo_redirects.forEach(function(g) {
+              if (g.country_code) geoUrls[g.country_code] = g.destination_url;
+            });
+          }
+
           function getDeviceUrl(type) {
-            if (!link.device_redirects || !Array.isArray(link.device_redirects)) return '';
-            const r = link.device_redirects.find(function(d) { return d.device_type === type; });
-            return r ? r.destination_url : '';
+            return deviceUrls[type] || '';
           }
 
-          // Helper to get geo redirect URL
           function getGeoUrl(code) {
-            if (!link.geo_redirects || !Array.isArray(link.geo_redirects)) return '';
-            const r = link.geo_redirects.find(function(g) { return g.country_code === code; });
-            return r ? r.destination_url : '';
+            return geoUrls[code] || '';
           }
 
           // Parse Route from metadata
@@ -11748,41 +11995,58 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
     }
     
     // Country detection helper functions (frontend version)
+    // Tables are built once when the script loads; detectCountryCodeFrontend
+    // and getCountryNameFrontend run per CSV header / per geo row and only
+    // do lookups (mirrors the server-side countryMappings module)
+    const COUNTRY_MAPPINGS_FRONTEND = {
+      'us': 'US', 'gb': 'GB', 'ca': 'CA', 'au': 'AU', 'de': 'DE', 'fr': 'FR', 'it': 'IT', 'es': 'ES',
+      'jp': 'JP', 'cn': 'CN', 'in': 'IN', 'br': 'BR', 'mx': 'MX', 'nl': 'NL', 'se': 'SE', 'no': 'NO',
+      'dk': 'DK', 'fi': 'FI', 'pl': 'PL', 'ru': 'RU', 'kr': 'KR', 'tr': 'TR', 'sa': 'SA', 'ae': 'AE',
+      'il': 'IL', 'eg': 'EG', 'za': 'ZA', 'nz': 'NZ', 'sg': 'SG', 'hk': 'HK', 'my': 'MY', 'th': 'TH',
+      'id': 'ID', 'ph': 'PH', 'vn': 'VN', 'ar': 'AR', 'cl': 'CL', 'co': 'CO', 've': 'VE', 'pe': 'PE',
+      'at': 'AT', 'be': 'BE', 'ch': 'CH', 'cz': 'CZ', 'gr': 'GR', 'ie': 'IE', 'pt': 'PT',
+      'usa': 'US', 'uk': 'GB', 'britain': 'GB', 'england': 'GB', 'deutschland': 'DE', 'korea': 'KR',
+      'united states': 'US', 'united kingdom': 'GB', 'canada': 'CA', 'australia': 'AU', 'germany': 'DE',
+      'france': 'FR', 'italy': 'IT', 'spain': 'ES', 'japan': 'JP', 'china': 'CN', 'india': 'IN',
+      'brazil': 'BR', 'mexico': 'MX', 'netherlands': 'NL', 'sweden': 'SE', 'norway': 'NO', 'denmark': 'DK',
+      'finland': 'FI', 'poland': 'PL', 'russia': 'RU', 'south korea': 'KR', 'turkey': 'TR',
+      'saudi arabia': 'SA', 'united arab emirates': 'AE', 'israel': 'IL', 'egypt': 'EG',
+      'south africa': 'ZA', 'new zealand': 'NZ', 'singapore': 'SG', 'hong kong': 'HK',
+      'malaysia': 'MY', 'thailand': 'TH', 'indonesia': 'ID', 'philippines': 'PH', 'vietnam': 'VN',
+      'argentina': 'AR', 'chile': 'CL', 'colombia': 'CO', 'venezuela': 'VE', 'peru': 'PE',
+      'austria': 'AT', 'belgium': 'BE', 'switzerland': 'CH', 'czech republic': 'CZ',
+      'greece': 'GR', 'ireland': 'IE', 'portugal': 'PT',
+      'united_states': 'US', 'united_kingdom': 'GB', 'south_korea': 'KR', 'new_zealand': 'NZ',
+      'saudi_arabia': 'SA', 'united_arab_emirates': 'AE', 'south_africa': 'ZA', 'hong_kong': 'HK',
+      'czech_republic': 'CZ', 'united-states': 'US', 'united-kingdom': 'GB', 'south-korea': 'KR',
+      'new-zealand': 'NZ', 'saudi-arabia': 'SA', 'united-arab-emirates': 'AE', 'south-africa': 'ZA',
+      'hong-kong': 'HK', 'czech-republic': 'CZ', 'unitedstates': 'US', 'unitedkingdom': 'GB',
+      'southkorea': 'KR', 'newzealand': 'NZ', 'saudiarabia': 'SA', 'unitedarabemirates': 'AE',
+      'southafrica': 'ZA', 'hongkong': 'HK', 'czechrepublic': 'CZ',
+    };
+
+    const COUNTRY_HEADER_SUFFIXES = [' url', ' link', ' page', '_url', '_link', '_page', '-url', '-link', '-page', 'url', 'link', 'page'];
+
+    const COUNTRY_NAMES_FRONTEND = {
+      'US': 'United States', 'GB': 'United Kingdom', 'CA': 'Canada', 'AU': 'Australia',
+      'DE': 'Germany', 'FR': 'France', 'IT': 'Italy', 'ES': 'Spain', 'JP': 'Japan',
+      'CN': 'China', 'IN': 'India', 'BR': 'Brazil', 'MX': 'Mexico', 'NL': 'Netherlands',
+      'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark', 'FI': 'Finland', 'PL': 'Poland',
+      'RU': 'Russia', 'KR': 'South Korea', 'TR': 'Turkey', 'SA': 'Saudi Arabia',
+      'AE': 'United Arab Emirates', 'IL': 'Israel', 'EG': 'Egypt', 'ZA': 'South Africa',
+      'NZ': 'New Zealand', 'SG': 'Singapore', 'HK': 'Hong Kong', 'MY': 'Malaysia',
+      'TH': 'Thailand', 'ID': 'Indonesia', 'PH': 'Philippines', 'VN': 'Vietnam',
+      'AR': 'Argentina', 'CL': 'Chile', 'CO': 'Colombia', 'VE': 'Venezuela', 'PE': 'Peru',
+      'AT': 'Austria', 'BE': 'Belgium', 'CH': 'Switzerland', 'CZ': 'Czech Republic',
+      'GR': 'Greece', 'IE': 'Ireland', 'PT': 'Portugal',
+    };
+
     function detectCountryCodeFrontend(header) {
-      const countryMappings = {
-        'us': 'US', 'gb': 'GB', 'ca': 'CA', 'au': 'AU', 'de': 'DE', 'fr': 'FR', 'it': 'IT', 'es': 'ES',
-        'jp': 'JP', 'cn': 'CN', 'in': 'IN', 'br': 'BR', 'mx': 'MX', 'nl': 'NL', 'se': 'SE', 'no': 'NO',
-        'dk': 'DK', 'fi': 'FI', 'pl': 'PL', 'ru': 'RU', 'kr': 'KR', 'tr': 'TR', 'sa': 'SA', 'ae': 'AE',
-        'il': 'IL', 'eg': 'EG', 'za': 'ZA', 'nz': 'NZ', 'sg': 'SG', 'hk': 'HK', 'my': 'MY', 'th': 'TH',
-        'id': 'ID', 'ph': 'PH', 'vn': 'VN', 'ar': 'AR', 'cl': 'CL', 'co': 'CO', 've': 'VE', 'pe': 'PE',
-        'at': 'AT', 'be': 'BE', 'ch': 'CH', 'cz': 'CZ', 'gr': 'GR', 'ie': 'IE', 'pt': 'PT',
-        'usa': 'US', 'uk': 'GB', 'britain': 'GB', 'england': 'GB', 'deutschland': 'DE', 'korea': 'KR',
-        'united states': 'US', 'united kingdom': 'GB', 'canada': 'CA', 'australia': 'AU', 'germany': 'DE',
-        'france': 'FR', 'italy': 'IT', 'spain': 'ES', 'japan': 'JP', 'china': 'CN', 'india': 'IN',
-        'brazil': 'BR', 'mexico': 'MX', 'netherlands': 'NL', 'sweden': 'SE', 'norway': 'NO', 'denmark': 'DK',
-        'finland': 'FI', 'poland': 'PL', 'russia': 'RU', 'south korea': 'KR', 'turkey': 'TR',
-        'saudi arabia': 'SA', 'united arab emirates': 'AE', 'israel': 'IL', 'egypt': 'EG',
-        'south africa': 'ZA', 'new zealand': 'NZ', 'singapore': 'SG', 'hong kong': 'HK',
-        'malaysia': 'MY', 'thailand': 'TH', 'indonesia': 'ID', 'philippines': 'PH', 'vietnam': 'VN',
-        'argentina': 'AR', 'chile': 'CL', 'colombia': 'CO', 'venezuela': 'VE', 'peru': 'PE',
-        'austria': 'AT', 'belgium': 'BE', 'switzerland': 'CH', 'czech republic': 'CZ',
-        'greece': 'GR', 'ireland': 'IE', 'portugal': 'PT',
-        'united_states': 'US', 'united_kingdom': 'GB', 'south_korea': 'KR', 'new_zealand': 'NZ',
-        'saudi_arabia': 'SA', 'united_arab_emirates': 'AE', 'south_africa': 'ZA', 'hong_kong': 'HK',
-        'czech_republic': 'CZ', 'united-states': 'US', 'united-kingdom': 'GB', 'south-korea': 'KR',
-        'new-zealand': 'NZ', 'saudi-arabia': 'SA', 'united-arab-emirates': 'AE', 'south-africa': 'ZA',
-        'hong-kong': 'HK', 'czech-republic': 'CZ', 'unitedstates': 'US', 'unitedkingdom': 'GB',
-        'southkorea': 'KR', 'newzealand': 'NZ', 'saudiarabia': 'SA', 'unitedarabemirates': 'AE',
-        'southafrica': 'ZA', 'hongkong': 'HK', 'czechrepublic': 'CZ',
-      };
-      
       const original = header.trim();
       let clean = original.toLowerCase();
       
-      const suffixes = [' url', ' link', ' page', '_url', '_link', '_page', '-url', '-link', '-page', 'url', 'link', 'page'];
-      
       let withoutSuffix = clean;
-      for (const suffix of suffixes) {
+      for (const suffix of COUNTRY_HEADER_SUFFIXES) {
         if (clean.endsWith(suffix)) {
           withoutSuffix = clean.slice(0, -suffix.length).trim();
           withoutSuffix = withoutSuffix.replace(/[_-]+$/, '');
@@ -11790,40 +12054,27 @@ export function dashboardHtml(csrfToken: string, nonce: string): string {
         }
       }
       
-      if (countryMappings[withoutSuffix]) return countryMappings[withoutSuffix];
+      if (COUNTRY_MAPPINGS_FRONTEND[withoutSuffix]) return COUNTRY_MAPPINGS_FRONTEND[withoutSuffix];
       
       const withUnderscores = withoutSuffix.replace(/\s+/g, '_');
-      if (countryMappings[withUnderscores]) return countryMappings[withUnderscores];
+      if (COUNTRY_MAPPINGS_FRONTEND[withUnderscores]) return COUNTRY_MAPPINGS_FRONTEND[withUnderscores];
       
       const withHyphens = withoutSuffix.replace(/\s+/g, '-');
-      if (countryMappings[withHyphens]) return countryMappings[withHyphens];
+      if (COUNTRY_MAPPINGS_FRONTEND[withHyphens]) return COUNTRY_MAPPINGS_FRONTEND[withHyphens];
       
       const normalized = withoutSuffix.replace(/[\s_-]/g, '');
-      if (countryMappings[normalized]) return countryMappings[normalized];
+      if (COUNTRY_MAPPINGS_FRONTEND[normalized]) return COUNTRY_MAPPINGS_FRONTEND[normalized];
       
       if (withoutSuffix.length === 2) {
         const upperCode = withoutSuffix.toUpperCase();
-        if (countryMappings[withoutSuffix]) return upperCode;
+        if (COUNTRY_MAPPINGS_FRONTEND[withoutSuffix]) return upperCode;
       }
       
       return null;
     }
     
     function getCountryNameFrontend(countryCode) {
-      const names = {
-        'US': 'United States', 'GB': 'United Kingdom', 'CA': 'Canada', 'AU': 'Australia',
-        'DE': 'Germany', 'FR': 'France', 'IT': 'Italy', 'ES': 'Spain', 'JP': 'Japan',
-        'CN': 'China', 'IN': 'India', 'BR': 'Brazil', 'MX': 'Mexico', 'NL': 'Netherlands',
-        'SE': 'Sweden', 'NO': 'Norway', 'DK': 'Denmark', 'FI': 'Finland', 'PL': 'Poland',
-        'RU': 'Russia', 'KR': 'South Korea', 'TR': 'Turkey', 'SA': 'Saudi Arabia',
-        'AE': 'United Arab Emirates', 'IL': 'Israel', 'EG': 'Egypt', 'ZA': 'South Africa',
-        'NZ': 'New Zealand', 'SG': 'Singapore', 'HK': 'Hong Kong', 'MY': 'Malaysia',
-        'TH': 'Thailand', 'ID': 'Indonesia', 'PH': 'Philippines', 'VN': 'Vietnam',
-        'AR': 'Argentina', 'CL': 'Chile', 'CO': 'Colombia', 'VE': 'Venezuela', 'PE': 'Peru',
-        'AT': 'Austria', 'BE': 'Belgium', 'CH': 'Switzerland', 'CZ': 'Czech Republic',
-        'GR': 'Greece', 'IE': 'Ireland', 'PT': 'Portugal',
-      };
-      return names[countryCode] || countryCode;
+      return COUNTRY_NAMES_FRONTEND[countryCode] || countryCode;
     }
     
     // Generate column mapping UI
@@ -12352,7 +12603,7 @@ try {
     method: 'POST',
     headers: {
       'Authorization': 'Bearer ' + token,
-      'X-CSRF-Token': document.querySelector('meta[name="csrf-token"]')?.getAttribute('content') || '',
+      'X-CSRF-Token': apiClient.getCsrfToken(),
     },
     credentials: 'include',
     body: formData,
@@ -12912,9 +13163,9 @@ async function fetchLinkAnalyticsData(linkId) {
       container.appendChild(metricsRow);
       
       if (currentAnalyticsData.summary) {
-        document.getElementById('grid-total-clicks').textContent = (currentAnalyticsData.summary.total_clicks || 0).toLocaleString();
-        document.getElementById('grid-unique-visitors').textContent = (currentAnalyticsData.summary.unique_visitors || 0).toLocaleString();
-        document.getElementById('grid-avg-daily').textContent = (currentAnalyticsData.summary.avg_clicks_per_day || 0).toLocaleString();
+        document.getElementById('grid-total-clicks').textContent = formatCount(currentAnalyticsData.summary.total_clicks || 0);
+        document.getElementById('grid-unique-visitors').textContent = formatCount(currentAnalyticsData.summary.unique_visitors || 0);
+        document.getElementById('grid-avg-daily').textContent = formatCount(currentAnalyticsData.summary.avg_clicks_per_day || 0);
         document.getElementById('grid-last-click').textContent = currentAnalyticsData.summary.last_clicked || '-';
       }
 
@@ -13045,36 +13296,46 @@ function aggregateTimeSeries(timeSeries, breakdown) {
   }
   
   const aggregated = new Map();
-  
+
   for (const point of timeSeries) {
-    const date = new Date(point.date);
     let key;
-    let label;
-    
+
     if (breakdown === 'week') {
-      // Get week start (Monday)
-      const day = date.getDay();
-      const diff = date.getDate() - day + (day === 0 ? -6 : 1); // Adjust when day is Sunday
-      const weekStart = new Date(date);
-      weekStart.setDate(diff);
-      weekStart.setHours(0, 0, 0, 0);
-      key = weekStart.toISOString().slice(0, 10);
-      label = 'Week of ' + weekStart.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+      // Integer day arithmetic instead of two Date allocations per point:
+      // epoch day 0 is a Thursday, so (days + 3) % 7 is days since Monday
+      const parts = point.date.split('-');
+      const days = Math.floor(Date.UTC(+parts[0], parts[1] - 1, +parts[2]) / 86400000);
+      key = days - ((days + 3) % 7);
     } else if (breakdown === 'month') {
-      key = date.toISOString().slice(0, 7); // YYYY-MM
-      label = date.toLocaleDateString('en-US', { month: 'long', year: 'numeric' });
+      // Dates arrive as YYYY-MM-DD, so the month key is a plain prefix -
+      // no Date allocation needed per point
+      key = point.date.slice(0, 7);
     } else {
       key = point.date;
-      label = point.date;
     }
-    
+
     const existing = aggregated.get(key);
     if (existing) {
       existing.clicks += point.clicks || 0;
       existing.unique_visitors += point.unique_visitors || 0;
     } else {
+      // Format the display label once per bucket rather than once per point;
+      // toLocaleDateString is an Intl call and dominated this loop when it
+      // ran for every day in the range
+      let label;
+      let bucketDate = key;
+      if (breakdown === 'week') {
+        // Week keys are integer day numbers; build the Date once per bucket
+        const weekStart = new Date(key * 86400000);
+        bucketDate = weekStart.toISOString().slice(0, 10);
+        label = 'Week of ' + weekStart.toLocaleDateString('en-US', { month: 'short', day: 'numeric', timeZone: 'UTC' });
+      } else if (breakdown === 'month') {
+        label = new Date(key + '-01T00:00:00').toLocaleDateString('en-US', { month: 'long', year: 'numeric' });
+      } else {
+        label = key;
+      }
       aggregated.set(key, {
-        date: key,
+        date: bucketDate,
         label: label,
         clicks: point.clicks || 0,
         unique_visitors: point.unique_visitors || 0
@@ -13093,9 +13354,9 @@ function renderLinkAnalyticsSummary(data) {
   const avgDailyEl = document.getElementById('link-analytics-avg-daily');
   const lastClickEl = document.getElementById('link-analytics-last-click');
 
-  if (totalClicksEl) totalClicksEl.textContent = (data.summary.total_clicks || 0).toLocaleString();
-  if (uniqueVisitorsEl) uniqueVisitorsEl.textContent = (data.summary.unique_visitors || 0).toLocaleString();
-  if (avgDailyEl) avgDailyEl.textContent = (data.summary.avg_clicks_per_day || 0).toLocaleString();
+  if (totalClicksEl) totalClicksEl.textContent = formatCount(data.summary.total_clicks || 0);
+  if (uniqueVisitorsEl) uniqueVisitorsEl.textContent = formatCount(data.summary.unique_visitors || 0);
+  if (avgDailyEl) avgDailyEl.textContent = formatCount(data.summary.avg_clicks_per_day || 0);
   if (lastClickEl) lastClickEl.textContent = data.summary.last_clicked || '-';
 }
 
@@ -13107,17 +13368,18 @@ function renderLinkAnalyticsChart(data, canvasId, breakdown = 'day') {
     return;
   }
   
-  // Destroy existing chart if it exists
-  if (ctx.chart) {
-    ctx.chart.destroy();
-  }
-  
   // Aggregate data based on breakdown (same as overview chart)
   const aggregated = aggregateTimeSeries(timeSeries, breakdown);
   
-  const labels = aggregated.map(d => d.label || d.date);
-  const clicksData = aggregated.map(d => d.clicks || 0);
-  const visitorsData = aggregated.map(d => d.unique_visitors || 0);
+  // Extract all three series in one pass instead of three maps
+  const labels = [];
+  const clicksData = [];
+  const visitorsData = [];
+  for (const d of aggregated) {
+    labels.push(d.label || d.date);
+    clicksData.push(d.clicks || 0);
+    visitorsData.push(d.unique_visitors || 0);
+  }
   
   // Show canvas if it was hidden
   ctx.style.display = 'block';
@@ -13138,10 +13400,27 @@ function renderLinkAnalyticsChart(data, canvasId, breakdown = 'day') {
       chartContainer.appendChild(noDataMsg);
       ctx.style.display = 'none';
     }
+    // Drop a previously rendered chart so it is not left behind the message
+    if (ctx.chart) {
+      ctx.chart.destroy();
+      ctx.chart = null;
+    }
     return;
   }
-  
-  linkAnalyticsChart = new Chart(ctx, {
+
+  // Reuse the existing chart instance when the canvas survives the render:
+  // swapping the data and calling update() only redraws, while destroy +
+  // new Chart re-runs full initialization and layout
+  if (ctx.chart) {
+    ctx.chart.data.labels = labels;
+    ctx.chart.data.datasets[0].data = clicksData;
+    ctx.chart.data.datasets[1].data = visitorsData;
+    ctx.chart.update();
+    linkAnalyticsChart = ctx.chart;
+    return;
+  }
+
+  linkAnalyticsChart = ctx.chart = new Chart(ctx, {
     type: 'line',
     data: {
       labels: labels,
@@ -13246,8 +13525,8 @@ function renderLinkAnalyticsGeo(container, data) {
     return [
       item.country || 'Unknown',
       item.city || '-',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Geographic Breakdown', ['Country', 'City', 'Clicks', 'Unique Visitors'], rows);
@@ -13286,6 +13565,7 @@ function renderLinkAnalyticsDevices(container, data) {
     // DEBUG: console.log('[RENDER DEVICES] Chart data:', { labels: labels, values: dataValues });
     
     try {
+      destroyDetachedCharts();
       new Chart(canvas, {
         type: 'pie',
         data: {
@@ -13317,8 +13597,8 @@ function renderLinkAnalyticsDevices(container, data) {
   const typeRows = deviceTypes.map(function(item) {
     return [
       item.device_type || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Device Types Details', ['Device Type', 'Clicks', 'Unique Visitors'], typeRows);
@@ -13327,8 +13607,8 @@ function renderLinkAnalyticsDevices(container, data) {
   const browserRows = (devices.browsers || []).map(function(item) {
     return [
       item.browser || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Browsers', ['Browser', 'Clicks', 'Unique Visitors'], browserRows);
@@ -13337,8 +13617,8 @@ function renderLinkAnalyticsDevices(container, data) {
   const osRows = (devices.os || []).map(function(item) {
     return [
       item.os || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Operating Systems', ['OS', 'Clicks', 'Unique Visitors'], osRows);
@@ -13350,8 +13630,8 @@ function renderLinkAnalyticsReferrers(container, data) {
     return [
       item.referrer_domain || 'Direct / None',
       item.category || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Top Referrers', ['Domain', 'Category', 'Clicks', 'Unique Visitors'], rows);
@@ -13364,8 +13644,8 @@ function renderLinkAnalyticsUTM(container, data) {
   const sourceRows = (utm.sources || []).map(function(item) {
     return [
       item.utm_source || 'None',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'UTM Sources', ['Source', 'Clicks', 'Unique Visitors'], sourceRows);
@@ -13374,8 +13654,8 @@ function renderLinkAnalyticsUTM(container, data) {
   const mediumRows = (utm.mediums || []).map(function(item) {
     return [
       item.utm_medium || 'None',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'UTM Mediums', ['Medium', 'Clicks', 'Unique Visitors'], mediumRows);
@@ -13384,8 +13664,8 @@ function renderLinkAnalyticsUTM(container, data) {
   const campaignRows = (utm.campaigns || []).map(function(item) {
     return [
       item.utm_campaign || 'None',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'UTM Campaigns', ['Campaign', 'Clicks', 'Unique Visitors'], campaignRows);
@@ -13397,8 +13677,8 @@ function renderLinkAnalyticsBrowsers(container, data) {
   const browserRows = (devices.browsers || []).map(function(item) {
     return [
       item.browser || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Browser Distribution', ['Browser', 'Clicks', 'Unique Visitors'], browserRows);
@@ -13430,6 +13710,7 @@ function renderLinkAnalyticsOS(container, data) {
     const dataValues = osData.map(function(item) { return item.clicks; });
     const colors = ['#4f46e5', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#ec4899', '#14b8a6', '#f97316'];
     
+    destroyDetachedCharts();
     new Chart(canvas, {
       type: 'pie',
       data: {
@@ -13455,8 +13736,8 @@ function renderLinkAnalyticsOS(container, data) {
   const osRows = osData.map(function(item) {
     return [
       item.os || 'Unknown',
-      item.clicks.toLocaleString(),
-      item.unique_visitors.toLocaleString()
+      formatCount(item.clicks),
+      formatCount(item.unique_visitors)
     ];
   });
   renderTable(container, 'Operating Systems Details', ['OS', 'Clicks', 'Unique Visitors'], osRows);
@@ -13478,6 +13759,7 @@ function renderDeviceDonut(data, canvasId) {
   const labels = types.map(d => d.device_type || 'Unknown');
   const values = types.map(d => d.clicks);
   
+  destroyDetachedCharts();
   new Chart(ctx, {
     type: 'doughnut',
     data: {
@@ -13508,6 +13790,7 @@ function renderOSDonut(data, canvasId) {
   const labels = topOS.map(d => d.os || 'Unknown');
   const values = topOS.map(d => d.clicks);
   
+  destroyDetachedCharts();
   new Chart(ctx, {
     type: 'doughnut',
     data: {
@@ -13560,7 +13843,7 @@ function renderTopLocations(data, containerId) {
         (item.country || 'Unknown'),
         (item.city ? '<span style="color:var(--secondary-color);font-size:0.8em">(' + item.city + ')</span>' : ''),
       '</span>',
-      '<span class="list-item-value">' + item.clicks.toLocaleString() + '</span>',
+      '<span class="list-item-value">' + formatCount(item.clicks) + '</span>',
     '</div>'
   ].join('')).join('');
   
@@ -13581,7 +13864,7 @@ function renderTopReferrers(data, containerId) {
   const html = topRefs.map(item => [
     '<div class="list-item">',
       '<span class="list-item-label">' + (item.referer || 'Direct / None') + '</span>',
-      '<span class="list-item-value">' + item.clicks.toLocaleString() + '</span>',
+      '<span class="list-item-value">' + formatCount(item.clicks) + '</span>',
     '</div>'
   ].join('')).join('');
   
@@ -13602,7 +13885,7 @@ function renderTopUTM(data, containerId) {
   const html = topCampaigns.map(item => [
     '<div class="list-item">',
       '<span class="list-item-label">' + (item.utm_campaign || '(not set)') + '</span>',
-      '<span class="list-item-value">' + item.clicks.toLocaleString() + '</span>',
+      '<span class="list-item-value">' + formatCount(item.clicks) + '</span>',
     '</div>'
   ].join('')).join('');
   
@@ -13677,8 +13960,8 @@ renderLinkAnalyticsGeo = function (container, data) {
   const rows = data.geography.map(item => [
     item.country || 'Unknown',
     item.city || '-',
-    item.clicks.toLocaleString(),
-    item.unique_visitors.toLocaleString()
+    formatCount(item.clicks),
+    formatCount(item.unique_visitors)
   ]);
   renderPaginatedTable(container, 'Geographic Data', ['Country', 'City', 'Clicks', 'Unique Visitors'], rows, 'geo_table');
 };
@@ -13691,8 +13974,8 @@ renderLinkAnalyticsReferrers = function (container, data) {
   }
   const rows = data.referrers.map(item => [
     item.referer || 'Direct / None',
-    item.clicks.toLocaleString(),
-    item.unique_visitors.toLocaleString()
+    formatCount(item.clicks),
+    formatCount(item.unique_visitors)
   ]);
   renderPaginatedTable(container, 'Referrer Data', ['Referrer', 'Clicks', 'Unique Visitors'], rows, 'ref_table');
 };
@@ -13710,7 +13993,7 @@ renderLinkAnalyticsUTM = function (container, data) {
     item.utm_campaign || '(not set)',
     item.source || '-',
     item.medium || '-',
-    item.clicks.toLocaleString()
+    formatCount(item.clicks)
   ]);
   renderPaginatedTable(container, 'UTM Campaigns', ['Campaign', 'Source', 'Medium', 'Clicks'], rows, 'utm_table');
 };
@@ -13947,4 +14230,3 @@ function downloadCsv(filename, headers, rows) {
 </script>
   </body>
   </html>`;
-}
@@ -5,10 +5,17 @@ class ApiClient {
   constructor() {
     this.isRefreshing = false;
     this.refreshPromise = null;
+    // The CSRF meta tag is rendered once with the page and never changes, so
+    // resolve the selector a single time instead of re-walking the DOM on
+    // every request
+    this.csrfToken = null;
   }
 
   getCsrfToken() {
-    return document.querySelector('meta[name="csrf-token"]')?.getAttribute('content') || '';
+    if (this.csrfToken === null) {
+      this.csrfToken = document.querySelector('meta[name="csrf-token"]')?.getAttribute('content') || '';
+    }
+    return this.csrfToken;
   }
 
   getAuthToken() {